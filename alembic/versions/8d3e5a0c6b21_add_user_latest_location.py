@@ -0,0 +1,44 @@
+"""Add latest_location_id to user
+
+Revision ID: 8d3e5a0c6b21
+Revises: f4b2d8a91c37
+Create Date: 2026-10-17 18:02:41.530172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3e5a0c6b21'
+down_revision: Union[str, None] = 'f4b2d8a91c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('latest_location_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('user_latest_location_id_fkey', 'user', 'location', ['latest_location_id'], ['id'], ondelete='SET NULL')
+    op.create_index('idx_user_current_location_user_id_location_id', 'user_current_location_association', ['user_id', 'location_id'], unique=False)
+
+    # 위치 기록은 매번 새 위치 행을 만들어 추가하므로 사용자별로 가장 큰 location_id가 마지막 위치
+    op.execute(
+        """
+        UPDATE "user"
+        SET latest_location_id = latest.location_id
+        FROM (
+            SELECT user_id, max(location_id) AS location_id
+            FROM user_current_location_association
+            GROUP BY user_id
+        ) AS latest
+        WHERE "user".id = latest.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_current_location_user_id_location_id', table_name='user_current_location_association')
+    op.drop_constraint('user_latest_location_id_fkey', 'user', type_='foreignkey')
+    op.drop_column('user', 'latest_location_id')
@@ -0,0 +1,61 @@
+"""Aggregate UserSearchHistory by user and address
+
+Revision ID: f4b2d8a91c37
+Revises: c3a1f27b9d4e
+Create Date: 2026-10-17 16:48:09.215830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b2d8a91c37'
+down_revision: Union[str, None] = 'c3a1f27b9d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# NOTE: normalize_address와 같게 앞뒤 공백 제거, 연속 공백 합치기, 소문자 변환 (NFKC 정규화는 제외)
+NORMALIZED_ADDRESS = "lower(regexp_replace(btrim(address), '\\s+', ' ', 'g'))"
+
+
+def upgrade() -> None:
+    op.add_column('usersearchhistory', sa.Column('hit_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('usersearchhistory', sa.Column('last_searched_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+
+    # 사용자와 정규화한 주소별로 가장 먼저 생긴 행에 검색 횟수와 마지막 검색 시각을 모으고 나머지 행은 삭제
+    op.execute(
+        f"""
+        UPDATE usersearchhistory AS history
+        SET address = aggregated.address,
+            hit_count = aggregated.hit_count,
+            last_searched_at = aggregated.last_searched_at
+        FROM (
+            SELECT min(id) AS id,
+                   {NORMALIZED_ADDRESS} AS address,
+                   count(*) AS hit_count,
+                   coalesce(max(created_at), now()) AS last_searched_at
+            FROM usersearchhistory
+            GROUP BY user_id, {NORMALIZED_ADDRESS}
+        ) AS aggregated
+        WHERE history.id = aggregated.id
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM usersearchhistory
+        WHERE id NOT IN (
+            SELECT min(id) FROM usersearchhistory GROUP BY user_id, {NORMALIZED_ADDRESS}
+        )
+        """
+    )
+
+    op.create_unique_constraint('usersearchhistory_user_id_address_key', 'usersearchhistory', ['user_id', 'address'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('usersearchhistory_user_id_address_key', 'usersearchhistory', type_='unique')
+    op.drop_column('usersearchhistory', 'last_searched_at')
+    op.drop_column('usersearchhistory', 'hit_count')
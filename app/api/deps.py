@@ -5,6 +5,7 @@ from fastapi.security import OAuth2PasswordBearer
 
 from app.core.config import get_app_settings
 from app.db.session import SessionLocal
+from app.services.map_client_services import map_client_registry
 from app.services.map_services import MapServices, MapServicesFactory
 from app.services.redis_services import RedisServicesFactory
 
@@ -31,4 +32,4 @@ def get_redis_services() -> Generator:
 
 
 def get_map_services() -> MapServices:
-    return MapServicesFactory.create_map_services()
+    return MapServicesFactory.create_map_services(client_registry=map_client_registry)
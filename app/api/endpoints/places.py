@@ -12,7 +12,7 @@ from app.schemas.location import LocationBase
 from app.schemas.msg import Msg
 from app.schemas.place import AutoCompletedPlace, Place
 from app.services import user_service
-from app.services.constants import AGGREGATED_ATTR, PLACETYPE, TravelMode
+from app.services.constants import AGGREGATED_ATTR, AGGREGATION, PLACETYPE, TravelMode
 from app.services.map_services import MapServices, ZeroResultException
 from app.services.recommend_services import Recommender
 
@@ -27,6 +27,7 @@ def recommend_places_based_on_requested_address(
     place_type: PLACETYPE = PLACETYPE.CAFE,
     max_results: int = 5,
     filter_condition: AGGREGATED_ATTR = AGGREGATED_ATTR.DISTANCE,
+    filter_aggregation: AGGREGATION = AGGREGATION.SUM,
     current_user: models.User = Depends(user_service.get_current_active_user),
     db: Session = Depends(get_db),
     map_services: MapServices = Depends(get_map_services),
@@ -43,6 +44,7 @@ def recommend_places_based_on_requested_address(
                 place_type=place_type,
                 return_count=max_results,
                 filter_condition=filter_condition,
+                filter_aggregation=filter_aggregation,
             ),
         )
         complete_addresses = map_services.get_complete_addresses(
@@ -72,6 +74,7 @@ def recommend_places_based_on_current_location(
     place_type: PLACETYPE = PLACETYPE.CAFE,
     max_results: int = 5,
     filter_condition: AGGREGATED_ATTR = AGGREGATED_ATTR.DISTANCE,
+    filter_aggregation: AGGREGATION = AGGREGATION.SUM,
     current_user: models.User = Depends(user_service.get_current_active_user),
     db: Session = Depends(get_db),
     map_services: MapServices = Depends(get_map_services),
@@ -91,6 +94,7 @@ def recommend_places_based_on_current_location(
                 place_type=place_type,
                 return_count=max_results,
                 filter_condition=filter_condition,
+                filter_aggregation=filter_aggregation,
             ),
         )
 
@@ -197,12 +201,16 @@ def read_auto_completed_places(
     address: str,
     latitude: Optional[float] = Query(None),
     longitude: Optional[float] = Query(None),
+    session_token: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(user_service.get_current_active_user),
     map_services: MapServices = Depends(get_map_services),
 ):
     """
     retrieve some auto completed places
+
+    session_token: send the same token until a place is selected,
+    so that the requests are billed per session.
     """
     try:
         location = (
@@ -212,7 +220,7 @@ def read_auto_completed_places(
         )
 
         places = map_services.get_auto_completed_place(
-            db, current_user, address, location
+            db, current_user, address, location, session_token=session_token
         )
 
         return places
@@ -0,0 +1,70 @@
+from http import HTTPStatus
+from typing import Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app import models
+from app.schemas.stats import (
+    CacheMemoryStat,
+    CacheStat,
+    ConnectionReuseStat,
+    RedisCircuitStat,
+)
+from app.services import user_service
+from app.services.cache_stats import snapshot_cache_stats
+from app.services.local_cache_services import local_cache_registry
+from app.services.map_client_services import map_client_registry
+from app.services.redis_services import (
+    RedisOperationError,
+    RedisServicesFactory,
+    redis_circuit_breaker,
+)
+
+router = APIRouter()
+
+
+@router.get("/map-clients", response_model=Dict[str, ConnectionReuseStat])
+def read_map_client_stats(
+    current_user: models.User = Depends(user_service.get_current_active_superuser),
+):
+    """
+    Retrieve connection reuse stats per Google Maps endpoint.
+    """
+    return map_client_registry.stats.snapshot()
+
+
+@router.get("/caches", response_model=Dict[str, CacheStat])
+def read_cache_stats(
+    current_user: models.User = Depends(user_service.get_current_active_superuser),
+):
+    """
+    Retrieve hit/miss counters per cache.
+    """
+    return snapshot_cache_stats()
+
+
+@router.get("/caches/memory", response_model=Dict[str, CacheMemoryStat])
+def read_cache_memory_stats(
+    current_user: models.User = Depends(user_service.get_current_active_superuser),
+):
+    """
+    Retrieve entry counts and memory usage per cache tier.
+    """
+    try:
+        redis_memory = RedisServicesFactory.create_redis_services().memory_snapshot()
+    except RedisOperationError as error:
+        raise HTTPException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=str(error)
+        )
+
+    return {**local_cache_registry.memory_snapshot(), "l2:redis": redis_memory}
+
+
+@router.get("/redis-circuit", response_model=RedisCircuitStat)
+def read_redis_circuit_stats(
+    current_user: models.User = Depends(user_service.get_current_active_superuser),
+):
+    """
+    Retrieve the Redis circuit breaker state.
+    """
+    return redis_circuit_breaker.snapshot()
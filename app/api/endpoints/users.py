@@ -92,6 +92,19 @@ def read_user_me(
     return current_user
 
 
+@router.get("/me/locations", response_model=List[schemas.Location])
+def read_user_me_location_history(
+    db: Session = Depends(deps.get_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: models.User = Depends(user_service.get_current_active_user),
+) -> Any:
+    """
+    Get own location history, newest first.
+    """
+    return crud.user.get_location_history(db, current_user, skip=skip, limit=limit)
+
+
 @router.post("/register", response_model=schemas.User)
 def register_user(
     *,
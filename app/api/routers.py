@@ -3,7 +3,7 @@ from fastapi import APIRouter
 from app.core.config import get_app_settings
 from app.core.settings.base import AppEnvTypes
 
-from .endpoints import login, places, users
+from .endpoints import login, places, stats, users
 
 settings = get_app_settings()
 
@@ -12,6 +12,7 @@ api_router.include_router(places.router, prefix="/places", tags=["places"])
 api_router.include_router(login.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["user"])
 api_router.include_router(users.admin_router, prefix="/admin", tags=["admin"])
+api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
 if settings.APP_ENV == AppEnvTypes.dev:
     from .endpoints import goolge_maps_api_test as api_test
 
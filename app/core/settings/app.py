@@ -62,6 +62,10 @@ class AppSettings(BaseAppSettings):
     REDIS_HOST: str = Field("localhost", env="REDIS_HOST")
     REDIS_PORT: int = Field(6378, env="REDIS_PORT")
     REDIS_PASSWORD: Optional[str] = "DO_NOT_USE_THIS_PASSWORD_IN_PRODUCTION"
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    # 연속 연결 실패가 이 횟수에 이르면 Redis를 건너뛰고, 주기(초)마다 복구를 확인
+    REDIS_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    REDIS_CIRCUIT_RECOVERY_INTERVAL: float = 5.0
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -119,6 +123,44 @@ class AppSettings(BaseAppSettings):
 
     GOOGLE_MAPS_BASE_URL: str = "https://maps.googleapis.com/maps/api/geocode/json"
 
+    # 여러 주소를 동시에 geocode/autocomplete 할 때 한 번에 보내는 최대 요청 수
+    GOOGLE_MAPS_MAX_CONCURRENCY: int = 8
+    GOOGLE_MAPS_TIMEOUT: float = 10.0
+    # 워커마다 재사용하는 Google Maps 커넥션 풀 크기와 유휴 커넥션 유지 시간(초)
+    GOOGLE_MAPS_POOL_SIZE: int = 10
+    GOOGLE_MAPS_KEEPALIVE_EXPIRY: float = 60.0
+    # 유휴 TCP 연결에 첫 keep-alive probe를 보내기까지의 시간(초)
+    GOOGLE_MAPS_TCP_KEEPALIVE_IDLE: int = 30
+
+    # 만료된 geolocations 멤버를 정리하는 주기(초)
+    GEOLOCATION_SWEEP_INTERVAL: float = 60.0
+
+    # 앱 시작 시 DB에서 Redis로 미리 채우는 조회 횟수 상위 주소 수. 0이면 사용하지 않음
+    GEOCODE_WARMUP_COUNT: int = 1000
+    # 요청 중에 모은 주소별 조회 횟수를 DB에 반영하는 주기(초)
+    GEOCODE_HIT_FLUSH_INTERVAL: float = 60.0
+
+    # 같은 키의 Google Maps 호출을 하나로 합칠 때 lease 유지 시간과 다른 요청의 결과를 기다리는 시간(초)
+    SINGLE_FLIGHT_LEASE_TTL: float = 15.0
+    SINGLE_FLIGHT_WAIT_TIMEOUT: float = 15.0
+    SINGLE_FLIGHT_POLL_INTERVAL: float = 0.05
+
+    # 소프트 TTL이 지난 주변 장소 캐시를 바로 응답하고 백그라운드에서 갱신할지 여부와 갱신 스레드 수
+    STALE_WHILE_REVALIDATE: bool = True
+    CACHE_REFRESH_WORKERS: int = 2
+
+    # 검색 기록을 보관하는 기간(일)과 오래된 검색 기록을 정리하는 주기(초)
+    SEARCH_HISTORY_RETENTION_DAYS: int = 180
+    SEARCH_HISTORY_COMPACTION_INTERVAL: float = 3600.0
+
+    # 결과가 없거나 잘못된 입력으로 실패한 Google Maps 요청을 기억하는 시간(초). 0이면 사용하지 않음
+    NEGATIVE_CACHE_TTL: int = 300
+
+    # 워커마다 Redis 앞에 두는 L1 캐시. 0이면 사용하지 않음
+    LOCAL_CACHE_MAX_ENTRIES: int = 10000
+    LOCAL_CACHE_TTL: float = 30.0
+    LOCAL_CACHE_INVALIDATION_CHANNEL: str = "cache-invalidation"
+
     class Config:
         case_sensitive = True
 
@@ -19,5 +19,11 @@ class TestAppSettings(AppSettings):
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6378
 
+    # NOTE: 테스트마다 Redis를 비우므로 L1 캐시는 끔
+    LOCAL_CACHE_MAX_ENTRIES: int = 0
+    GEOCODE_WARMUP_COUNT: int = 0
+    # NOTE: 테스트마다 같은 입력에 다른 응답을 모킹하므로 실패 결과를 기억하지 않음
+    NEGATIVE_CACHE_TTL: int = 0
+
 
 settings = TestAppSettings()
@@ -1,3 +1,4 @@
+from .crud_geocode import geocode
 from .crud_google_maps_api_log import google_maps_api_log
 from .crud_location import location
 from .crud_place import place
@@ -0,0 +1,124 @@
+from typing import Dict, List, Union
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_app_settings
+from app.core.settings.base import AppEnvTypes
+from app.crud.base import CRUDBase
+from app.models.geocode import Geocode
+from app.schemas.geocode import GeocodeCreate, GeocodeUpdate
+from app.utils import normalize_address
+
+app_settings = get_app_settings()
+
+
+class CRUDGeocode(CRUDBase[Geocode, GeocodeCreate, GeocodeUpdate]):
+    def get_by_addresses(self, db: Session, *, addresses: List[str]) -> List[Geocode]:
+        normalized_addresses = list(
+            {normalize_address(address) for address in addresses}
+        )
+        if not normalized_addresses:
+            return []
+
+        return db.query(Geocode).filter(Geocode.address.in_(normalized_addresses)).all()
+
+    def add_hits(self, db: Session, *, hits: Dict[str, int]) -> None:
+        """
+        정규화한 주소별 조회 횟수를 한 번의 executemany UPDATE로 더합니다.
+        """
+        if not hits:
+            return
+
+        # NOTE: 여러 워커가 동시에 반영해도 교착되지 않도록 같은 순서로 행을 잠금
+        db.connection().execute(
+            update(Geocode.__table__)
+            .where(Geocode.__table__.c.address == bindparam("_address"))
+            .values(hit_count=Geocode.__table__.c.hit_count + bindparam("_count")),
+            [
+                {"_address": address, "_count": count}
+                for address, count in sorted(hits.items())
+            ],
+        )
+        db.commit()
+
+    def upsert(self, db: Session, *, obj_in: GeocodeCreate) -> None:
+        address = normalize_address(obj_in.address)
+        db.execute(
+            insert(Geocode)
+            .values(
+                address=address,
+                latitude=obj_in.latitude,
+                longitude=obj_in.longitude,
+                hit_count=1,
+            )
+            .on_conflict_do_update(
+                index_elements=[Geocode.address],
+                set_={"latitude": obj_in.latitude, "longitude": obj_in.longitude},
+            )
+        )
+        db.commit()
+
+    def get_most_hit(self, db: Session, *, limit: int) -> List[Geocode]:
+        return (
+            db.query(Geocode)
+            .order_by(Geocode.hit_count.desc(), Geocode.id)
+            .limit(limit)
+            .all()
+        )
+
+
+class MemoryCRUDGeocode(CRUDBase[Geocode, GeocodeCreate, GeocodeUpdate]):
+    def __init__(self):
+        self._geocodes: Dict[str, Geocode] = {}
+
+    @property
+    def geocodes(self):
+        return self._geocodes
+
+    @geocodes.setter
+    def geocodes(self, value):
+        self._geocodes = value
+
+    def get_by_addresses(self, db: Session, *, addresses: List[str]) -> List[Geocode]:
+        return [
+            self._geocodes[address]
+            for address in {normalize_address(address) for address in addresses}
+            if address in self._geocodes
+        ]
+
+    def add_hits(self, db: Session, *, hits: Dict[str, int]) -> None:
+        for address, count in hits.items():
+            if address in self._geocodes:
+                self._geocodes[address].hit_count += count
+
+    def upsert(self, db: Session, *, obj_in: GeocodeCreate) -> None:
+        address = normalize_address(obj_in.address)
+        hit_count = (
+            self._geocodes[address].hit_count if address in self._geocodes else 1
+        )
+        self._geocodes[address] = Geocode(
+            address=address,
+            latitude=obj_in.latitude,
+            longitude=obj_in.longitude,
+            hit_count=hit_count,
+        )
+
+    def get_most_hit(self, db: Session, *, limit: int) -> List[Geocode]:
+        return sorted(
+            self._geocodes.values(), key=lambda geocode: geocode.hit_count, reverse=True
+        )[:limit]
+
+
+class CRUDGeocodeFactory:
+    @staticmethod
+    def get_instance(
+        env: str, use_memory: bool = True
+    ) -> Union[CRUDGeocode, MemoryCRUDGeocode]:
+        if env == AppEnvTypes.test and use_memory:
+            return MemoryCRUDGeocode()
+        return CRUDGeocode(Geocode)
+
+
+geocode = CRUDGeocodeFactory.get_instance(app_settings.APP_ENV)
@@ -31,6 +31,9 @@ class CRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
         ]
         return db.query(Location).filter(or_(*or_conditions)).all()
 
+    def get_by_ids(self, db: Session, ids: List[int]) -> List[Location]:
+        return db.query(Location).filter(Location.id.in_(ids)).all()
+
     def get_by_plus_code(
         self, db: Session, *, global_code: str, compound_code: str
     ) -> Optional[Location]:
@@ -72,6 +75,13 @@ class MemoryCRUDLocation(CRUDBase[Location, LocationCreate, LocationUpdate]):
             if (location.latitude, location.longitude) in latlng_list
         ]
 
+    def get_by_ids(self, db: Session, ids: List[int]) -> List[Location]:
+        return [
+            location
+            for location in self._locations
+            if getattr(location, "id", None) in ids
+        ]
+
     @property
     def list(self):
         return list(self.locations)
@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional, Union
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import get_app_settings
 from app.core.settings.base import AppEnvTypes
@@ -14,11 +14,19 @@ app_settings = get_app_settings()
 
 
 class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
+    def _query(self, db: Session):
+        # NOTE: 응답 스키마와 추천 점수 계산에서 place_types를 항상 읽으므로
+        # 장소마다 지연 로딩하지 않고 IN 쿼리 한 번으로 함께 불러옴
+        return db.query(Place).options(selectinload(Place.place_types))
+
     def get_by_place_id(self, db: Session, *, id: str) -> Optional[Place]:
-        return db.query(Place).filter(Place.place_id == id).first()
+        return self._query(db).filter(Place.place_id == id).first()
 
     def get_by_place_ids(self, db: Session, place_ids: List[int]) -> List[Place]:
-        return db.query(Place).filter(Place.place_id.in_(place_ids)).all()
+        return self._query(db).filter(Place.place_id.in_(place_ids)).all()
+
+    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Place]:
+        return self._query(db).offset(skip).limit(limit).all()
 
     def convert_strings_to_place_types(
         self, db: Session, place_types: List[str]
@@ -114,6 +122,12 @@ class CRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
             update_data["place_types"] = existing_types + new_types
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
+    def update_address(self, db: Session, *, place_id: str, address: str) -> None:
+        db.query(Place).filter(Place.place_id == place_id).update(
+            {Place.address: address}
+        )
+        db.commit()
+
     def bulk_insert(self, db, place_list: List[dict]):
         combined_types_dict = self.process_place_types(db, place_list)
 
@@ -156,6 +170,11 @@ class MemoryCRUDPlace(CRUDBase[Place, PlaceCreate, PlaceUpdate]):
 
         return obj_in
 
+    def update_address(self, db=None, *, place_id: str, address: str) -> None:
+        place = self.get_by_place_id(db, id=place_id)
+        if place:
+            place.address = address
+
     @property
     def list(self):
         return list(self._places)
@@ -1,14 +1,22 @@
-from typing import Any, Dict, Optional, Union
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.security import get_password_hash, verify_password
 from app.crud.base import CRUDBase
-from app.models.associations import UserSearchHistory
+from app.models.associations import (
+    UserSearchHistory,
+    user_current_location_association,
+)
 from app.models.location import Location
 from app.models.place import Place
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils import normalize_address
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -48,6 +56,22 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             return None
         return user
 
+    def load_profile(self, db: Session, user: User) -> User:
+        """
+        추천 점수 계산에서 읽는 관심 장소와 장소 유형, 검색 기록을
+        관계마다 IN 쿼리 한 번씩으로 미리 불러옵니다.
+        """
+        # NOTE: 이미 세션에 있는 user라도 아직 읽지 않은 관계는 이 쿼리로 채워짐
+        return (
+            db.query(User)
+            .options(
+                selectinload(User.interested_places).selectinload(Place.place_types),
+                selectinload(User.search_history_relations),
+            )
+            .filter(User.id == user.id)
+            .one()
+        )
+
     def is_active(self, user: User) -> bool:
         return user.is_active
 
@@ -69,16 +93,100 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def has_interest(self, db: Session, user: User, place: Place) -> bool:
         return place in user.interested_places
 
-    def add_search_history(self, db: Session, user: User, address: str):
-        search_history = UserSearchHistory(user=user, address=address)
-        user.search_history_relations.append(search_history)
-        db.add(user)
+    def add_search_history(
+        self, db: Session, user: User, addresses: Union[str, List[str]]
+    ):
+        """
+        정규화한 주소별로 검색 횟수를 올리고 마지막 검색 시각을 갱신합니다.
+        """
+        hit_counts = Counter(
+            normalize_address(address)
+            for address in ([addresses] if isinstance(addresses, str) else addresses)
+        )
+        if not hit_counts:
+            return
+
+        statement = insert(UserSearchHistory).values(
+            [
+                {"user_id": user.id, "address": address, "hit_count": hit_count}
+                for address, hit_count in hit_counts.items()
+            ]
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[UserSearchHistory.user_id, UserSearchHistory.address],
+                set_={
+                    "hit_count": UserSearchHistory.hit_count
+                    + statement.excluded.hit_count,
+                    "last_searched_at": func.now(),
+                },
+            )
+        )
         db.commit()
 
+    def compact_search_histories(
+        self, db: Session, *, searched_after: datetime, max_per_user: int
+    ) -> int:
+        """
+        searched_after 이전에 마지막으로 검색한 기록과 사용자별로 최근 max_per_user개를
+        넘는 기록을 지우고 지운 행 수를 반환합니다.
+        """
+        ranked = select(
+            UserSearchHistory.id,
+            func.row_number()
+            .over(
+                partition_by=UserSearchHistory.user_id,
+                order_by=UserSearchHistory.last_searched_at.desc(),
+            )
+            .label("rank"),
+        ).subquery()
+        result = db.execute(
+            delete(UserSearchHistory)
+            .where(
+                or_(
+                    UserSearchHistory.last_searched_at < searched_after,
+                    UserSearchHistory.id.in_(
+                        select(ranked.c.id).where(ranked.c.rank > max_per_user)
+                    ),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
     def add_location_history(self, db: Session, user: User, lat, lng):
-        user.location_history.append(Location(latitude=lat, longitude=lng))
+        location = Location(latitude=lat, longitude=lng)
+        # NOTE: append는 위치 기록 전체를 불러오므로 연관 테이블에 직접 추가
+        db.add(location)
+        db.flush()
+        db.execute(
+            user_current_location_association.insert().values(
+                user_id=user.id, location_id=location.id
+            )
+        )
+        user.latest_location = location
         db.add(user)
         db.commit()
 
+    def get_location_history(
+        self, db: Session, user: User, *, skip: int = 0, limit: int = 100
+    ) -> List[Location]:
+        """
+        위치 기록을 최신순으로 skip개 건너뛰고 limit개 반환합니다.
+        """
+        return (
+            db.query(Location)
+            .join(
+                user_current_location_association,
+                user_current_location_association.c.location_id == Location.id,
+            )
+            .filter(user_current_location_association.c.user_id == user.id)
+            .order_by(Location.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
 
 user = CRUDUser(User)
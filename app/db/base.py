@@ -1,4 +1,5 @@
 from app.db.base_class import Base
+from app.models.geocode import Geocode
 from app.models.google_maps_api_log import GoogleMapsApiLog
 from app.models.location import Location
 from app.models.place import Place
@@ -1,4 +1,5 @@
 from .associations import place_type_association, user_interested_place_association
+from .geocode import Geocode
 from .google_maps_api_log import GoogleMapsApiLog
 from .location import Location
 from .place import Place
@@ -1,4 +1,14 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Table
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -22,9 +32,21 @@ place_type_association = Table(
 
 
 class UserSearchHistory(Base):
+    """
+    사용자와 정규화한 주소마다 한 행에 검색 횟수와 마지막 검색 시각을 모아 둡니다.
+    """
+
+    __table_args__ = (UniqueConstraint("user_id", "address"),)
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"))
+    # NOTE: normalize_address로 정규화한 주소
     address = Column(String(255), nullable=False)
+    hit_count = Column(Integer, nullable=False, default=1, server_default="1")
+    # pylint:disable= not-callable
+    last_searched_at = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
 
     user = relationship("User", back_populates="search_history_relations")
 
@@ -34,4 +56,6 @@ user_current_location_association = Table(
     Base.metadata,
     Column("user_id", Integer, ForeignKey("user.id", ondelete="CASCADE")),
     Column("location_id", Integer, ForeignKey("location.id", ondelete="CASCADE")),
+    # NOTE: 위치 기록을 최신순으로 페이지 단위로 읽을 때 사용
+    Index("idx_user_current_location_user_id_location_id", "user_id", "location_id"),
 )
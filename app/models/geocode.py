@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Float, Integer, String
+
+from app.db.base_class import Base
+
+
+class Geocode(Base):
+    id = Column(Integer, primary_key=True, index=True)
+    # NOTE: normalize_address로 정규화한 주소
+    address = Column(String, nullable=False, unique=True, index=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0, server_default="0")
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -19,16 +19,25 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean(), default=True)
     is_superuser = Column(Boolean(), default=False)
+    # NOTE: 위치 기록 전체를 읽지 않도록 마지막 위치를 따로 가리킴
+    latest_location_id = Column(
+        Integer, ForeignKey("location.id", ondelete="SET NULL"), nullable=True
+    )
 
     google_maps_api_logs = relationship("GoogleMapsApiLog", back_populates="user")
     interested_places = relationship(
         "Place", secondary=user_interested_place_association, back_populates="users"
     )
-    search_history_relations = relationship("UserSearchHistory", back_populates="user")
+    search_history_relations = relationship(
+        "UserSearchHistory",
+        back_populates="user",
+        order_by="desc(UserSearchHistory.last_searched_at)",
+    )
 
     location_history = relationship(
         "Location", secondary=user_current_location_association, back_populates="users"
     )
+    latest_location = relationship("Location", foreign_keys=[latest_location_id])
 
     @property
     def preferred_types(self):
@@ -41,7 +50,3 @@ class User(Base):
     @property
     def searched_addresses(self):
         return [relation.address for relation in self.search_history_relations]
-
-    @property
-    def latest_location(self) -> Location:
-        return self.location_history[-1] if self.location_history else None
@@ -1,3 +1,4 @@
+from .geocode import Geocode, GeocodeCreate, GeocodeUpdate
 from .google_maps_api_log import GoogleMapsApiLog, GoogleMapsApiLogCreate
 from .location import Location, LocationCreate, LocationInDB, LocationUpdate
 from .msg import Msg
@@ -0,0 +1,31 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+# Shared properties
+class GeocodeBase(BaseModel):
+    address: str
+    latitude: float
+    longitude: float
+
+
+# Properties to receive via API on creation
+class GeocodeCreate(GeocodeBase):
+    pass
+
+
+class GeocodeUpdate(GeocodeBase):
+    pass
+
+
+class GeocodeInDBBase(GeocodeBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[int] = None
+    hit_count: int = 0
+
+
+# Additional properties to return via API
+class Geocode(GeocodeInDBBase):
+    pass
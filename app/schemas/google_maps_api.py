@@ -8,7 +8,9 @@ from pydantic.dataclasses import dataclass
 from app.schemas.place import Place
 from app.services.constants import (
     AGGREGATED_ATTR,
+    AGGREGATION,
     PLACETYPE,
+    PREFILTER_COUNT,
     TrafficModel,
     TransitMode,
     TransitRoutingPreference,
@@ -79,3 +81,7 @@ class UserPreferences:
     place_type: PLACETYPE
     return_count: int
     filter_condition: Optional[AGGREGATED_ATTR] = None
+    filter_aggregation: AGGREGATION = AGGREGATION.SUM
+    # NOTE: None이면 직선거리 사전 필터링을 하지 않음
+    prefilter_count: Optional[int] = PREFILTER_COUNT
+    prefilter_condition: AGGREGATION = AGGREGATION.SUM
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+
+class ConnectionReuseStat(BaseModel):
+    requests: int
+    new_connections: int
+    reused_connections: int
+
+
+class CacheStat(BaseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class CacheMemoryStat(BaseModel):
+    entries: int
+    bytes: int
+
+
+class RedisCircuitStat(BaseModel):
+    state: str
+    failure_count: int
@@ -0,0 +1,69 @@
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from app.services.constants import ADDRESS_NGRAM_SIZE
+from app.utils import normalize_address
+
+
+def address_ngrams(address: str, size: int = ADDRESS_NGRAM_SIZE) -> Counter:
+    """
+    정규화한 주소를 1글자부터 size글자까지의 n-gram으로 나눕니다.
+    글자 단위 n-gram은 겹치는 글자 수를, 더 긴 n-gram은 글자 순서를 반영하며
+    2글자 이상은 앞뒤에 공백을 붙여 주소의 시작과 끝도 반영합니다.
+    """
+    normalized = normalize_address(address)
+    padded = f" {normalized} "
+    ngrams = Counter(normalized)
+    for n in range(2, size + 1):
+        ngrams.update(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return ngrams
+
+
+class AddressSimilarityIndex:
+    """
+    가중치가 있는 주소 목록을 n-gram 역색인으로 만들어 두고 후보 주소들과의 유사도를 한 번에 계산합니다.
+
+    유사도는 두 주소의 n-gram 다중집합에 대한 Dice 계수(2 * 공통 n-gram 수 / 전체 n-gram 수)로,
+    일치하는 글자 수로 계산하는 SequenceMatcher.ratio와 같은 꼴을 n-gram 단위로 근사합니다.
+    후보마다 공통 n-gram이 있는 주소만 확인하므로 주소 목록 길이와 문자열 길이의 곱에 비례하지 않습니다.
+    """
+
+    def __init__(self, weighted_addresses: Dict[str, float]):
+        self._weights: List[float] = []
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[tuple]] = defaultdict(list)
+        for index, (address, weight) in enumerate(weighted_addresses.items()):
+            ngrams = address_ngrams(address)
+            self._weights.append(weight)
+            self._sizes.append(sum(ngrams.values()))
+            for ngram, count in ngrams.items():
+                self._postings[ngram].append((index, count))
+
+    def similarities(self, address: str) -> Dict[int, float]:
+        """
+        공통 n-gram이 있는 주소의 위치와 유사도를 반환합니다.
+        """
+        ngrams = address_ngrams(address)
+        size = sum(ngrams.values())
+        overlaps: Dict[int, int] = defaultdict(int)
+        for ngram, count in ngrams.items():
+            for index, indexed_count in self._postings.get(ngram, ()):
+                overlaps[index] += min(count, indexed_count)
+
+        return {
+            index: round(2 * overlap / (size + self._sizes[index]), 2)
+            for index, overlap in overlaps.items()
+        }
+
+    def score_many(self, addresses: List[str]) -> List[float]:
+        """
+        후보 주소마다 색인된 주소와의 유사도에 가중치를 곱해 더한 점수를 반환합니다.
+        같은 후보 주소는 한 번만 계산합니다.
+        """
+        scores = {}
+        for address in dict.fromkeys(addresses):
+            scores[address] = sum(
+                similarity * self._weights[index]
+                for index, similarity in self.similarities(address).items()
+            )
+        return [scores[address] for address in addresses]
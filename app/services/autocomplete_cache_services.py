@@ -0,0 +1,84 @@
+from typing import Dict, List, Optional
+
+from app.schemas.location import LocationBase
+from app.services.cache_stats import get_cache_stats
+from app.services.constants import (
+    AUTOCOMPLETE_LOCATION_PRECISION,
+    AUTOCOMPLETE_MAX_PREDICTIONS,
+    RedisKey,
+)
+from app.services.redis_services import RedisServices
+from app.utils import geohash_decode, geohash_encode, normalize_address
+
+
+def location_bucket(location: Optional[LocationBase]) -> Optional[str]:
+    if location is None:
+        return None
+    return geohash_encode(
+        location.latitude, location.longitude, precision=AUTOCOMPLETE_LOCATION_PRECISION
+    )
+
+
+def bucket_center(bucket: Optional[str]) -> Optional[LocationBase]:
+    """
+    같은 버킷의 요청이 같은 결과를 받도록 API에는 버킷 중심 좌표를 위치 편향으로 보냅니다.
+    """
+    if bucket is None:
+        return None
+    latitude, longitude = geohash_decode(bucket)
+    return LocationBase(latitude=float(latitude), longitude=float(longitude))
+
+
+class AutocompleteCache:
+    """
+    자동완성 결과를 (위치 버킷, 정규화한 입력) 단위로 캐싱합니다.
+    더 짧은 입력의 결과가 최대 후보 수보다 적으면 가능한 후보를 모두 담고 있다고 보고,
+    긴 입력은 API 호출 없이 그 결과를 걸러서 응답합니다.
+    """
+
+    def __init__(self, redis_services: RedisServices):
+        self.redis_services = redis_services
+        self.stats = get_cache_stats(RedisKey.AUTOCOMPLETE.value)
+
+    def build_key(self, text: str, bucket: Optional[str] = None) -> str:
+        return (
+            f"{RedisKey.AUTOCOMPLETE.value}:{bucket or 'all'}:{normalize_address(text)}"
+        )
+
+    def get(self, text: str, bucket: Optional[str] = None) -> Optional[List[Dict]]:
+        normalized_text = normalize_address(text)
+        prefixes = [
+            normalized_text[:length] for length in range(len(normalized_text), 0, -1)
+        ]
+        cached_predictions = self.redis_services.get_cached_autocomplete_predictions(
+            [self.build_key(prefix, bucket) for prefix in prefixes]
+        )
+
+        for prefix, predictions in zip(prefixes, cached_predictions):
+            if predictions is None:
+                continue
+            if prefix == normalized_text:
+                self.stats.record_hits()
+                return predictions
+            if len(predictions) < AUTOCOMPLETE_MAX_PREDICTIONS:
+                filtered_predictions = [
+                    prediction
+                    for prediction in predictions
+                    if normalized_text in normalize_address(prediction["description"])
+                ]
+                if filtered_predictions:
+                    self.stats.record_hits()
+                    return filtered_predictions
+
+        self.stats.record_misses()
+        return None
+
+    def set(
+        self, text_predictions: Dict[str, List[Dict]], bucket: Optional[str] = None
+    ) -> bool:
+        return self.redis_services.cache_autocomplete_predictions(
+            {
+                self.build_key(text, bucket): predictions
+                for text, predictions in text_predictions.items()
+            }
+        )
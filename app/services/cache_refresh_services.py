@@ -0,0 +1,65 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_app_settings
+from app.db.session import SessionLocal
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CacheRefresher:
+    """
+    stale 캐시를 요청 경로 밖에서 갱신하는 백그라운드 작업 큐입니다.
+    작업마다 새 DB 세션을 열고, 같은 키는 진행 중인 갱신이 끝날 때까지 다시 예약하지 않습니다.
+    앱 종료 시 shutdown이 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.CACHE_REFRESH_WORKERS,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.max_workers = max_workers
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduled: Set[str] = set()
+
+    def schedule(self, key: str, refresh: Callable[[Session], None]) -> bool:
+        with self._lock:
+            if key in self._scheduled:
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="cache-refresh"
+                )
+            self._scheduled.add(key)
+            self._executor.submit(self._refresh, key, refresh)
+            return True
+
+    def _refresh(self, key: str, refresh: Callable[[Session], None]) -> None:
+        try:
+            with self.session_factory() as db:
+                refresh(db)
+        except Exception as error:
+            # NOTE: 갱신에 실패해도 하드 TTL까지는 stale 값을 계속 제공
+            logger.warning(f"Failed to refresh stale cache {key}: {error}")
+        finally:
+            with self._lock:
+                self._scheduled.discard(key)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+cache_refresher = CacheRefresher()
@@ -0,0 +1,50 @@
+import threading
+from typing import Dict
+
+
+class CacheStats:
+    """
+    캐시 적중/미스 횟수를 워커 프로세스 단위로 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record_hits(self, count: int = 1) -> None:
+        with self._lock:
+            self.hits += count
+
+    def record_misses(self, count: int = 1) -> None:
+        with self._lock:
+            self.misses += count
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return round(self.hits / total, 4) if total else 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hit_ratio,
+            }
+
+
+_cache_stats: Dict[str, CacheStats] = {}
+_cache_stats_lock = threading.Lock()
+
+
+def get_cache_stats(name: str) -> CacheStats:
+    with _cache_stats_lock:
+        if name not in _cache_stats:
+            _cache_stats[name] = CacheStats()
+        return _cache_stats[name]
+
+
+def snapshot_cache_stats() -> Dict[str, Dict[str, float]]:
+    with _cache_stats_lock:
+        return {name: stats.snapshot() for name, stats in _cache_stats.items()}
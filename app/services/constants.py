@@ -53,6 +53,10 @@ class StatusDetail(str, Enum):
     UNKNOWN_ERROR = "서버 내부 오류가 발생했습니다."
 
 
+# NOTE: 같은 입력으로 다시 요청해도 결과가 바뀌지 않는 응답 상태
+NEGATIVE_API_STATUSES = ("ZERO_RESULTS", "NOT_FOUND", "INVALID_REQUEST")
+
+
 class MapsFunction(str, Enum):
     GEOCODE_ADDRESS = "geocode_address"
     REVERSE_GEOCODE = "reverse_geocode"
@@ -105,11 +109,59 @@ class AGGREGATED_ATTR(str, Enum):
     DURATION = "duration_value"
 
 
+class AGGREGATION(str, Enum):
+    SUM = "sum"
+    MAX = "max"
+    VARIANCE = "variance"
+
+
 class RedisKey(str, Enum):
     GEOLOCATIONS_KEY = "geolocations"
     GEOCODE = "geocode"
-
-
-REDIS_SEARCH_RADIUS = 500
+    DISTANCE_MATRIX = "distance_matrix"
+    PLACES = "places"
+    NEARBY_PLACES = "nearby_places"
+    REVERSE_GEOCODE = "reverse_geocode"
+    AUTOCOMPLETE = "autocomplete"
+    LEASE = "lease"
+    NEGATIVE = "negative"
+
+
+# NOTE: 검색 반경이 넓을수록 검색 중심이 조금 달라도 결과가 비슷하므로 큰 셀로 묶어 캐싱
+# (검색 반경 상한(m), geohash 정밀도) 순서로 찾고, 더 넓은 반경은 NEARBY_PLACES_WIDEST_PRECISION 사용
+NEARBY_PLACES_PRECISIONS = (
+    (Radius.AUTO_COMPLETE_RADIUS.value, 7),  # 약 153m x 153m
+    (Radius.FIRST_RADIUS.value, 6),  # 약 1.2km x 0.6km
+)
+NEARBY_PLACES_WIDEST_PRECISION = 5  # 약 4.9km x 4.9km
 REDIS_EXPIRE_TIME = 3600  # 1시간
-GEOHASH_PRECISION = 12
+# NOTE: 주변 장소 캐시는 REDIS_EXPIRE_TIME이 지나면 stale로 보고, 이 시간까지는 갱신하는 동안 stale 값을 제공
+REDIS_STALE_EXPIRE_TIME = 3600 * 24  # 24시간
+# NOTE: 주소의 좌표는 거의 바뀌지 않으므로 길게 두고, 만료되면 DB에서 다시 채움
+GEOCODE_EXPIRE_TIME = 3600 * 24 * 30  # 30일
+# NOTE: GPS 좌표는 요청마다 조금씩 달라지므로 약 38m x 19m 셀 단위로 묶어 캐싱
+REVERSE_GEOCODE_PRECISION = 8
+REVERSE_GEOCODE_EXPIRE_TIME = 3600 * 24 * 7  # 7일
+# NOTE: 자동완성 위치 편향은 약 1.2km x 0.6km 셀의 중심으로 맞춰 같은 셀의 요청이 캐시를 공유
+AUTOCOMPLETE_LOCATION_PRECISION = 6
+AUTOCOMPLETE_EXPIRE_TIME = 3600 * 24  # 1일
+# Places Autocomplete가 한 번에 돌려주는 최대 후보 수
+AUTOCOMPLETE_MAX_PREDICTIONS = 5
+
+# NOTE: 출발지는 약 150m 셀 단위로 묶고, 출발 시각은 요일별 30분 단위로 묶어 캐싱
+DISTANCE_MATRIX_ORIGIN_PRECISION = 7
+DISTANCE_MATRIX_TIME_BUCKET_MINUTES = 30
+DISTANCE_MATRIX_EXPIRE_TIME = 3600 * 24 * 7  # 7일
+
+# Distance Matrix API 호출 전에 직선거리로 남길 후보 수
+PREFILTER_COUNT = 10
+
+# 추천 점수에 반영할 최근 검색 주소 수
+SEARCH_HISTORY_PROFILE_SIZE = 50
+# 검색 기록과 후보 주소의 유사도를 계산할 때 쓰는 글자 n-gram 크기
+ADDRESS_NGRAM_SIZE = 2
+
+# Distance Matrix API 요청당 제한
+DISTANCE_MATRIX_MAX_ORIGINS = 25
+DISTANCE_MATRIX_MAX_DESTINATIONS = 25
+DISTANCE_MATRIX_MAX_ELEMENTS = 100
@@ -0,0 +1,132 @@
+import re
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+
+from app.schemas.google_maps_api import DistanceInfo
+from app.services.cache_stats import get_cache_stats
+from app.services.constants import (
+    DISTANCE_MATRIX_ORIGIN_PRECISION,
+    DISTANCE_MATRIX_TIME_BUCKET_MINUTES,
+    RedisKey,
+    TravelMode,
+)
+from app.services.redis_services import RedisServices
+from app.utils import geohash_encode
+
+LAT_LNG_PATTERN = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+SEOUL_TIMEZONE = pytz.timezone("Asia/Seoul")
+
+
+def departure_time_bucket(departure_time: datetime) -> str:
+    """
+    출발 시각을 "요일-30분 슬롯" 형태로 묶습니다. 같은 요일 같은 시간대의 요청은 같은 캐시를 씁니다.
+    """
+    local_time = departure_time.astimezone(SEOUL_TIMEZONE)
+    slot = (
+        local_time.hour * 60 + local_time.minute
+    ) // DISTANCE_MATRIX_TIME_BUCKET_MINUTES
+    return f"{local_time.weekday()}-{slot}"
+
+
+def parse_lat_lng(origin: str) -> Optional[Tuple[float, float]]:
+    matched = LAT_LNG_PATTERN.match(origin)
+    if not matched:
+        return None
+    return float(matched.group(1)), float(matched.group(2))
+
+
+class DistanceMatrixCache:
+    """
+    Distance Matrix 응답을 (출발지 셀, 목적지 place_id, 이동수단, 출발 시간대) 단위의 원소로 캐싱합니다.
+    """
+
+    def __init__(
+        self,
+        redis_services: RedisServices,
+        mode: TravelMode,
+        departure_time: datetime = None,
+    ):
+        self.redis_services = redis_services
+        self.mode = mode
+        self.time_bucket = departure_time_bucket(
+            departure_time or datetime.now(pytz.utc)
+        )
+        self.stats = get_cache_stats(RedisKey.DISTANCE_MATRIX.value)
+
+    def build_key(self, origin_cell: str, destination_id: str) -> str:
+        return ":".join(
+            [
+                RedisKey.DISTANCE_MATRIX.value,
+                self.mode.value,
+                self.time_bucket,
+                origin_cell,
+                destination_id,
+            ]
+        )
+
+    def resolve_origin_cell(self, origin: str) -> Optional[str]:
+        """
+        출발지의 geohash 셀을 구합니다. 좌표 문자열이 아니면 캐시된 geocode 결과만 사용하고
+        API는 호출하지 않으며, 좌표를 알 수 없으면 None을 반환합니다.
+        """
+        lat_lng = parse_lat_lng(origin)
+        if lat_lng is None:
+            cached_coordinates = self.redis_services.get_cached_address_coordinates(
+                origin
+            )
+            if not cached_coordinates:
+                return None
+            lat_lng = (cached_coordinates["latitude"], cached_coordinates["longitude"])
+
+        return geohash_encode(
+            lat_lng[0], lat_lng[1], precision=DISTANCE_MATRIX_ORIGIN_PRECISION
+        )
+
+    def get(
+        self, origin_cells: List[Optional[str]], destination_ids: List[str]
+    ) -> Dict[Tuple[int, int], DistanceInfo]:
+        pairs = [
+            (origin_idx, destination_idx)
+            for origin_idx, origin_cell in enumerate(origin_cells)
+            if origin_cell
+            for destination_idx in range(len(destination_ids))
+        ]
+        cached_infos = self.redis_services.get_cached_distance_infos(
+            [
+                self.build_key(
+                    origin_cells[origin_idx], destination_ids[destination_idx]
+                )
+                for origin_idx, destination_idx in pairs
+            ]
+        )
+        cached = {
+            pair: DistanceInfo(**cached_info)
+            for pair, cached_info in zip(pairs, cached_infos)
+            if cached_info
+        }
+
+        self.stats.record_hits(len(cached))
+        self.stats.record_misses(len(origin_cells) * len(destination_ids) - len(cached))
+        return cached
+
+    def set(
+        self,
+        origin_cells: List[Optional[str]],
+        destination_ids: List[str],
+        distance_infos: Dict[Tuple[int, int], DistanceInfo],
+    ) -> bool:
+        return self.redis_services.cache_distance_infos(
+            {
+                self.build_key(
+                    origin_cells[origin_idx], destination_ids[destination_idx]
+                ): asdict(distance_info)
+                for (
+                    origin_idx,
+                    destination_idx,
+                ), distance_info in distance_infos.items()
+                if origin_cells[origin_idx] and distance_info.distance_value is not None
+            }
+        )
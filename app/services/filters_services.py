@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar
+from typing import Dict, Generic, List, Optional, TypeVar
+
+import numpy as np
 
 from app.models.place import Place
-from app.schemas.google_maps_api import DistanceInfo, UserPreferences
-from app.services.constants import AGGREGATED_ATTR, PLACETYPE
+from app.schemas.google_maps_api import GeocodeResponse, UserPreferences
+from app.services.constants import AGGREGATION, PLACETYPE
+from app.services.midpoint_services import harversine_distance_matrix
 from app.services.routes_matrix_services import RoutesMatrix
 
 T = TypeVar("T")
@@ -37,17 +40,14 @@ class DistanceInfoFilter(Filter):
         self.user_preferences = user_preferences
 
     def apply(self, candidates: List[Place]) -> List[Place]:
-        sorted_destination_distance = (
-            self.routes_matrix.sort_destinations_by_aggregated_attr(
+        aggregated_destination_ids = set(
+            self.routes_matrix.top_k_destination_ids(
                 self.user_preferences.filter_condition,
                 self.user_preferences.return_count,
+                self.user_preferences.filter_aggregation,
             )
         )
 
-        aggregated_destination_ids = {
-            result.destination_id for result in sorted_destination_distance
-        }
-
         filtered_candidates = [
             candidate
             for candidate in candidates
@@ -55,3 +55,65 @@ class DistanceInfoFilter(Filter):
         ]
 
         return filtered_candidates[: self.user_preferences.return_count]
+
+
+def prefilter_keep_count(user_preferences: UserPreferences) -> Optional[int]:
+    # NOTE: return_count보다 적게 남기면 요청한 개수만큼 추천할 수 없으므로 둘 중 큰 값을 씀
+    if user_preferences.prefilter_count is None:
+        return None
+    return max(user_preferences.prefilter_count, user_preferences.return_count)
+
+
+class HaversinePreFilter(Filter):
+    """
+    Distance Matrix API를 호출하기 전에 참가자-후보 간 직선거리로 후보를
+    prefilter_count와 return_count 중 큰 값만큼만 남깁니다.
+    좌표를 알 수 없는 후보는 가장 먼 것으로 취급합니다.
+    """
+
+    def __init__(
+        self,
+        participant_coordinates: List[GeocodeResponse],
+        candidate_coordinates: Dict[str, GeocodeResponse],
+        user_preferences: UserPreferences,
+    ):
+        self.participant_coordinates = participant_coordinates
+        self.candidate_coordinates = candidate_coordinates
+        self.user_preferences = user_preferences
+
+    def _aggregate_distances(self, candidates: List[Place]) -> np.ndarray:
+        aggregated = np.full(len(candidates), np.inf)
+        located_indexes = [
+            idx
+            for idx, candidate in enumerate(candidates)
+            if candidate.place_id in self.candidate_coordinates
+        ]
+        if not located_indexes:
+            return aggregated
+
+        distances = harversine_distance_matrix(
+            self.participant_coordinates,
+            [
+                self.candidate_coordinates[candidates[idx].place_id]
+                for idx in located_indexes
+            ],
+        )
+        if self.user_preferences.prefilter_condition == AGGREGATION.MAX:
+            aggregated[located_indexes] = distances.max(axis=0)
+        else:
+            aggregated[located_indexes] = distances.sum(axis=0)
+        return aggregated
+
+    def apply(self, candidates: List[Place]) -> List[Place]:
+        count = prefilter_keep_count(self.user_preferences)
+        if (
+            count is None
+            or len(candidates) <= count
+            or not self.participant_coordinates
+        ):
+            return candidates
+
+        aggregated = self._aggregate_distances(candidates)
+        kept_indexes = np.sort(np.argpartition(aggregated, count - 1)[:count])
+
+        return [candidates[idx] for idx in kept_indexes]
@@ -0,0 +1,86 @@
+import logging
+import threading
+from collections import Counter
+from typing import Callable, List, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import get_app_settings
+from app.db.session import SessionLocal
+from app.utils import normalize_address
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class GeocodeHitRecorder:
+    """
+    DB에서 찾은 geocode의 조회 횟수를 메모리에 모았다가 주기적으로 한 번에 반영하는
+    백그라운드 스레드입니다. 조회 요청이 geocode 행을 잠그지 않도록
+    앱 시작 시 startup, 종료 시 shutdown이 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.GEOCODE_HIT_FLUSH_INTERVAL,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.interval = interval
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._hits: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._thread is not None
+
+    def record(self, addresses: List[str]) -> None:
+        with self._lock:
+            self._hits.update(normalize_address(address) for address in addresses)
+
+    def flush(self) -> int:
+        with self._lock:
+            hits, self._hits = self._hits, Counter()
+        if not hits:
+            return 0
+
+        try:
+            with self.session_factory() as db:
+                crud.geocode.add_hits(db, hits=dict(hits))
+        except SQLAlchemyError:
+            # NOTE: 다음 주기에 다시 반영하도록 모은 조회 횟수를 되돌려 둠
+            logger.warning("Failed to flush geocode hits.", exc_info=True)
+            with self._lock:
+                self._hits.update(hits)
+            return 0
+        return len(hits)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def startup(self) -> None:
+        if self.is_started:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="geocode-hit-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        if not self.is_started:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+
+geocode_hit_recorder = GeocodeHitRecorder()
@@ -0,0 +1,49 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import get_app_settings
+from app.services.redis_services import RedisOperationError, RedisServices
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def warm_up_geocode_cache(
+    db: Session,
+    redis_services: RedisServices,
+    count: int = settings.GEOCODE_WARMUP_COUNT,
+) -> int:
+    """
+    조회 횟수가 많은 주소 count개의 좌표를 DB에서 읽어 Redis에 미리 채웁니다.
+    DB나 Redis에 문제가 있어도 앱은 뜰 수 있도록 0을 반환합니다.
+    """
+    if count <= 0:
+        return 0
+
+    try:
+        geocodes = crud.geocode.get_most_hit(db, limit=count)
+    except SQLAlchemyError as error:
+        logger.error(f"Error loading geocodes for warm-up: {error}", exc_info=True)
+        return 0
+
+    if not geocodes:
+        return 0
+
+    try:
+        redis_services.cache_addresses_coordinates(
+            {
+                geocode.address: (geocode.latitude, geocode.longitude)
+                for geocode in geocodes
+            }
+        )
+    except RedisOperationError:
+        logger.warning("Skipped geocode cache warm-up.")
+        return 0
+
+    logger.info(f"Warmed up geocode cache with {len(geocodes)} addresses.")
+    return len(geocodes)
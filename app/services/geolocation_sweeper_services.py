@@ -0,0 +1,79 @@
+import logging
+import threading
+from typing import Optional
+
+from app.core.config import get_app_settings
+from app.services.redis_services import (
+    RedisOperationError,
+    RedisServices,
+    RedisServicesFactory,
+    RedisUnavailableError,
+)
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class GeolocationSweeper:
+    """
+    주기적으로 만료된 셀을 장소 유형별 만료 시각 set에서 제거하는 백그라운드 스레드입니다.
+    만료 시각 set이 살아있는 캐시 항목만 담도록 앱 시작 시 startup, 종료 시 shutdown이 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.GEOLOCATION_SWEEP_INTERVAL,
+        redis_services: Optional[RedisServices] = None,
+    ):
+        self.interval = interval
+        self._redis_services = redis_services
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def redis_services(self) -> RedisServices:
+        if self._redis_services is None:
+            self._redis_services = RedisServicesFactory.create_redis_services()
+        return self._redis_services
+
+    @property
+    def is_started(self) -> bool:
+        return self._thread is not None
+
+    def sweep(self) -> int:
+        try:
+            removed_count = self.redis_services.remove_expired_locations()
+        except RedisUnavailableError:
+            return 0
+        except RedisOperationError:
+            # NOTE: 다음 주기에 다시 시도하면 되므로 스레드는 계속 돌게 둠
+            logger.warning("Failed to sweep expired geolocations.")
+            return 0
+        if removed_count:
+            logger.info(f"Removed {removed_count} expired geolocations.")
+        return removed_count
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sweep()
+
+    def startup(self) -> None:
+        if self.is_started:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="geolocation-sweeper", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        if not self.is_started:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+
+geolocation_sweeper = GeolocationSweeper()
@@ -0,0 +1,222 @@
+import json
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from app.core.config import get_app_settings
+from app.services.cache_stats import get_cache_stats
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class LocalCache:
+    """
+    워커 프로세스 안에서 Redis 앞에 두는 LRU/TTL 캐시입니다.
+    메모리 사용량은 Redis에서 읽은 원본 값의 바이트 수로 어림합니다.
+    값은 직렬화해 두고 읽을 때마다 새 객체로 복원하므로 호출한 쪽이 결과를 바꿔도
+    다른 요청이 읽는 항목은 바뀌지 않습니다.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = get_cache_stats(f"l1:{name}")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._size_bytes = 0
+
+    def _pop(self, key: str) -> None:
+        _, _, size_bytes = self._entries.pop(key)
+        self._size_bytes -= size_bytes
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._pop(key)
+                self.stats.record_misses()
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self.stats.record_hits()
+            payload = entry[1]
+        return pickle.loads(payload)
+
+    def set(self, key: str, value: Any, size_bytes: int = 0) -> None:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic() + self.ttl, payload, size_bytes)
+            self._size_bytes += size_bytes
+            while len(self._entries) > self.max_entries:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._pop(key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def memory_snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size_bytes}
+
+
+class LocalCacheRegistry:
+    """
+    이름별 LocalCache를 관리하고 Redis pub/sub으로 다른 워커의 캐시 무효화를 전달받습니다.
+    max_entries가 0 이하이면 L1 캐시를 사용하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.LOCAL_CACHE_MAX_ENTRIES,
+        ttl: float = settings.LOCAL_CACHE_TTL,
+        channel: str = settings.LOCAL_CACHE_INVALIDATION_CHANNEL,
+        resubscribe_interval: float = 1.0,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.channel = channel
+        self.resubscribe_interval = resubscribe_interval
+        self._lock = threading.Lock()
+        self._caches: Dict[str, LocalCache] = {}
+        self._pubsub = None
+        self._pubsub_thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def is_started(self) -> bool:
+        return self._pubsub_thread is not None
+
+    def get_cache(self, name: str) -> Optional[LocalCache]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            if name not in self._caches:
+                self._caches[name] = LocalCache(name, self.max_entries, self.ttl)
+            return self._caches[name]
+
+    def invalidate_locally(
+        self, name: str, keys: Optional[List[str]] = None, prefix: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            local_cache = self._caches.get(name)
+        if local_cache is None:
+            return
+        if keys:
+            local_cache.invalidate(keys)
+        if prefix is not None:
+            local_cache.invalidate_prefix(prefix)
+
+    def publish_invalidation(
+        self,
+        redis_client: redis.Redis,
+        name: str,
+        keys: Optional[List[str]] = None,
+        prefix: Optional[str] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        self.invalidate_locally(name, keys=keys, prefix=prefix)
+        redis_client.publish(
+            self.channel, json.dumps({"name": name, "keys": keys, "prefix": prefix})
+        )
+
+    def _handle_message(self, message: Dict) -> None:
+        try:
+            invalidation = json.loads(message["data"])
+            self.invalidate_locally(
+                invalidation["name"],
+                keys=invalidation.get("keys"),
+                prefix=invalidation.get("prefix"),
+            )
+        except (ValueError, KeyError):
+            logger.warning(f"Invalid cache invalidation message: {message}")
+
+    def _handle_pubsub_error(self, error: BaseException, pubsub, pubsub_thread) -> None:
+        """
+        구독 연결이 끊겨도 스레드가 죽지 않도록 다시 구독하고,
+        끊긴 동안 놓친 무효화가 있을 수 있으므로 L1 캐시를 모두 비웁니다.
+        """
+        logger.error(f"Error receiving cache invalidation: {error}", exc_info=True)
+        time.sleep(self.resubscribe_interval)
+        try:
+            pubsub.subscribe(**{self.channel: self._handle_message})
+        except redis.RedisError as resubscribe_error:
+            # NOTE: 다음 get_message에서 다시 실패하면 이 핸들러가 다시 호출됨
+            logger.warning(
+                f"Error resubscribing cache invalidation channel: {resubscribe_error}"
+            )
+            return
+        self.clear()
+
+    def startup(self, redis_client: redis.Redis) -> None:
+        if not self.enabled or self.is_started:
+            return
+        try:
+            self._pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.channel: self._handle_message})
+            self._pubsub_thread = self._pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._handle_pubsub_error,
+            )
+        except redis.RedisError as error:
+            # NOTE: 구독에 실패해도 TTL이 지나면 갱신되므로 앱은 계속 뜨게 둠
+            logger.error(
+                f"Error subscribing cache invalidation channel: {error}", exc_info=True
+            )
+            self._pubsub = None
+
+    def shutdown(self) -> None:
+        if not self.is_started:
+            return
+        self._pubsub_thread.stop()
+        self._pubsub_thread.join()
+        self._pubsub.close()
+        self._pubsub = None
+        self._pubsub_thread = None
+
+    def clear(self) -> None:
+        with self._lock:
+            caches = list(self._caches.values())
+        for local_cache in caches:
+            local_cache.clear()
+
+    def memory_snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            caches = list(self._caches.values())
+        return {
+            f"l1:{local_cache.name}": local_cache.memory_snapshot()
+            for local_cache in caches
+        }
+
+
+local_cache_registry = LocalCacheRegistry()
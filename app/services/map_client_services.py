@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import socket
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlparse
+
+import googlemaps
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import get_app_settings
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def create_map_client(**kwargs) -> googlemaps.Client:
+    return googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY, **kwargs)
+
+
+def create_no_retry_map_client(**kwargs) -> googlemaps.Client:
+    """
+    OVER_QUERY_LIMIT를 재시도하지 않는 클라이언트입니다. 기본 클라이언트는 최대 60초
+    재시도한 뒤 Timeout을 던지므로, 오래된 캐시로 대신 응답할 수 있는 호출에서만 씁니다.
+    """
+    return create_map_client(retry_over_query_limit=False, **kwargs)
+
+
+class ConnectionReuseStats:
+    """
+    Google Maps 엔드포인트별로 요청 수와 새로 연결한 횟수를 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = defaultdict(int)
+        self._new_connections = defaultdict(int)
+        self._seen_connections = weakref.WeakSet()
+
+    def record(self, url: str, connection) -> None:
+        endpoint = urlparse(str(url)).path
+        with self._lock:
+            self._requests[endpoint] += 1
+            if connection is None or connection not in self._seen_connections:
+                self._new_connections[endpoint] += 1
+            if connection is not None:
+                self._seen_connections.add(connection)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": requests_count,
+                    "new_connections": self._new_connections[endpoint],
+                    "reused_connections": requests_count
+                    - self._new_connections[endpoint],
+                }
+                for endpoint, requests_count in self._requests.items()
+            }
+
+
+class StatsHTTPAdapter(HTTPAdapter):
+    def __init__(
+        self,
+        stats: ConnectionReuseStats,
+        keepalive_expiry: float,
+        tcp_keepalive_idle: int,
+        **kwargs,
+    ):
+        self.stats = stats
+        self.keepalive_expiry = keepalive_expiry
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+        self._idle_lock = threading.Lock()
+        self._last_used_at: Optional[float] = None
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        # NOTE: 유휴 커넥션이 중간 장비에서 끊기지 않도록 TCP keep-alive를 켬
+        socket_options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle)
+            )
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def _expire_idle_pool(self) -> None:
+        """
+        urllib3 풀에는 유휴 만료가 없어서, 풀 전체가 keepalive_expiry보다 오래
+        쓰이지 않았으면 커넥션을 모두 닫고 다음 요청부터 새로 연결합니다.
+        """
+        now = time.monotonic()
+        with self._idle_lock:
+            is_expired = (
+                self._last_used_at is not None
+                and now - self._last_used_at > self.keepalive_expiry
+            )
+            self._last_used_at = now
+        if is_expired:
+            self.poolmanager.clear()
+
+    def send(self, request, *args, **kwargs):
+        self._expire_idle_pool()
+        response = super().send(request, *args, **kwargs)
+        self.stats.record(request.url, getattr(response.raw, "connection", None))
+        return response
+
+
+class MapClientRegistry:
+    """
+    워커 프로세스마다 Google Maps 클라이언트를 하나씩 만들어 재사용합니다.
+
+    동기 googlemaps.Client는 커넥션 풀을 가진 requests.Session을 공유하고,
+    비동기 httpx.AsyncClient는 전용 이벤트 루프 스레드에 묶어 두어
+    동기 엔드포인트에서도 run_with_async_client로 사용할 수 있습니다.
+    앱 시작 시 startup, 종료 시 shutdown이 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = settings.GOOGLE_MAPS_POOL_SIZE,
+        keepalive_expiry: float = settings.GOOGLE_MAPS_KEEPALIVE_EXPIRY,
+        tcp_keepalive_idle: int = settings.GOOGLE_MAPS_TCP_KEEPALIVE_IDLE,
+    ):
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+        self.stats = ConnectionReuseStats()
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._map_client: Optional[googlemaps.Client] = None
+        self._no_retry_map_client: Optional[googlemaps.Client] = None
+        self._async_map_client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._map_client is not None
+
+    @property
+    def map_client(self) -> googlemaps.Client:
+        self.startup()
+        return self._map_client
+
+    @property
+    def no_retry_map_client(self) -> googlemaps.Client:
+        self.startup()
+        return self._no_retry_map_client
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount(
+            "https://",
+            StatsHTTPAdapter(
+                self.stats,
+                keepalive_expiry=self.keepalive_expiry,
+                tcp_keepalive_idle=self.tcp_keepalive_idle,
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+            ),
+        )
+        return session
+
+    async def _create_async_map_client(self) -> httpx.AsyncClient:
+        async def record_response(response: httpx.Response):
+            self.stats.record(
+                response.request.url, response.extensions.get("network_stream")
+            )
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=settings.GOOGLE_MAPS_TIMEOUT,
+            event_hooks={"response": [record_response]},
+        )
+
+    def startup(self) -> None:
+        with self._lock:
+            if self.is_started:
+                return
+
+            self._session = self._create_session()
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="map-client-loop", daemon=True
+            )
+            self._loop_thread.start()
+            self._async_map_client = asyncio.run_coroutine_threadsafe(
+                self._create_async_map_client(), self._loop
+            ).result()
+            self._map_client = create_map_client(requests_session=self._session)
+            self._no_retry_map_client = create_no_retry_map_client(
+                requests_session=self._session
+            )
+            logger.info("Google Maps clients are ready.")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if not self.is_started:
+                return
+
+            asyncio.run_coroutine_threadsafe(
+                self._async_map_client.aclose(), self._loop
+            ).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._session.close()
+
+            self._session = None
+            self._map_client = None
+            self._no_retry_map_client = None
+            self._async_map_client = None
+            self._loop = None
+            self._loop_thread = None
+            logger.info("Google Maps clients are closed.")
+
+    def run_with_async_client(
+        self, coroutine_fn: Callable[[httpx.AsyncClient], Awaitable[T]]
+    ) -> T:
+        """
+        공유 AsyncClient로 coroutine_fn을 전용 이벤트 루프에서 실행하고 결과를 기다립니다.
+        모든 요청 스레드가 같은 루프를 쓰므로 coroutine_fn은 HTTP 요청만 해야 하고,
+        DB, Redis 저장은 결과를 받은 뒤 호출한 스레드에서 합니다.
+        """
+        self.startup()
+        return asyncio.run_coroutine_threadsafe(
+            coroutine_fn(self._async_map_client), self._loop
+        ).result()
+
+
+map_client_registry = MapClientRegistry()
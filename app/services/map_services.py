@@ -1,14 +1,18 @@
+import asyncio
 import logging
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from functools import wraps
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import googlemaps
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app import crud
 from app.core.config import get_app_settings
 from app.models.user import User
+from app.schemas.geocode import GeocodeCreate
 from app.schemas.google_maps_api import (
     DistanceInfo,
     DistanceMatrixRequest,
@@ -18,8 +22,14 @@ from app.schemas.google_maps_api import (
 from app.schemas.google_maps_api_log import GoogleMapsApiLogCreate
 from app.schemas.location import Location, LocationBase, LocationCreate
 from app.schemas.place import AutoCompletedPlace, Place, PlaceCreate
+from app.services.autocomplete_cache_services import (
+    AutocompleteCache,
+    bucket_center,
+    location_bucket,
+)
 from app.services.constants import (
     GOOGLE_MAPS_URL,
+    NEGATIVE_API_STATUSES,
     PLACETYPE,
     MapsFunction,
     Radius,
@@ -27,7 +37,32 @@ from app.services.constants import (
     StatusDetail,
     TravelMode,
 )
-from app.services.redis_services import RedisServicesFactory
+from app.services.distance_matrix_cache_services import DistanceMatrixCache
+from app.services.geocode_hit_services import geocode_hit_recorder
+from app.services.map_client_services import (
+    MapClientRegistry,
+    create_map_client,
+    create_no_retry_map_client,
+)
+from app.services.negative_cache_services import negative_cache
+from app.services.place_cache_services import (
+    PlaceCache,
+    deserialize_place,
+    serialize_place,
+)
+from app.services.redis_services import (
+    RedisOperationError,
+    RedisServicesFactory,
+    geocode_key,
+    nearby_places_geohash,
+    nearby_places_key,
+)
+from app.services.routes_matrix_services import (
+    merge_distance_matrix_tiles,
+    plan_distance_matrix_tiles,
+)
+from app.services.single_flight_services import single_flight
+from app.utils import normalize_address
 
 settings = get_app_settings()
 
@@ -48,54 +83,126 @@ class NoAddressException(Exception):
     pass
 
 
-def add_api_request_log(api_call):
-    @wraps(api_call)
-    def wrapper(self, db, user, *args, **kwargs):
-        try:
-            results = api_call(self, db, user, *args, **kwargs)
-            if not results or (
-                (
-                    type(results) == dict
-                    and results.get("status") == StatusDetail.ZERO_RESULTS.name
+def is_over_query_limit(error: Exception) -> bool:
+    return (
+        isinstance(error, googlemaps.exceptions.ApiError)
+        and error.status == StatusDetail.OVER_QUERY_LIMIT.name
+    )
+
+
+def _to_list(values: str | List[str]) -> List[str]:
+    return values if isinstance(values, list) else [values]
+
+
+def _split_arguments(arguments: tuple | dict) -> Tuple[tuple, dict]:
+    return ((), arguments) if isinstance(arguments, dict) else (arguments, {})
+
+
+def _validate_api_results(api_call_name: str, results):
+    if not results or (
+        (
+            type(results) == dict
+            and results.get("status") == StatusDetail.ZERO_RESULTS.name
+        )
+    ):
+        raise ZeroResultException(
+            {"status": 204, "detail": StatusDetail.ZERO_RESULTS.value}
+        )
+
+    if api_call_name == MapsFunction.CALCULATE_DISTANCE_MATRIX:
+        for result in results:
+            if result.origin is None:
+                raise NoAddressException(
+                    {
+                        "status": 400,
+                        "detail": StatusDetail.INVALID_REQUEST.value,
+                    }
                 )
-            ):
+            elif result.distance_value is None or result.duration_value is None:
                 raise ZeroResultException(
                     {"status": 204, "detail": StatusDetail.ZERO_RESULTS.value}
                 )
 
-            if api_call.__name__ == MapsFunction.CALCULATE_DISTANCE_MATRIX:
-                for result in results:
-                    if result.origin is None:
-                        raise NoAddressException(
-                            {
-                                "status": 400,
-                                "detail": StatusDetail.INVALID_REQUEST.value,
-                            }
-                        )
-                    elif result.distance_value is None or result.duration_value is None:
-                        raise ZeroResultException(
-                            {"status": 204, "detail": StatusDetail.ZERO_RESULTS.value}
-                        )
+
+def _log_api_error(db, user, api_call_name: str, args, kwargs, error: Exception):
+    crud.google_maps_api_log.create(
+        db,
+        obj_in=GoogleMapsApiLogCreate(
+            request_url=GOOGLE_MAPS_URL[api_call_name],
+            status_code=400,
+            reason=str(error),
+            payload=str(args) + "," + str(kwargs),
+            print_result=str(error),
+            user_id=user.id,
+        ),
+    )
+
+
+def _to_negative_result(error: Exception) -> Optional[Dict]:
+    if isinstance(error, (ZeroResultException, NoAddressException)):
+        return {"exception": type(error).__name__, "detail": error.args[0]}
+    if (
+        isinstance(error, googlemaps.exceptions.ApiError)
+        and error.status in NEGATIVE_API_STATUSES
+    ):
+        return {
+            "exception": "ApiError",
+            "detail": {"status": error.status, "message": error.message},
+        }
+    return None
+
+
+def _from_negative_result(result: Dict) -> Exception:
+    if result["exception"] == "ApiError":
+        return googlemaps.exceptions.ApiError(**result["detail"])
+    if result["exception"] == NoAddressException.__name__:
+        return NoAddressException(result["detail"])
+    return ZeroResultException(result["detail"])
+
+
+def _raise_if_negative_cached(api_call_name: str, args, kwargs):
+    negative_result = negative_cache.get(api_call_name, args, kwargs)
+    if negative_result is not None:
+        raise _from_negative_result(negative_result)
+
+
+def _handle_api_error(db, user, api_call_name: str, args, kwargs, error: Exception):
+    negative_result = _to_negative_result(error)
+    if negative_result is not None:
+        negative_cache.set(api_call_name, args, kwargs, negative_result)
+    _log_api_error(db, user, api_call_name, args, kwargs, error)
+
+
+def add_api_request_log(api_call):
+    @wraps(api_call)
+    def wrapper(self, db, user, *args, **kwargs):
+        _raise_if_negative_cached(api_call.__name__, args, kwargs)
+        try:
+            results = api_call(self, db, user, *args, **kwargs)
+            _validate_api_results(api_call.__name__, results)
 
             return results
         except Exception as error:
-            crud.google_maps_api_log.create(
-                db,
-                obj_in=GoogleMapsApiLogCreate(
-                    request_url=GOOGLE_MAPS_URL[api_call.__name__],
-                    status_code=400,
-                    reason=str(error),
-                    payload=str(args) + "," + str(kwargs),
-                    print_result=str(error),
-                    user_id=user.id,
-                ),
-            )
+            _handle_api_error(db, user, api_call.__name__, args, kwargs, error)
             raise error
 
     return wrapper
 
 
-class MapAdapter:
+def validate_async_api_results(api_call):
+    # NOTE: 공유 이벤트 루프에서 실행되므로 기억한 실패 조회와 실패 로그 저장은
+    # 여기서 하지 않고 호출한 스레드의 MapServices._gather_api_calls에서 처리함
+    @wraps(api_call)
+    async def wrapper(self, db, user, *args, **kwargs):
+        results = await api_call(self, db, user, *args, **kwargs)
+        _validate_api_results(api_call.__name__, results)
+
+        return results
+
+    return wrapper
+
+
+class BaseMapAdapter:
     def __init__(self, client=None, db=None):
         self.client = client
         self.db = db
@@ -108,6 +215,43 @@ class MapAdapter:
         else:
             raise TypeError("destinations must be a list or string")
 
+    def _parse_distance_matrix(
+        self, matrix: dict, destinations: List[str], is_place_id: bool
+    ) -> List[DistanceInfo]:
+        distances = []
+        for row_idx, row in enumerate(matrix["rows"]):
+            for ele_idx, element in enumerate(row["elements"]):
+                if element["status"] != "OK":
+                    distances.append(
+                        DistanceInfo(
+                            origin=matrix["origin_addresses"][row_idx],
+                            destination=matrix["destination_addresses"][ele_idx],
+                            destination_id=destinations[ele_idx]
+                            if is_place_id
+                            else None,
+                            distance_text=None,
+                            distance_value=None,
+                            duration_text=None,
+                            duration_value=None,
+                        )
+                    )
+                    continue
+
+                distances.append(
+                    DistanceInfo(
+                        origin=matrix["origin_addresses"][row_idx],
+                        destination=matrix["destination_addresses"][ele_idx],
+                        destination_id=destinations[ele_idx] if is_place_id else None,
+                        distance_text=element["distance"]["text"],
+                        distance_value=element["distance"]["value"],
+                        duration_text=element["duration"]["text"],
+                        duration_value=element["duration"]["value"],
+                    )
+                )
+        return distances
+
+
+class MapAdapter(BaseMapAdapter):
     @add_api_request_log
     def geocode_address(self, db, user, address):
         return self.client.geocode(address)
@@ -138,10 +282,17 @@ class MapAdapter:
 
     @add_api_request_log
     def auto_complete_place(
-        self, db, user, text: str, location: LocationBase = None, language="ko"
+        self,
+        db,
+        user,
+        text: str,
+        location: LocationBase = None,
+        language="ko",
+        session_token: Optional[str] = None,
     ) -> List[dict]:
         res = self.client.places_autocomplete(
             text,
+            session_token=session_token,
             language=language,
             location=f"{location.latitude}, {location.longitude}" if location else None,
             radius=Radius.AUTO_COMPLETE_RADIUS.value if location else None,
@@ -178,43 +329,171 @@ class MapAdapter:
             language=language,
         )
 
-        distances = []
-        for row_idx, row in enumerate(matrix["rows"]):
-            for ele_idx, element in enumerate(row["elements"]):
-                if element["status"] != "OK":
-                    distances.append(
-                        DistanceInfo(
-                            origin=matrix["origin_addresses"][row_idx],
-                            destination=matrix["destination_addresses"][ele_idx],
-                            destination_id=destinations[ele_idx]
-                            if is_place_id
-                            else None,
-                            distance_text=None,
-                            distance_value=None,
-                            duration_text=None,
-                            duration_value=None,
-                        )
-                    )
-                    continue
+        return self._parse_distance_matrix(matrix, destinations, is_place_id)
 
-                distances.append(
-                    DistanceInfo(
-                        origin=matrix["origin_addresses"][row_idx],
-                        destination=matrix["destination_addresses"][ele_idx],
-                        destination_id=destinations[ele_idx] if is_place_id else None,
-                        distance_text=element["distance"]["text"],
-                        distance_value=element["distance"]["value"],
-                        duration_text=element["duration"]["text"],
-                        duration_value=element["duration"]["value"],
-                    )
-                )
-        return distances
+
+class AsyncMapAdapter(BaseMapAdapter):
+    """
+    MapAdapter와 같은 인터페이스를 httpx.AsyncClient 위에서 비동기로 제공합니다.
+
+    여러 주소를 한 번에 geocode/autocomplete 할 때 gather로 동시에 요청을 보내고,
+    max_concurrency로 동시에 나가는 요청 수를 제한합니다.
+    코루틴은 HTTP 요청만 하고, 실패 로그는 호출한 쪽에서 저장합니다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient = None,
+        db=None,
+        max_concurrency: int = settings.GOOGLE_MAPS_MAX_CONCURRENCY,
+    ):
+        super().__init__(client, db)
+        self.max_concurrency = max_concurrency
+
+    async def _request(self, api_call_name: str, params: dict) -> dict:
+        response = await self.client.get(
+            GOOGLE_MAPS_URL[api_call_name],
+            params={
+                **{key: value for key, value in params.items() if value is not None},
+                "key": settings.GOOGLE_MAPS_API_KEY,
+            },
+        )
+        if response.status_code != 200:
+            raise googlemaps.exceptions.HTTPError(response.status_code)
+
+        body = response.json()
+        api_status = body["status"]
+        # NOTE: googlemaps.Client와 동일하게 ZERO_RESULTS는 빈 결과로 처리
+        if api_status in (StatusDetail.OK.name, StatusDetail.ZERO_RESULTS.name):
+            return body
+        raise googlemaps.exceptions.ApiError(api_status, body.get("error_message"))
+
+    async def gather(
+        self,
+        api_call,
+        db,
+        user,
+        arguments: List[tuple | dict],
+        return_exceptions: bool = False,
+    ) -> List:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call_with_limit(args):
+            async with semaphore:
+                if isinstance(args, dict):
+                    return await api_call(db, user, **args)
+                return await api_call(db, user, *args)
+
+        return await asyncio.gather(
+            *(call_with_limit(args) for args in arguments),
+            return_exceptions=return_exceptions,
+        )
+
+    @validate_async_api_results
+    async def geocode_address(self, db, user, address):
+        body = await self._request(
+            MapsFunction.GEOCODE_ADDRESS.value, {"address": address}
+        )
+        return body.get("results", [])
+
+    @validate_async_api_results
+    async def reverse_geocode(self, db, user, latitude, longitude):
+        body = await self._request(
+            MapsFunction.REVERSE_GEOCODE.value, {"latlng": f"{latitude},{longitude}"}
+        )
+        return body.get("results", [])
+
+    @validate_async_api_results
+    async def search_nearby_places(
+        self,
+        db,
+        user,
+        latitude,
+        longitude,
+        radius=Radius.FIRST_RADIUS.value,
+        language="ko",
+        place_type: PLACETYPE = PLACETYPE.TRANSIT_STATION,
+        rank_by: RankBy = RankBy.PROMINENCE,
+    ) -> dict:
+        return await self._request(
+            MapsFunction.SEARCH_NEARBY_PLACES.value,
+            {
+                "location": f"{latitude},{longitude}",
+                "radius": radius if rank_by == RankBy.PROMINENCE else None,
+                "language": language,
+                "type": place_type.value,
+                "rankby": rank_by.value,
+            },
+        )
+
+    @validate_async_api_results
+    async def auto_complete_place(
+        self,
+        db,
+        user,
+        text: str,
+        location: LocationBase = None,
+        language="ko",
+        session_token: Optional[str] = None,
+    ) -> List[dict]:
+        body = await self._request(
+            MapsFunction.AUTO_COMPLETE_PLACE.value,
+            {
+                "input": text,
+                "sessiontoken": session_token,
+                "language": language,
+                "location": f"{location.latitude},{location.longitude}"
+                if location
+                else None,
+                "radius": Radius.AUTO_COMPLETE_RADIUS.value if location else None,
+            },
+        )
+        return body.get("predictions", [])
+
+    @validate_async_api_results
+    async def calculate_distance_matrix(
+        self,
+        db,
+        user,
+        **kwargs,
+    ) -> List[DistanceInfo]:
+        origins = _to_list(kwargs["origins"])
+        destinations = _to_list(kwargs["destinations"])
+        mode: TravelMode = kwargs["mode"]
+        is_place_id = kwargs["is_place_id"]
+
+        matrix = await self._request(
+            MapsFunction.CALCULATE_DISTANCE_MATRIX.value,
+            {
+                "origins": "|".join(origins),
+                "destinations": "|".join(
+                    self.format_destinations(destinations)
+                    if is_place_id
+                    else destinations
+                ),
+                "mode": mode.value,
+                "language": kwargs["language"],
+            },
+        )
+
+        return self._parse_distance_matrix(matrix, destinations, is_place_id)
 
 
 class MapServices:
-    def __init__(self, map_client):
+    def __init__(
+        self,
+        map_client,
+        client_registry: MapClientRegistry = None,
+        no_retry_map_client=None,
+    ):
         self._map_client = map_client
         self._map_adapter = MapAdapter(map_client)
+        self._no_retry_map_adapter = (
+            MapAdapter(no_retry_map_client)
+            if no_retry_map_client is not None
+            else self._map_adapter
+        )
+        self._client_registry = client_registry
         self.max_results = 20
 
     @property
@@ -249,15 +528,21 @@ class MapServices:
             (location.latitude, location.longitude) for location in existing_locations
         }
 
-        new_results = [
-            result
-            for result in results
-            if (
-                result["geometry"]["location"]["lat"],
-                result["geometry"]["location"]["lng"],
-            )
-            not in existing_lat_lngs
-        ]
+        # NOTE: 같은 좌표에 여러 장소가 있을 수 있어 좌표 기준으로 한 번만 생성
+        new_results = list(
+            {
+                (
+                    result["geometry"]["location"]["lat"],
+                    result["geometry"]["location"]["lng"],
+                ): result
+                for result in results
+                if (
+                    result["geometry"]["location"]["lat"],
+                    result["geometry"]["location"]["lng"],
+                )
+                not in existing_lat_lngs
+            }.values()
+        )
 
         new_locations = self._create_new_locations_from_result(new_results)
 
@@ -308,49 +593,276 @@ class MapServices:
 
         return existing_places + new_places
 
+    @staticmethod
+    def merge_nearby_places_results(responses: List[List[dict]]) -> List[dict]:
+        """
+        여러 Nearby Search 응답을 하나로 합치고 place_id 기준으로 중복을 제거합니다.
+        """
+        merged_results = {}
+        for results in responses:
+            for result in results or []:
+                merged_results.setdefault(result["place_id"], result)
+        return list(merged_results.values())
+
     def process_nearby_places_results(
-        self, db: Session, user: User, results: List[dict]
+        self, db: Session, user: User, results: List[dict], limit: Optional[int] = None
     ) -> List[Place]:
         locations = self.create_or_get_locations(db, results)
         location_ids_map = {(loc.latitude, loc.longitude): loc.id for loc in locations}
 
         places = self.create_or_get_places(db, results, location_ids_map)
 
-        return places[: self.max_results]
+        return places[: limit or self.max_results]
+
+    def _gather_api_calls(
+        self,
+        api_call_name: str,
+        db: Session,
+        user: User,
+        arguments: List[tuple | dict],
+    ) -> List:
+        """
+        같은 API를 여러 인자로 동시에 호출하고, 인자 순서대로 결과를 반환합니다.
+        하나라도 실패하면 실패 로그를 모두 저장한 뒤 첫 번째 실패를 다시 던집니다.
+        """
+        # NOTE: 이벤트 루프에서 Redis를 기다리지 않도록 기억한 실패를 gather 전에 한 번에 조회
+        negative_results = negative_cache.get_many(
+            api_call_name, [_split_arguments(args) for args in arguments]
+        )
+        for negative_result in negative_results:
+            if negative_result is not None:
+                raise _from_negative_result(negative_result)
+
+        async def gather(client: httpx.AsyncClient):
+            adapter = AsyncMapAdapter(client)
+            return await adapter.gather(
+                getattr(adapter, api_call_name),
+                db,
+                user,
+                arguments,
+                return_exceptions=True,
+            )
+
+        if self._client_registry is not None:
+            results = self._client_registry.run_with_async_client(gather)
+        else:
+
+            async def gather_with_new_client():
+                async with AsyncMapClientFactory.create_async_map_client() as client:
+                    return await gather(client)
+
+            results = asyncio.run(gather_with_new_client())
+
+        # NOTE: DB, Redis 저장은 공유 이벤트 루프를 막지 않도록 호출한 스레드에서 처리
+        errors = [
+            (_split_arguments(args), result)
+            for args, result in zip(arguments, results)
+            if isinstance(result, BaseException)
+        ]
+        for (args, kwargs), error in errors:
+            _handle_api_error(db, user, api_call_name, args, kwargs, error)
+        if errors:
+            raise errors[0][1]
+        return results
+
+    def _cache_geocode_result(self, db, redis_services, address: str, results):
+        location = results[0]["geometry"]["location"]
+
+        try:
+            crud.geocode.upsert(
+                db,
+                obj_in=GeocodeCreate(
+                    address=address, latitude=location["lat"], longitude=location["lng"]
+                ),
+            )
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning(f"Skipped storing geocode result: {address}")
+
+        try:
+            redis_services.cache_address_coordinates(
+                address, location["lat"], location["lng"]
+            )
+        except RedisOperationError:
+            logger.warning(f"Skipped caching geocode result: {address}")
+
+        return GeocodeResponse(latitude=location["lat"], longitude=location["lng"])
+
+    def _get_cached_address_coordinates(self, redis_services, address: str):
+        # NOTE: Redis 장애 시에는 캐시를 건너뛰고 DB, API 순으로 조회
+        try:
+            return redis_services.get_cached_address_coordinates(address)
+        except RedisOperationError:
+            logger.warning(f"Skipped geocode cache lookup: {address}")
+            return None
+
+    def _get_stored_geocodes(
+        self, db, redis_services, addresses: List[str]
+    ) -> Dict[str, GeocodeResponse]:
+        """
+        Redis에 없는 주소를 DB에서 찾고, 찾은 좌표로 Redis를 다시 채웁니다.
+        """
+        try:
+            geocodes = crud.geocode.get_by_addresses(db, addresses=addresses)
+        except SQLAlchemyError:
+            db.rollback()
+            logger.warning(f"Skipped geocode lookup in DB: {addresses}")
+            return {}
+
+        coordinates = {
+            geocode.address: (geocode.latitude, geocode.longitude)
+            for geocode in geocodes
+        }
+        if not coordinates:
+            return {}
+        geocode_hit_recorder.record(list(coordinates))
+
+        try:
+            redis_services.cache_addresses_coordinates(coordinates)
+        except RedisOperationError:
+            logger.warning(f"Skipped caching stored geocodes: {list(coordinates)}")
+
+        stored_geocodes = {}
+        for address in addresses:
+            if normalize_address(address) in coordinates:
+                latitude, longitude = coordinates[normalize_address(address)]
+                stored_geocodes[address] = GeocodeResponse(
+                    latitude=latitude, longitude=longitude
+                )
+        return stored_geocodes
+
+    def _get_cached_geocode(
+        self, redis_services, address: str
+    ) -> Optional[GeocodeResponse]:
+        cached_coordinates = self._get_cached_address_coordinates(
+            redis_services, address
+        )
+        if not cached_coordinates:
+            return None
+        return GeocodeResponse(
+            latitude=cached_coordinates["latitude"],
+            longitude=cached_coordinates["longitude"],
+        )
 
     def get_lat_lng_from_address(
         self, db: Session, user: User, address: str
     ) -> GeocodeResponse:
         redis_services = RedisServicesFactory.create_redis_services()
-        cached_coordinates = redis_services.get_cached_address_coordinates(address)
+        cached_geocode = self._get_cached_geocode(redis_services, address)
 
-        if cached_coordinates:
+        if cached_geocode:
             logger.info("Successfully cached Geocoding API response in Redis.")
-            return GeocodeResponse(
-                latitude=cached_coordinates["latitude"],
-                longitude=cached_coordinates["longitude"],
-            )
+            return cached_geocode
 
-        results = self._map_adapter.geocode_address(db, user, address)
+        stored_geocodes = self._get_stored_geocodes(db, redis_services, [address])
+        if address in stored_geocodes:
+            return stored_geocodes[address]
 
-        location = results[0]["geometry"]["location"]
-
-        redis_services.cache_address_coordinates(
-            address, location["lat"], location["lng"]
+        # NOTE: 같은 주소의 동시 캐시 미스는 한 번만 API를 호출
+        return single_flight.run(
+            redis_services,
+            geocode_key(address),
+            lambda: self._cache_geocode_result(
+                db,
+                redis_services,
+                address,
+                self._map_adapter.geocode_address(db, user, address),
+            ),
+            lambda: self._get_cached_geocode(redis_services, address),
         )
 
-        return GeocodeResponse(latitude=location["lat"], longitude=location["lng"])
-
     def get_address_from_lat_lng(
         self, db: Session, user: User, latitude: float, longitude: float
     ) -> str:
+        """
+        가까운 좌표는 같은 셀로 묶어 캐시된 주소를 재사용합니다.
+        """
+        redis_services = RedisServicesFactory.create_redis_services()
+        try:
+            cached_address = redis_services.get_cached_reverse_geocode(
+                latitude, longitude
+            )
+            if cached_address:
+                return ReverseGeocodeResponse(address=cached_address)
+        except RedisOperationError:
+            logger.warning(
+                f"Skipped reverse geocode cache lookup: {latitude}, {longitude}"
+            )
+
         result = self._map_adapter.reverse_geocode(db, user, latitude, longitude)
+        address = result[0]["formatted_address"]
+
+        try:
+            redis_services.cache_reverse_geocode(latitude, longitude, address)
+        except RedisOperationError:
+            logger.warning(f"Skipped caching reverse geocode: {latitude}, {longitude}")
+
+        return ReverseGeocodeResponse(address=address)
+
+    def get_geocoded_addresses(
+        self, db: Session, user: User, addresses: List[str]
+    ) -> List[GeocodeResponse]:
+        """
+        Redis, DB 순으로 찾고 둘 다 없는 주소만 모아 Geocoding API를 동시에 호출합니다.
+        표기만 다른 주소는 정규화한 주소 기준으로 한 번만 호출합니다.
+        """
+        redis_services = RedisServicesFactory.create_redis_services()
+        geocoded_addresses = {}
+        for address in dict.fromkeys(addresses):
+            cached_geocode = self._get_cached_geocode(redis_services, address)
+            if cached_geocode:
+                geocoded_addresses[address] = cached_geocode
+
+        uncached_addresses = [
+            address
+            for address in dict.fromkeys(addresses)
+            if address not in geocoded_addresses
+        ]
+        if uncached_addresses:
+            geocoded_addresses.update(
+                self._get_stored_geocodes(db, redis_services, uncached_addresses)
+            )
 
-        return ReverseGeocodeResponse(address=result[0]["formatted_address"])
+        missing_addresses = {}
+        for address in dict.fromkeys(addresses):
+            if address not in geocoded_addresses:
+                missing_addresses.setdefault(geocode_key(address), address)
+
+        def fetch_geocodes(keys: List[str]) -> List[GeocodeResponse]:
+            results_list = self._gather_api_calls(
+                MapsFunction.GEOCODE_ADDRESS.value,
+                db,
+                user,
+                [(missing_addresses[key],) for key in keys],
+            )
+            return [
+                self._cache_geocode_result(
+                    db, redis_services, missing_addresses[key], results
+                )
+                for key, results in zip(keys, results_list)
+            ]
+
+        if missing_addresses:
+            geocoded_addresses.update(
+                zip(
+                    missing_addresses,
+                    single_flight.run_many(
+                        redis_services,
+                        list(missing_addresses),
+                        fetch_geocodes,
+                        lambda keys: [
+                            self._get_cached_geocode(
+                                redis_services, missing_addresses[key]
+                            )
+                            for key in keys
+                        ],
+                    ),
+                )
+            )
 
-    def get_geocoded_addresses(self, db, user, aaddresses):
         return [
-            self.get_lat_lng_from_address(db, user, address) for address in aaddresses
+            geocoded_addresses.get(address) or geocoded_addresses[geocode_key(address)]
+            for address in addresses
         ]
 
     def get_nearby_places(
@@ -362,46 +874,143 @@ class MapServices:
         radius=Radius.FIRST_RADIUS.value,
         language="ko",
         place_type=PLACETYPE.TRANSIT_STATION,
+        retry_over_query_limit: bool = True,
     ) -> List[Place]:
         """
         주변 지역 검색 API 요청
+        오래된 캐시로 대신 응답할 수 있으면 retry_over_query_limit=False로
+        OVER_QUERY_LIMIT를 재시도하지 않고 바로 ApiError를 받습니다.
         """
+        map_adapter = (
+            self._map_adapter if retry_over_query_limit else self._no_retry_map_adapter
+        )
         redis_services = RedisServicesFactory.create_redis_services()
+        place_cache = PlaceCache(redis_services, place_type)
+        location_geohash = nearby_places_geohash(latitude, longitude, radius)
 
-        response = self._map_adapter.search_nearby_places(
-            db,
-            user,
-            latitude,
-            longitude,
-            radius=radius,
-            place_type=place_type,
-            language="ko",
+        def fetch_nearby_places() -> List[Place]:
+            response = map_adapter.search_nearby_places(
+                db,
+                user,
+                latitude,
+                longitude,
+                radius=radius,
+                place_type=place_type,
+                language="ko",
+            )
+            results = response["results"]
+
+            places = self.process_nearby_places_results(db, user, results)
+
+            try:
+                redis_services.cache_nearby_places_with_location(
+                    latitude, longitude, results, place_type, radius=radius
+                )
+                place_cache.set({location_geohash: places})
+                logger.info(
+                    "Successfully cached search_nearby_places API response in Redis."
+                )
+            except RedisOperationError:
+                logger.warning("Skipped caching search_nearby_places API response.")
+
+            # NOTE: 같은 결과를 기다린 다른 요청과 나눠 쓰므로 세션에 묶이지 않은 값으로 반환
+            return [deserialize_place(serialize_place(place)) for place in places]
+
+        def read_cached_nearby_places() -> Optional[List[Place]]:
+            try:
+                return place_cache.peek(location_geohash)
+            except RedisOperationError:
+                return None
+
+        return single_flight.run(
+            redis_services,
+            nearby_places_key(location_geohash, place_type),
+            fetch_nearby_places,
+            read_cached_nearby_places,
         )
-        results = response["results"]
 
-        if redis_services.cache_nearby_places_response(latitude, longitude, results):
-            logger.info(
-                "Successfully cached search_nearby_places API response in Redis."
-            )
-        if redis_services.add_location_to_redis(latitude, longitude):
-            logger.info("Successfully cached geolocation in Redis.")
+    def _get_cached_autocomplete(
+        self, autocomplete_cache: AutocompleteCache, text: str, bucket: Optional[str]
+    ) -> Optional[List[dict]]:
+        try:
+            return autocomplete_cache.get(text, bucket)
+        except RedisOperationError:
+            logger.warning(f"Skipped autocomplete cache lookup: {text}")
+            return None
 
-        return self.process_nearby_places_results(db, user, results)
+    def _cache_autocomplete(
+        self,
+        autocomplete_cache: AutocompleteCache,
+        text_predictions: dict,
+        bucket: Optional[str] = None,
+    ) -> None:
+        try:
+            autocomplete_cache.set(text_predictions, bucket)
+        except RedisOperationError:
+            logger.warning(f"Skipped caching autocomplete: {list(text_predictions)}")
 
     def get_complete_addresses(
         self, db: Session, user: User, addresses: List[str]
     ) -> List[str]:
-        complete_addresses = []
-        for address in addresses:
-            complete_addresses.append(
-                self.get_auto_completed_place(db, user, address)[0].address
+        """
+        캐시에 없는 주소만 모아 Places Autocomplete API를 동시에 호출합니다.
+        """
+        autocomplete_cache = AutocompleteCache(
+            RedisServicesFactory.create_redis_services()
+        )
+        predictions_by_address = {}
+        for address in dict.fromkeys(addresses):
+            predictions = self._get_cached_autocomplete(
+                autocomplete_cache, address, None
             )
-        return complete_addresses
+            if predictions:
+                predictions_by_address[address] = predictions
+
+        missing_addresses = [
+            address
+            for address in dict.fromkeys(addresses)
+            if address not in predictions_by_address
+        ]
+        if missing_addresses:
+            results_list = self._gather_api_calls(
+                MapsFunction.AUTO_COMPLETE_PLACE.value,
+                db,
+                user,
+                [(address,) for address in missing_addresses],
+            )
+            fetched_predictions = dict(zip(missing_addresses, results_list))
+            self._cache_autocomplete(autocomplete_cache, fetched_predictions)
+            predictions_by_address.update(fetched_predictions)
+
+        return [
+            predictions_by_address[address][0]["description"] for address in addresses
+        ]
 
     def get_auto_completed_place(
-        self, db: Session, user: User, text: str, location: LocationBase = None
+        self,
+        db: Session,
+        user: User,
+        text: str,
+        location: LocationBase = None,
+        session_token: Optional[str] = None,
     ) -> List[AutoCompletedPlace]:
-        results = self._map_adapter.auto_complete_place(db, user, text, location)
+        """
+        위치는 셀 단위로 묶어 캐싱하고, 캐시에 없을 때만 session_token과 함께 API를 호출합니다.
+        """
+        autocomplete_cache = AutocompleteCache(
+            RedisServicesFactory.create_redis_services()
+        )
+        bucket = location_bucket(location)
+        results = self._get_cached_autocomplete(autocomplete_cache, text, bucket)
+        if results is None:
+            results = self._map_adapter.auto_complete_place(
+                db,
+                user,
+                text,
+                bucket_center(bucket),
+                session_token=session_token,
+            )
+            self._cache_autocomplete(autocomplete_cache, {text: results}, bucket)
 
         return [
             AutoCompletedPlace(
@@ -444,16 +1053,134 @@ class MapServices:
             language="ko",
             is_place_id=is_place_id,
         )
-        distances: List[DistanceInfo] = self._map_adapter.calculate_distance_matrix(
-            db, user, **asdict(params)
+        if not is_place_id:
+            return self._fetch_distance_matrix(db, user, params)
+
+        return self._get_distance_matrix_with_cache(db, user, params)
+
+    def _fetch_distance_matrix(
+        self, db: Session, user: User, params: DistanceMatrixRequest
+    ) -> List[DistanceInfo]:
+        """
+        요청당 제한을 넘는 격자는 타일로 나눠 동시에 요청하고 원래 순서로 합칩니다.
+        """
+        origins = _to_list(params.origins)
+        destinations = _to_list(params.destinations)
+        tiles = plan_distance_matrix_tiles(len(origins), len(destinations))
+
+        if len(tiles) <= 1:
+            return self._map_adapter.calculate_distance_matrix(
+                db, user, **asdict(params)
+            )
+
+        tile_results = self._gather_api_calls(
+            MapsFunction.CALCULATE_DISTANCE_MATRIX.value,
+            db,
+            user,
+            [
+                asdict(
+                    replace(
+                        params,
+                        origins=origins[tile.origins],
+                        destinations=destinations[tile.destinations],
+                    )
+                )
+                for tile in tiles
+            ],
+        )
+        return merge_distance_matrix_tiles(
+            tiles, tile_results, len(origins), len(destinations)
         )
 
-        return distances
+    def _get_distance_matrix_with_cache(
+        self, db: Session, user: User, params: DistanceMatrixRequest
+    ) -> List[DistanceInfo]:
+        """
+        캐시에 없는 원소만 모아 한 번의 축소된 요청으로 Distance Matrix API를 호출하고,
+        결과를 origins x destinations 순서로 합쳐 반환합니다.
+        """
+        origins = _to_list(params.origins)
+        destinations = _to_list(params.destinations)
+
+        distance_matrix_cache = DistanceMatrixCache(
+            RedisServicesFactory.create_redis_services(), params.mode
+        )
+        try:
+            origin_cells = [
+                distance_matrix_cache.resolve_origin_cell(origin) for origin in origins
+            ]
+            elements = distance_matrix_cache.get(origin_cells, destinations)
+        except RedisOperationError:
+            logger.warning("Skipped distance matrix cache lookup.")
+            return self._fetch_distance_matrix(db, user, params)
+
+        missing_pairs = [
+            (origin_idx, destination_idx)
+            for origin_idx in range(len(origins))
+            for destination_idx in range(len(destinations))
+            if (origin_idx, destination_idx) not in elements
+        ]
+        if missing_pairs:
+            origin_indexes = sorted({origin_idx for origin_idx, _ in missing_pairs})
+            destination_indexes = sorted(
+                {destination_idx for _, destination_idx in missing_pairs}
+            )
+            distances = self._fetch_distance_matrix(
+                db,
+                user,
+                replace(
+                    params,
+                    origins=[origins[idx] for idx in origin_indexes],
+                    destinations=[destinations[idx] for idx in destination_indexes],
+                ),
+            )
+            fetched_elements = {
+                (
+                    origin_indexes[element_idx // len(destination_indexes)],
+                    destination_indexes[element_idx % len(destination_indexes)],
+                ): distance_info
+                for element_idx, distance_info in enumerate(distances)
+            }
+            try:
+                distance_matrix_cache.set(origin_cells, destinations, fetched_elements)
+            except RedisOperationError:
+                logger.warning("Skipped caching distance matrix elements.")
+            elements.update(fetched_elements)
+
+        return [
+            elements[(origin_idx, destination_idx)]
+            for origin_idx in range(len(origins))
+            for destination_idx in range(len(destinations))
+        ]
+
+
+class AsyncMapClientFactory:
+    @staticmethod
+    def create_async_map_client(transport=None) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.GOOGLE_MAPS_MAX_CONCURRENCY,
+                max_keepalive_connections=settings.GOOGLE_MAPS_MAX_CONCURRENCY,
+            ),
+            timeout=settings.GOOGLE_MAPS_TIMEOUT,
+            transport=transport,
+        )
 
 
 class MapServicesFactory:
     @staticmethod
-    def create_map_services(map_client=None):
-        if map_client is None:
-            map_client = googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
-        return MapServices(map_client=map_client)
+    def create_map_services(map_client=None, client_registry: MapClientRegistry = None):
+        if map_client is not None:
+            return MapServices(map_client=map_client, client_registry=client_registry)
+
+        if client_registry is not None:
+            map_client = client_registry.map_client
+            no_retry_map_client = client_registry.no_retry_map_client
+        else:
+            map_client = create_map_client()
+            no_retry_map_client = create_no_retry_map_client()
+        return MapServices(
+            map_client=map_client,
+            client_registry=client_registry,
+            no_retry_map_client=no_retry_map_client,
+        )
@@ -1,7 +1,8 @@
 import math
 from typing import List
 
-from haversine import haversine
+import numpy as np
+from haversine import haversine, haversine_vector
 
 from app.schemas.google_maps_api import GeocodeResponse
 
@@ -64,6 +65,22 @@ def harversine_distance(coord1: GeocodeResponse, coord2: GeocodeResponse, unit="
     )
 
 
+def harversine_distance_matrix(
+    origins: List[GeocodeResponse], destinations: List[GeocodeResponse], unit="m"
+) -> np.ndarray:
+    """
+    모든 출발지 x 목적지 쌍의 직선거리를 한 번에 계산합니다.
+
+    :return: (len(origins), len(destinations)) 크기의 거리 행렬
+    """
+    return haversine_vector(
+        [(origin.latitude, origin.longitude) for origin in origins],
+        [(destination.latitude, destination.longitude) for destination in destinations],
+        unit=unit,
+        comb=True,
+    ).T
+
+
 def calculate_midpoint_from_addresses(
     geocoded_addresses: List[GeocodeResponse],
 ) -> GeocodeResponse:
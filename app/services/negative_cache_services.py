@@ -0,0 +1,109 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import get_app_settings
+from app.services.cache_stats import get_cache_stats
+from app.services.constants import RedisKey
+from app.services.redis_services import (
+    RedisOperationError,
+    RedisServicesFactory,
+    negative_result_key,
+)
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# NOTE: 자동완성 세션 토큰은 과금 단위일 뿐 결과에 영향을 주지 않으므로 키에서 제외
+IGNORED_KWARGS = ("session_token",)
+
+
+def build_request(args: Tuple, kwargs: Dict) -> str:
+    return repr(
+        (
+            args,
+            sorted(
+                (name, value)
+                for name, value in kwargs.items()
+                if name not in IGNORED_KWARGS
+            ),
+        )
+    )
+
+
+class NegativeCache:
+    """
+    결과가 없거나 잘못된 입력으로 실패한 Google Maps 요청을 짧게 기억합니다.
+    같은 입력이 다시 들어오면 API 호출과 실패 로그 저장 없이 기억한 실패를 돌려줍니다.
+    Redis를 쓸 수 없으면 기억하지 않고 API를 호출합니다.
+    """
+
+    def __init__(self, ttl: int = settings.NEGATIVE_CACHE_TTL):
+        self.ttl = ttl
+        self.stats = get_cache_stats(RedisKey.NEGATIVE.value)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def build_key(self, api_call_name: str, args: Tuple, kwargs: Dict) -> str:
+        return negative_result_key(api_call_name, build_request(args, kwargs))
+
+    def get(self, api_call_name: str, args: Tuple, kwargs: Dict) -> Optional[Dict]:
+        if not self.enabled:
+            return None
+
+        redis_services = RedisServicesFactory.create_redis_services()
+        try:
+            result = redis_services.get_cached_negative_result(
+                self.build_key(api_call_name, args, kwargs)
+            )
+        except RedisOperationError:
+            return None
+
+        if result is None:
+            self.stats.record_misses()
+        else:
+            self.stats.record_hits()
+        return result
+
+    def get_many(
+        self, api_call_name: str, requests: List[Tuple[Tuple, Dict]]
+    ) -> List[Optional[Dict]]:
+        """
+        여러 요청의 기억한 실패를 Redis 왕복 한 번으로 조회합니다.
+        """
+        if not self.enabled or not requests:
+            return [None] * len(requests)
+
+        redis_services = RedisServicesFactory.create_redis_services()
+        try:
+            results = redis_services.get_cached_negative_results(
+                [
+                    self.build_key(api_call_name, args, kwargs)
+                    for args, kwargs in requests
+                ]
+            )
+        except RedisOperationError:
+            return [None] * len(requests)
+
+        hit_count = sum(1 for result in results if result is not None)
+        self.stats.record_hits(hit_count)
+        self.stats.record_misses(len(results) - hit_count)
+        return results
+
+    def set(self, api_call_name: str, args: Tuple, kwargs: Dict, result: Dict) -> None:
+        if not self.enabled:
+            return
+
+        redis_services = RedisServicesFactory.create_redis_services()
+        try:
+            redis_services.cache_negative_result(
+                self.build_key(api_call_name, args, kwargs), result, self.ttl
+            )
+        except RedisOperationError:
+            logger.warning(f"Negative result of {api_call_name} is not cached.")
+
+
+negative_cache = NegativeCache()
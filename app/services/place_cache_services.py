@@ -0,0 +1,97 @@
+from typing import Dict, List, Optional
+
+from app.schemas.place import Place, PlaceType
+from app.services.cache_stats import get_cache_stats
+from app.services.constants import PLACETYPE, RedisKey
+from app.services.redis_services import RedisServices, places_key
+
+
+def decode_geohash(geohash) -> str:
+    return geohash.decode("utf-8") if isinstance(geohash, bytes) else geohash
+
+
+def serialize_place(place) -> Dict:
+    """
+    DB에서 조회한 장소를 캐시에 저장할 최소한의 필드만 가진 dict로 변환합니다.
+    """
+    return {
+        "id": getattr(place, "id", None),
+        "place_id": place.place_id,
+        "name": place.name,
+        "address": place.address,
+        "user_ratings_total": place.user_ratings_total,
+        "rating": place.rating,
+        "location_id": place.location_id,
+        "place_types": [
+            getattr(place_type, "type_name", place_type)
+            for place_type in place.place_types or []
+        ],
+    }
+
+
+def deserialize_place(record: Dict) -> Place:
+    return Place(
+        **{
+            **record,
+            "place_types": [
+                PlaceType(type_name=type_name) for type_name in record["place_types"]
+            ],
+        }
+    )
+
+
+class PlaceCache:
+    """
+    Nearby Search 결과를 DB에 반영한 뒤의 장소를 (장소 유형, geohash) 단위로 msgpack으로 캐싱합니다.
+    원본 JSON 캐시와 달리 적중 시 JSON 파싱과 DB 조회 없이 바로 후보로 사용할 수 있습니다.
+    """
+
+    def __init__(self, redis_services: RedisServices, place_type: PLACETYPE):
+        self.redis_services = redis_services
+        self.place_type = PLACETYPE(place_type)
+        self.stats = get_cache_stats(RedisKey.PLACES.value)
+
+    def build_key(self, geohash) -> str:
+        return places_key(geohash, self.place_type)
+
+    def load(
+        self, geohash_records: Dict[str, Optional[List[Dict]]]
+    ) -> Dict[str, List[Place]]:
+        """
+        geohash별로 읽어온 캐시 레코드를 Place로 변환하고 적중/미스를 집계합니다.
+        """
+        cached = {
+            geohash: [deserialize_place(record) for record in records]
+            for geohash, records in geohash_records.items()
+            if records is not None
+        }
+
+        self.stats.record_hits(len(cached))
+        self.stats.record_misses(len(geohash_records) - len(cached))
+        return cached
+
+    def get(self, geohashes: List[str]) -> Dict[str, List[Place]]:
+        geohashes = [decode_geohash(geohash) for geohash in geohashes]
+        cached_records = self.redis_services.get_cached_place_records(
+            [self.build_key(geohash) for geohash in geohashes]
+        )
+        return self.load(dict(zip(geohashes, cached_records)))
+
+    def peek(self, geohash) -> Optional[List[Place]]:
+        """
+        적중/미스를 집계하지 않고 geohash 하나의 캐시를 읽습니다.
+        """
+        records = self.redis_services.get_cached_place_records(
+            [self.build_key(decode_geohash(geohash))]
+        )[0]
+        if records is None:
+            return None
+        return [deserialize_place(record) for record in records]
+
+    def set(self, geohash_places: Dict[str, List]) -> bool:
+        return self.redis_services.cache_place_records(
+            {
+                self.build_key(geohash): [serialize_place(place) for place in places]
+                for geohash, places in geohash_places.items()
+            }
+        )
@@ -1,22 +1,41 @@
 import logging
+import time
 from datetime import datetime
-from difflib import SequenceMatcher
-from typing import List, Tuple
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
+import googlemaps
 import pytz
 from sqlalchemy.orm import Session
 
+from app import crud
+from app.core.config import get_app_settings
 from app.models.user import User
 from app.schemas.google_maps_api import GeocodeResponse, UserPreferences
 from app.schemas.place import Place
-from app.services.constants import PLACETYPE, REDIS_SEARCH_RADIUS, Radius
-from app.services.filters_services import DistanceInfoFilter
-from app.services.map_services import MapServices
-from app.services.redis_services import RedisServicesFactory
+from app.services.cache_refresh_services import cache_refresher
+from app.services.constants import PLACETYPE, Radius
+from app.services.distance_matrix_cache_services import parse_lat_lng
+from app.services.filters_services import (
+    DistanceInfoFilter,
+    HaversinePreFilter,
+    prefilter_keep_count,
+)
+from app.services.map_services import MapServices, is_over_query_limit
+from app.services.place_cache_services import PlaceCache
+from app.services.redis_services import (
+    RedisOperationError,
+    RedisServicesFactory,
+    nearby_places_geohash,
+    nearby_places_key,
+)
 from app.services.routes_matrix_services import RoutesMatrix
+from app.services.user_profile_services import UserProfile
 
 from .midpoint_services import calculate_midpoint_from_addresses, harversine_distance
 
+settings = get_app_settings()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -49,25 +68,103 @@ class CandidateFetcher:
                 return Radius.THIRD_RADIUS.value
         return maximum_distance // 2
 
-    def _get_cached_places(self, latitude, longitude, redis_search_radius):
-        places = []
-        geohashes_in_radius = self.redis_services.find_geohashes_in_radius(
-            latitude, longitude, redis_search_radius
+    def _resolve_cached_responses(
+        self, cached_api_responses: Dict[str, List[dict]]
+    ) -> Dict[str, List[Place]]:
+        # NOTE: 겹치는 셀의 같은 장소를 먼저 합쳐 DB 조회/삽입을 한 번에 처리
+        merged_results = self.map_services.merge_nearby_places_results(
+            cached_api_responses.values()
         )
+        resolved_places = {
+            place.place_id: place
+            for place in self.map_services.process_nearby_places_results(
+                self.db,
+                self.user,
+                merged_results,
+                limit=self.map_services.max_results * len(cached_api_responses),
+            )
+        }
+        return {
+            geohash: [
+                resolved_places[result["place_id"]]
+                for result in results
+                if result["place_id"] in resolved_places
+            ]
+            for geohash, results in cached_api_responses.items()
+        }
 
-        cached_api_responses = self.redis_services.get_cached_nearby_places_responses(
-            geohashes_in_radius
+    def _get_cached_places(
+        self, latitude, longitude, api_search_radius, place_type
+    ) -> Tuple[List[Place], bool]:
+        """
+        검색 위치 주변 셀에 캐시된 장소와, 소프트 TTL이 지나지 않은 캐시가 하나도 없는지 여부를 반환합니다.
+        """
+        try:
+            cached_results = self.redis_services.find_cached_places_in_radius(
+                latitude, longitude, api_search_radius, place_type
+            )
+        except RedisOperationError:
+            # NOTE: Redis 장애 시 캐시 없이 API로 후보를 찾도록 빈 결과를 반환
+            logger.warning("Skipped nearby places cache lookup.")
+            return [], False
+        if not cached_results:
+            return [], False
+
+        now = time.time()
+        is_stale = not any(
+            fresh_until is not None and fresh_until > now
+            for *_, fresh_until in cached_results
         )
 
-        if any(response is not None for response in cached_api_responses):
+        place_cache = PlaceCache(self.redis_services, place_type)
+        cached_places = place_cache.load(
+            {geohash: place_records for geohash, place_records, *_ in cached_results}
+        )
+
+        cached_api_responses = {
+            geohash: response
+            for geohash, place_records, response, _ in cached_results
+            if place_records is None and response is not None
+        }
+        if cached_api_responses:
             logger.info("Found cached nearby places responses.")
-            for cached_api_response in cached_api_responses:
-                places.extend(
-                    self.map_services.process_nearby_places_results(
-                        self.db, self.user, cached_api_response
-                    )
-                )
-        return places
+            resolved_places = self._resolve_cached_responses(cached_api_responses)
+            try:
+                place_cache.set(resolved_places)
+            except RedisOperationError:
+                logger.warning("Skipped caching resolved places.")
+            cached_places.update(resolved_places)
+
+        places = list(
+            {
+                place.place_id: place
+                for geohash, *_ in cached_results
+                for place in cached_places.get(geohash, [])
+            }.values()
+        )
+        return places, is_stale
+
+    def _schedule_refresh(self, latitude, longitude, place_type, api_search_radius):
+        user_id = self.user.id
+        map_services = self.map_services
+
+        def refresh(db: Session):
+            map_services.get_nearby_places(
+                db,
+                crud.user.get(db, id=user_id),
+                latitude,
+                longitude,
+                place_type=place_type,
+                radius=api_search_radius,
+            )
+
+        cache_refresher.schedule(
+            nearby_places_key(
+                nearby_places_geohash(latitude, longitude, api_search_radius),
+                place_type,
+            ),
+            refresh,
+        )
 
     def fetch_places_by_coordinates(
         self,
@@ -76,19 +173,33 @@ class CandidateFetcher:
         place_type,
         api_search_radius=Radius.FIRST_RADIUS.value,
     ):
-        places = self._get_cached_places(latitude, longitude, REDIS_SEARCH_RADIUS)
+        places, is_stale = self._get_cached_places(
+            latitude, longitude, api_search_radius, place_type
+        )
+        if places and not is_stale:
+            return places
 
-        if not places:
-            places = self.map_services.get_nearby_places(
+        # NOTE: stale 캐시는 바로 응답하고 갱신은 백그라운드에서 진행
+        if places and settings.STALE_WHILE_REVALIDATE:
+            self._schedule_refresh(latitude, longitude, place_type, api_search_radius)
+            return places
+
+        try:
+            # NOTE: stale 캐시가 있으면 재시도로 기다리지 않고 바로 stale 캐시로 응답
+            return self.map_services.get_nearby_places(
                 self.db,
                 self.user,
                 latitude,
                 longitude,
                 place_type=place_type,
                 radius=api_search_radius,
+                retry_over_query_limit=not places,
             )
-
-        return places
+        except googlemaps.exceptions.ApiError as error:
+            if places and is_over_query_limit(error):
+                logger.warning("Serving stale nearby places due to over query limit.")
+                return places
+            raise
 
     def fetch_by_address(self, address: str, place_type: PLACETYPE) -> List[Place]:
         geocoded_address = self.map_services.get_lat_lng_from_address(
@@ -145,6 +256,69 @@ class Recommender:
             "recentness": lambda x: 1.5 if x <= 7 else 1.0,
         }
 
+    def _get_participant_coordinates(
+        self, addresses: List[str]
+    ) -> List[GeocodeResponse]:
+        coordinates = {}
+        for address in addresses:
+            lat_lng = parse_lat_lng(address)
+            if lat_lng:
+                coordinates[address] = GeocodeResponse(
+                    latitude=lat_lng[0], longitude=lat_lng[1]
+                )
+
+        # NOTE: 후보를 찾으면서 이미 geocode한 주소들이라 캐시에서 읽힘
+        addresses_to_geocode = [
+            address for address in addresses if address not in coordinates
+        ]
+        if addresses_to_geocode:
+            coordinates.update(
+                zip(
+                    addresses_to_geocode,
+                    self.map_services.get_geocoded_addresses(
+                        self.db, self.user, addresses_to_geocode
+                    ),
+                )
+            )
+        return [coordinates[address] for address in addresses]
+
+    def _get_candidate_coordinates(
+        self, candidates: List[Place]
+    ) -> Dict[str, GeocodeResponse]:
+        locations = crud.location.get_by_ids(
+            self.db,
+            ids=list(
+                {
+                    candidate.location_id
+                    for candidate in candidates
+                    if candidate.location_id
+                }
+            ),
+        )
+        location_map = {location.id: location for location in locations}
+
+        return {
+            candidate.place_id: GeocodeResponse(
+                latitude=location_map[candidate.location_id].latitude,
+                longitude=location_map[candidate.location_id].longitude,
+            )
+            for candidate in candidates
+            if candidate.location_id in location_map
+        }
+
+    def _prefilter_candidates(
+        self, addresses: List[str], candidates: List[Place]
+    ) -> List[Place]:
+        keep_count = prefilter_keep_count(self.user_preferences)
+        if keep_count is None or len(candidates) <= keep_count:
+            return candidates
+
+        return HaversinePreFilter(
+            self._get_participant_coordinates(addresses),
+            self._get_candidate_coordinates(candidates),
+            self.user_preferences,
+        ).apply(candidates)
+
     def _generate_routes_matrix(
         self, addresses: List[str], candidates: List[Place]
     ) -> RoutesMatrix:
@@ -173,14 +347,20 @@ class Recommender:
     def _compute_scores_for_candidates(
         self, candidates: List[Place]
     ) -> List[Tuple[Place, float]]:
+        # NOTE: 검색 기록 유사도는 후보 전체를 한 번에 계산
+        search_history_scores = self.user_profile.search_history_scores(
+            [candidate.address for candidate in candidates]
+        )
         return [
-            (candidate, self.compute_recommendation_score(candidate))
-            for candidate in candidates
+            (
+                candidate,
+                self.compute_recommendation_score(candidate, search_history_score),
+            )
+            for candidate, search_history_score in zip(
+                candidates, search_history_scores
+            )
         ]
 
-    def _compute_string_similarity(self, s1: str, s2: str) -> float:
-        return round(SequenceMatcher(None, s1, s2).ratio(), 2)
-
     def _compute_recentness_weight(self, searched_date: datetime) -> float:
         cur_utc_time = datetime.now(pytz.utc)
         assert cur_utc_time > searched_date
@@ -188,18 +368,27 @@ class Recommender:
         # NOTE: 최근 7일 이내에 검색된 장소는 더 높은 가중치를 받음
         return self.recommendation_weights["recentness"](days_since_searched)
 
-    def compute_recommendation_score(self, place: Place):
+    @cached_property
+    def user_profile(self) -> UserProfile:
+        # NOTE: 후보 장소를 저장하며 커밋하면 관계가 만료되므로 점수 계산 직전에 한 번에 불러옴
+        return UserProfile(
+            crud.user.load_profile(self.db, self.user),
+            self._compute_recentness_weight,
+        )
+
+    def compute_recommendation_score(
+        self, place: Place, search_history_score: Optional[float] = None
+    ):
         score = 0
 
-        if place in self.user.interested_places:
+        if self.user_profile.is_interested(place):
             score += self.recommendation_weights["interest"]
 
-        for history in self.user.search_history_relations:
-            similarity = self._compute_string_similarity(history.address, place.address)
-            recentness = self._compute_recentness_weight(history.created_at)
-            score += self.recommendation_weights["search"] * similarity * recentness
+        if search_history_score is None:
+            search_history_score = self.user_profile.search_history_score(place.address)
+        score += self.recommendation_weights["search"] * search_history_score
 
-        type_similarity = len(set(place.place_types) & set(self.user.preferred_types))
+        type_similarity = self.user_profile.count_preferred_types(place)
 
         score += self.recommendation_weights["type"] * type_similarity
 
@@ -236,6 +425,8 @@ class Recommender:
         candidates: List[Place],
         addresses: List[str],
     ) -> List[Place]:
+        candidates = self._prefilter_candidates(addresses, candidates)
+
         routes_matrix = self._generate_routes_matrix(addresses, candidates)
 
         self._update_routes_matrix_addresses(routes_matrix, candidates)
@@ -1,15 +1,45 @@
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
 
+import msgpack
 import redis
 
 from app.core.config import get_app_settings
-from app.services.constants import GEOHASH_PRECISION, REDIS_EXPIRE_TIME, RedisKey
-from app.utils import geohash_decode, geohash_encode
+from app.services.cache_stats import get_cache_stats
+from app.services.constants import (
+    AUTOCOMPLETE_EXPIRE_TIME,
+    DISTANCE_MATRIX_EXPIRE_TIME,
+    GEOCODE_EXPIRE_TIME,
+    NEARBY_PLACES_PRECISIONS,
+    NEARBY_PLACES_WIDEST_PRECISION,
+    PLACETYPE,
+    REDIS_EXPIRE_TIME,
+    REDIS_STALE_EXPIRE_TIME,
+    REVERSE_GEOCODE_EXPIRE_TIME,
+    REVERSE_GEOCODE_PRECISION,
+    Radius,
+    RedisKey,
+)
+from app.services.local_cache_services import (
+    MISSING,
+    LocalCache,
+    LocalCacheRegistry,
+    local_cache_registry,
+)
+from app.utils import geohash_encode, geohash_neighbors, normalize_address
 
 settings = get_app_settings()
 
+# (geohash, 장소 캐시, 원본 응답 캐시, stale이 되는 시각)
+CachedNearbyPlaces = Tuple[
+    str, Optional[List[Dict]], Optional[List[Dict]], Optional[float]
+]
+
 logging.basicConfig(level=logging.INFO)
 
 logger = logging.getLogger(__name__)
@@ -19,9 +49,123 @@ class RedisOperationError(Exception):
     pass
 
 
+class RedisUnavailableError(RedisOperationError):
+    pass
+
+
+# NOTE: 다른 요청이 새로 잡은 lease를 지우지 않도록 자신이 잡은 lease만 삭제
+RELEASE_LEASES_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call("GET", key) == ARGV[1] then
+        redis.call("DEL", key)
+    end
+end
+return true
+"""
+
+
+def geolocations_expiry_key(place_type: PLACETYPE) -> str:
+    """
+    장소 유형별로 캐시된 셀의 만료 시각(epoch 초)을 score로 가지는 sorted set 키.
+    """
+    return f"{RedisKey.GEOLOCATIONS_KEY.value}:{PLACETYPE(place_type).value}:expiry"
+
+
+def fresh_until(expires_at) -> Optional[float]:
+    """
+    보조 set에 기록된 만료 시각(하드 TTL)으로 stale이 되는 시각(소프트 TTL)을 계산합니다.
+    """
+    if expires_at is None:
+        return None
+    return float(expires_at) - (REDIS_STALE_EXPIRE_TIME - REDIS_EXPIRE_TIME)
+
+
+def nearby_places_precision(radius: float) -> int:
+    for max_radius, precision in NEARBY_PLACES_PRECISIONS:
+        if radius <= max_radius:
+            return precision
+    return NEARBY_PLACES_WIDEST_PRECISION
+
+
+def nearby_places_geohash(latitude: float, longitude: float, radius: float) -> str:
+    return geohash_encode(latitude, longitude, nearby_places_precision(radius))
+
+
+def nearby_places_cells(latitude: float, longitude: float, radius: float) -> List[str]:
+    """
+    검색 반경에 맞는 정밀도로 검색 위치가 속한 셀과 인접한 셀을 반환합니다.
+    셀 경계 근처의 검색도 가까운 셀의 캐시를 쓸 수 있도록 인접한 셀까지 조회합니다.
+    """
+    geohash = nearby_places_geohash(latitude, longitude, radius)
+    return [geohash, *geohash_neighbors(geohash)]
+
+
+def nearby_places_key(geohash, place_type: Optional[PLACETYPE] = None) -> str:
+    if isinstance(geohash, bytes):
+        geohash = geohash.decode("utf-8")
+    if place_type is None:
+        return geohash
+    return f"{RedisKey.NEARBY_PLACES.value}:{PLACETYPE(place_type).value}:{geohash}"
+
+
+def geocode_key(address: str) -> str:
+    return f"{RedisKey.GEOCODE.value}:{normalize_address(address)}"
+
+
+def reverse_geocode_key(latitude: float, longitude: float) -> str:
+    """
+    가까운 좌표끼리 같은 셀로 묶이도록 geohash로 양자화한 역지오코딩 키.
+    """
+    cell = geohash_encode(latitude, longitude, precision=REVERSE_GEOCODE_PRECISION)
+    return f"{RedisKey.REVERSE_GEOCODE.value}:{cell}"
+
+
+def negative_result_key(api_call_name: str, request: str) -> str:
+    """
+    요청 인자의 길이와 관계없이 키 길이가 일정하도록 해시합니다.
+    """
+    digest = hashlib.sha1(request.encode("utf-8")).hexdigest()
+    return f"{RedisKey.NEGATIVE.value}:{api_call_name}:{digest}"
+
+
+def lease_key(key: str) -> str:
+    return f"{RedisKey.LEASE.value}:{key}"
+
+
+def places_key(geohash, place_type: PLACETYPE) -> str:
+    if isinstance(geohash, bytes):
+        geohash = geohash.decode("utf-8")
+    return f"{RedisKey.PLACES.value}:{PLACETYPE(place_type).value}:{geohash}"
+
+
+def nearby_places_local_key(geohash: str, place_type: PLACETYPE) -> str:
+    return f"{PLACETYPE(place_type).value}:{geohash}"
+
+
+def nearby_places_local_keys(geohash: str, place_type: PLACETYPE) -> List[str]:
+    """
+    geohash 셀을 담고 있는 find_cached_places_in_radius의 L1 키를 반환합니다.
+    L1 항목은 검색 셀과 인접한 셀까지 담으므로 셀 자신과 인접한 셀 기준 키가 모두 해당됩니다.
+    """
+    return [
+        nearby_places_local_key(cell, place_type)
+        for cell in (geohash, *geohash_neighbors(geohash))
+    ]
+
+
+def nearby_places_local_keys_for(place_key: str) -> List[str]:
+    _, place_type, geohash = place_key.split(":", 2)
+    return nearby_places_local_keys(geohash, place_type)
+
+
 class RedisClientFactory:
+    # NOTE: Redis가 응답하지 않을 때 요청이 쌓이지 않도록 짧은 타임아웃을 둠
     redis_pool = redis.ConnectionPool(
-        host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=0,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
     )
 
     @staticmethod
@@ -29,124 +173,614 @@ class RedisClientFactory:
         return redis.StrictRedis(connection_pool=RedisClientFactory.redis_pool)
 
 
+class RedisCircuitBreaker:
+    """
+    Redis 연결 실패가 failure_threshold번 연속되면 회로를 열어 Redis 호출을 즉시 실패시킵니다.
+    회로가 열려 있는 동안 백그라운드 스레드가 recovery_interval마다 PING을 보내고 응답이 오면 닫습니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = settings.REDIS_CIRCUIT_FAILURE_THRESHOLD,
+        recovery_interval: float = settings.REDIS_CIRCUIT_RECOVERY_INTERVAL,
+        redis_client_factory=RedisClientFactory.create_redis_client,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_interval = recovery_interval
+        self._redis_client_factory = redis_client_factory
+        self._lock = threading.Lock()
+        self._failure_count = 0
+        self._is_open = False
+        self._probe_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def before_call(self) -> None:
+        if self._is_open:
+            raise RedisUnavailableError("Redis를 사용할 수 없어 캐시를 건너뜁니다.")
+
+    def record_success(self) -> None:
+        if self._failure_count:
+            with self._lock:
+                self._failure_count = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failure_count += 1
+            if self._is_open or self._failure_count < self.failure_threshold:
+                return
+            self._is_open = True
+            self._probe_thread = threading.Thread(
+                target=self._probe, name="redis-circuit-probe", daemon=True
+            )
+            self._probe_thread.start()
+        logger.warning("Redis circuit opened.")
+
+    def close(self) -> None:
+        with self._lock:
+            self._is_open = False
+            self._failure_count = 0
+            self._probe_thread = None
+        logger.info("Redis circuit closed.")
+
+    def _probe(self) -> None:
+        redis_client = self._redis_client_factory()
+        while self._is_open:
+            time.sleep(self.recovery_interval)
+            try:
+                redis_client.ping()
+            except redis.RedisError:
+                continue
+            self.close()
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "state": "open" if self._is_open else "closed",
+            "failure_count": self._failure_count,
+        }
+
+
+redis_circuit_breaker = RedisCircuitBreaker()
+
+
+def with_circuit_breaker(method):
+    """
+    회로가 열려 있으면 Redis를 호출하지 않고 RedisUnavailableError를 던지고,
+    연결/타임아웃 오류만 실패로 집계합니다.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        circuit_breaker = self._circuit_breaker
+        if circuit_breaker is None:
+            return method(self, *args, **kwargs)
+
+        circuit_breaker.before_call()
+        try:
+            result = method(self, *args, **kwargs)
+        except RedisOperationError as error:
+            if isinstance(error.__cause__, (redis.ConnectionError, redis.TimeoutError)):
+                circuit_breaker.record_failure()
+            raise
+        circuit_breaker.record_success()
+        return result
+
+    return wrapper
+
+
 class RedisServices:
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        local_caches: Optional[LocalCacheRegistry] = None,
+        circuit_breaker: Optional[RedisCircuitBreaker] = None,
+    ):
         self._redis_client = redis_client
+        self._local_caches = local_caches
+        self._circuit_breaker = circuit_breaker
+        self._release_leases_script = redis_client.register_script(
+            RELEASE_LEASES_SCRIPT
+        )
 
     @property
     def redis_client(self) -> redis.Redis:
         return self._redis_client
 
-    def cache_address_coordinates(
-        self, address: str, latitude: float, longitude: float
-    ) -> bool:
+    def _local_cache(self, name: str) -> Optional[LocalCache]:
+        if self._local_caches is None:
+            return None
+        return self._local_caches.get_cache(name)
+
+    def _invalidate_local_caches(
+        self, name: str, keys: Optional[List[str]] = None, prefix: Optional[str] = None
+    ) -> None:
+        if self._local_caches is not None:
+            self._local_caches.publish_invalidation(
+                self._redis_client, name, keys=keys, prefix=prefix
+            )
+
+    @with_circuit_breaker
+    def memory_snapshot(self) -> Dict[str, int]:
+        try:
+            return {
+                "entries": self._redis_client.dbsize(),
+                "bytes": self._redis_client.info("memory")["used_memory"],
+            }
+        except redis.RedisError as error:
+            logger.error(f"Error retrieving Redis memory info: {error}", exc_info=True)
+            raise RedisOperationError("Redis 메모리 정보를 조회하는 요청을 실패했습니다.") from error
+
+    @with_circuit_breaker
+    def _cache_json_values(self, name: str, values: Dict[str, object], ex: int) -> bool:
+        try:
+            with self._redis_client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(key, json.dumps(value), ex=ex)
+                is_cached = all(pipe.execute())
+            self._invalidate_local_caches(name, keys=list(values))
+            return is_cached
+        except redis.RedisError as error:
+            logger.error(f"Error caching {name} in Redis: {error}", exc_info=True)
+            raise RedisOperationError(f"{name} 결과를 Redis에 캐싱하는 요청을 실패했습니다.") from error
+
+    def _get_cached_json_value(self, name: str, key: str) -> Optional[object]:
+        """
+        L1 캐시, Redis 순으로 JSON 값을 조회하고 Redis에서 읽은 값은 L1 캐시에 채웁니다.
+        """
+        local_cache = self._local_cache(name)
+        if local_cache is not None:
+            value = local_cache.get(key)
+            if value is not MISSING:
+                return value
+
+        cached_value = self._get_cached_raw_value(name, key)
+        if not cached_value:
+            return None
+
+        value = json.loads(cached_value)
+        if local_cache is not None:
+            local_cache.set(key, value, len(cached_value))
+        return value
+
+    @with_circuit_breaker
+    def _get_cached_raw_value(self, name: str, key: str) -> Optional[bytes]:
+        stats = get_cache_stats(f"l2:{name}")
         try:
-            location_geohash = geohash_encode(
-                latitude, longitude, precision=GEOHASH_PRECISION
+            cached_value = self._redis_client.get(key)
+            if cached_value:
+                stats.record_hits()
+            else:
+                stats.record_misses()
+            return cached_value
+        except redis.RedisError as error:
+            logger.error(
+                f"Error retrieving cached {name} from Redis: {error}", exc_info=True
             )
+            raise RedisOperationError(
+                f"Redis에서 캐시된 {name} 결과를 검색하는 요청을 실패했습니다."
+            ) from error
+
+    def _get_cached_json_values(
+        self, name: str, keys: List[str]
+    ) -> List[Optional[object]]:
+        """
+        L1 캐시에 없는 키만 Redis에서 MGET 한 번으로 읽고, 읽은 값은 L1 캐시에 채웁니다.
+        """
+        if not keys:
+            return []
 
-            return (
-                self._redis_client.set(address, location_geohash, ex=REDIS_EXPIRE_TIME)
-                > 0
-            )  # 캐시 유효 시간은 1시간으로
+        local_cache = self._local_cache(name)
+        values = {}
+        if local_cache is not None:
+            for key in keys:
+                value = local_cache.get(key)
+                if value is not MISSING:
+                    values[key] = value
+
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            cached_values = self._get_cached_raw_values(name, missing_keys)
+            for key, cached_value in zip(missing_keys, cached_values):
+                values[key] = json.loads(cached_value) if cached_value else None
+                if cached_value and local_cache is not None:
+                    local_cache.set(key, values[key], len(cached_value))
+
+        return [values[key] for key in keys]
+
+    @with_circuit_breaker
+    def _get_cached_raw_values(
+        self, name: str, keys: List[str]
+    ) -> List[Optional[bytes]]:
+        stats = get_cache_stats(f"l2:{name}")
+        try:
+            cached_values = self._redis_client.mget(keys)
+
+            hit_count = sum(1 for cached_value in cached_values if cached_value)
+            stats.record_hits(hit_count)
+            stats.record_misses(len(cached_values) - hit_count)
+            return cached_values
         except redis.RedisError as error:
             logger.error(
-                f"Error caching address coordinates in Redis: {error}", exc_info=True
+                f"Error retrieving cached {name} from Redis: {error}", exc_info=True
             )
-            raise RedisOperationError("주소 좌표를 Redis에 캐싱하는 요청을 실패했습니다.") from error
+            raise RedisOperationError(
+                f"Redis에서 캐시된 {name} 결과를 검색하는 요청을 실패했습니다."
+            ) from error
+
+    def cache_address_coordinates(
+        self, address: str, latitude: float, longitude: float
+    ) -> bool:
+        return self.cache_addresses_coordinates({address: (latitude, longitude)})
+
+    def cache_addresses_coordinates(
+        self, addresses_coordinates: Dict[str, Tuple[float, float]]
+    ) -> bool:
+        """
+        정규화한 주소를 키로 좌표를 손실 없이 JSON [위도, 경도]로 저장합니다.
+        """
+        return self._cache_json_values(
+            RedisKey.GEOCODE.value,
+            {
+                geocode_key(address): [latitude, longitude]
+                for address, (latitude, longitude) in addresses_coordinates.items()
+            },
+            GEOCODE_EXPIRE_TIME,
+        )
 
     def get_cached_address_coordinates(
         self, address: str
     ) -> Optional[Dict[str, float]]:
-        try:
-            location_geohash = self._redis_client.get(address)
-            if location_geohash:
-                latitude, longitude = geohash_decode(location_geohash.decode("utf-8"))
-
-                return {"latitude": float(latitude), "longitude": float(longitude)}
+        coordinates = self._get_cached_json_value(
+            RedisKey.GEOCODE.value, geocode_key(address)
+        )
+        if coordinates is None:
             return None
+
+        latitude, longitude = coordinates
+        return {"latitude": latitude, "longitude": longitude}
+
+    def cache_reverse_geocode(
+        self, latitude: float, longitude: float, address: str
+    ) -> bool:
+        return self._cache_json_values(
+            RedisKey.REVERSE_GEOCODE.value,
+            {reverse_geocode_key(latitude, longitude): address},
+            REVERSE_GEOCODE_EXPIRE_TIME,
+        )
+
+    def get_cached_reverse_geocode(
+        self, latitude: float, longitude: float
+    ) -> Optional[str]:
+        return self._get_cached_json_value(
+            RedisKey.REVERSE_GEOCODE.value, reverse_geocode_key(latitude, longitude)
+        )
+
+    def cache_negative_result(self, key: str, result: Dict, ex: int) -> bool:
+        return self._cache_json_values(RedisKey.NEGATIVE.value, {key: result}, ex)
+
+    def get_cached_negative_result(self, key: str) -> Optional[Dict]:
+        return self._get_cached_json_value(RedisKey.NEGATIVE.value, key)
+
+    def get_cached_negative_results(self, keys: List[str]) -> List[Optional[Dict]]:
+        return self._get_cached_json_values(RedisKey.NEGATIVE.value, keys)
+
+    @with_circuit_breaker
+    def remove_expired_locations(self, now: Optional[float] = None) -> int:
+        """
+        만료 시각이 지난 셀을 모든 장소 유형의 만료 시각 set에서 한 번의 요청으로 제거하고
+        제거한 개수를 반환합니다.
+        """
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for place_type in PLACETYPE:
+                pipeline.zremrangebyscore(
+                    geolocations_expiry_key(place_type), "-inf", now or time.time()
+                )
+            return sum(pipeline.execute())
         except redis.RedisError as error:
             logger.error(
-                f"Error retrieving cached address coordinates from Redis: {error}",
+                f"Error removing expired geolocations from Redis: {error}",
                 exc_info=True,
             )
-            raise RedisOperationError("Redis에서 캐시된 주소 좌표를 검색하는 요청을 실패했습니다.") from error
+            raise RedisOperationError("만료된 geolocations을 제거하는 요청을 실패했습니다.") from error
 
-    def add_location_to_redis(self, latitude: float, longitude: float) -> bool:
+    @with_circuit_breaker
+    def cache_nearby_places_with_location(
+        self,
+        latitude: float,
+        longitude: float,
+        results: List[Dict],
+        place_type: Optional[PLACETYPE] = None,
+        radius: float = Radius.FIRST_RADIUS.value,
+    ) -> str:
+        """
+        응답 캐싱과 소프트 TTL 계산에 쓰는 만료 시각 기록을 MULTI/EXEC 한 번으로 처리하고
+        geohash를 반환합니다.
+        """
+        location_geohash = nearby_places_geohash(latitude, longitude, radius)
         try:
-            location_geohash = geohash_encode(latitude, longitude)
-
-            self._redis_client.geoadd(
-                RedisKey.GEOLOCATIONS_KEY.value, (longitude, latitude, location_geohash)
+            pipeline = self._redis_client.pipeline(transaction=True)
+            pipeline.set(
+                nearby_places_key(location_geohash, place_type),
+                json.dumps(results),
+                ex=REDIS_STALE_EXPIRE_TIME,
             )
+            # NOTE: 유형 없는 응답은 find_cached_places_in_radius가 읽지 않아
+            # 만료 시각도, L1 항목도 두지 않음
+            if place_type is not None:
+                pipeline.zadd(
+                    geolocations_expiry_key(place_type),
+                    {location_geohash: time.time() + REDIS_STALE_EXPIRE_TIME},
+                )
+            pipeline.execute()
+            if place_type is not None:
+                self._invalidate_local_caches(
+                    RedisKey.NEARBY_PLACES.value,
+                    keys=nearby_places_local_keys(location_geohash, place_type),
+                )
             return location_geohash
         except redis.RedisError as error:
-            logger.error(f"Error adding location to Redis: {error}", exc_info=True)
-            raise RedisOperationError("geolocations 캐싱하는 요청을 실패했습니다.") from error
+            logger.error(f"Error caching API response in Redis: {error}", exc_info=True)
+            raise RedisOperationError("API 응답을 Redis에 캐싱하는 요청을 실패했습니다.") from error
+
+    def find_cached_places_in_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        place_type: PLACETYPE,
+    ) -> List[CachedNearbyPlaces]:
+        """
+        검색 반경에 맞는 정밀도의 셀과 인접한 셀 중 캐시가 있는 셀의
+        (geohash, 장소 캐시, 원본 응답 캐시, stale이 되는 시각)을 한 번의 요청으로 조회합니다.
+        """
+        geohashes = nearby_places_cells(latitude, longitude, radius_m)
+        local_cache = self._local_cache(RedisKey.NEARBY_PLACES.value)
+        local_key = nearby_places_local_key(geohashes[0], place_type)
+        if local_cache is not None:
+            cached_results = local_cache.get(local_key)
+            if cached_results is not MISSING:
+                return cached_results
+
+        results = self._get_cached_places_in_cells(geohashes, place_type)
+        cached_results = [
+            (
+                geohash,
+                msgpack.unpackb(places) if places else None,
+                # NOTE: 장소 캐시가 있으면 원본 응답은 쓰지 않으므로 파싱하지 않음
+                json.loads(response.decode("utf-8"))
+                if response and not places
+                else None,
+                fresh_until(expires_at),
+            )
+            for geohash, places, response, expires_at in results
+        ]
+        if local_cache is not None and cached_results:
+            local_cache.set(
+                local_key,
+                cached_results,
+                sum(
+                    len(places or b"") + len(response or b"")
+                    for _, places, response, _ in results
+                ),
+            )
+        return cached_results
+
+    @with_circuit_breaker
+    def _get_cached_places_in_cells(
+        self, geohashes: List[str], place_type: PLACETYPE
+    ) -> List[Tuple[str, Optional[bytes], Optional[bytes], Optional[float]]]:
+        stats = get_cache_stats(f"l2:{RedisKey.NEARBY_PLACES.value}")
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            pipeline.mget(
+                [places_key(geohash, place_type) for geohash in geohashes]
+                + [nearby_places_key(geohash, place_type) for geohash in geohashes]
+            )
+            pipeline.zmscore(geolocations_expiry_key(place_type), geohashes)
+            cached_values, expires_at = pipeline.execute()
+
+            places, responses = (
+                cached_values[: len(geohashes)],
+                cached_values[len(geohashes) :],
+            )
+            results = [
+                result
+                for result in zip(geohashes, places, responses, expires_at)
+                if result[1] or result[2]
+            ]
+            if results:
+                stats.record_hits()
+            else:
+                stats.record_misses()
+            return results
+        except redis.RedisError as error:
+            logger.error(
+                f"Error retrieving cached places in cells from Redis: {error}",
+                exc_info=True,
+            )
+            raise RedisOperationError("셀별로 캐시된 장소를 검색하는 요청을 실패했습니다.") from error
 
-    def find_geohashes_in_radius(
-        self, latitude: float, longitude: float, radius_m: float
-    ) -> Optional[List[str]]:
+    @with_circuit_breaker
+    def get_cached_distance_infos(self, keys: List[str]) -> List[Optional[Dict]]:
+        if not keys:
+            return []
         try:
-            geohashes = self._redis_client.geosearch(
-                RedisKey.GEOLOCATIONS_KEY.value,
-                longitude=longitude,
-                latitude=latitude,
-                radius=radius_m,
-                unit="m",
+            results_json = self._redis_client.mget(keys)
+
+            return [
+                json.loads(item.decode("utf-8")) if item else None
+                for item in results_json
+            ]
+        except redis.RedisError as error:
+            logger.error(
+                f"Error retrieving cached distance infos from Redis: {error}",
+                exc_info=True,
             )
+            raise RedisOperationError("Redis에서 캐시된 거리 정보를 검색하는 요청을 실패했습니다.") from error
 
-            return geohashes
+    @with_circuit_breaker
+    def get_cached_autocomplete_predictions(
+        self, keys: List[str]
+    ) -> List[Optional[List[Dict]]]:
+        if not keys:
+            return []
+        try:
+            return [
+                json.loads(item) if item else None
+                for item in self._redis_client.mget(keys)
+            ]
         except redis.RedisError as error:
             logger.error(
-                f"Error retrieving geohashes from Redis: {error}", exc_info=True
+                f"Error retrieving cached autocomplete predictions from Redis: {error}",
+                exc_info=True,
             )
-            raise RedisOperationError("캐시된 범위내 geolocations을 요청을 실패했습니다.") from error
+            raise RedisOperationError(
+                "Redis에서 캐시된 자동완성 결과를 검색하는 요청을 실패했습니다."
+            ) from error
 
-    def cache_nearby_places_response(
-        self, latitude: float, longitude: float, results: List[Dict]
+    def cache_autocomplete_predictions(
+        self, predictions: Dict[str, List[Dict]]
     ) -> bool:
-        # NOTE:일단은 정밀도는 5를 사용
-        location_geohash = geohash_encode(latitude, longitude)
-        results_json = json.dumps(results)
+        return self._cache_json_values(
+            RedisKey.AUTOCOMPLETE.value, predictions, AUTOCOMPLETE_EXPIRE_TIME
+        )
+
+    @with_circuit_breaker
+    def cache_distance_infos(self, distance_infos: Dict[str, Dict]) -> bool:
+        if not distance_infos:
+            return False
         try:
-            return (
-                self._redis_client.set(
-                    location_geohash, results_json, ex=REDIS_EXPIRE_TIME
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key, distance_info in distance_infos.items():
+                pipeline.set(
+                    key, json.dumps(distance_info), ex=DISTANCE_MATRIX_EXPIRE_TIME
                 )
-                > 0
+
+            return all(pipeline.execute())
+        except redis.RedisError as error:
+            logger.error(
+                f"Error caching distance infos in Redis: {error}", exc_info=True
             )
+            raise RedisOperationError("거리 정보를 Redis에 캐싱하는 요청을 실패했습니다.") from error
+
+    def get_cached_place_records(self, keys: List[str]) -> List[Optional[List[Dict]]]:
+        if not keys:
+            return []
+
+        local_cache = self._local_cache(RedisKey.PLACES.value)
+        place_records = {}
+        if local_cache is not None:
+            for key in keys:
+                records = local_cache.get(key)
+                if records is not MISSING:
+                    place_records[key] = records
+
+        missing_keys = [key for key in keys if key not in place_records]
+        if missing_keys:
+            for key, item in zip(missing_keys, self._get_place_records(missing_keys)):
+                place_records[key] = msgpack.unpackb(item) if item else None
+                if item and local_cache is not None:
+                    local_cache.set(key, place_records[key], len(item))
+
+        return [place_records[key] for key in keys]
+
+    @with_circuit_breaker
+    def _get_place_records(self, keys: List[str]) -> List[Optional[bytes]]:
+        stats = get_cache_stats(f"l2:{RedisKey.PLACES.value}")
+        try:
+            results = self._redis_client.mget(keys)
+
+            hit_count = sum(1 for item in results if item)
+            stats.record_hits(hit_count)
+            stats.record_misses(len(results) - hit_count)
+            return results
         except redis.RedisError as error:
-            logger.error(f"Error caching API response in Redis: {error}", exc_info=True)
-            raise RedisOperationError("API 응답을 Redis에 캐싱하는 요청을 실패했습니다.") from error
+            logger.error(
+                f"Error retrieving cached places from Redis: {error}", exc_info=True
+            )
+            raise RedisOperationError("Redis에서 캐시된 장소를 검색하는 요청을 실패했습니다.") from error
 
-    def get_cached_nearby_places_responses(
-        self, geohashes: List[str]
-    ) -> Optional[List[Dict]]:
+    @with_circuit_breaker
+    def cache_place_records(self, place_records: Dict[str, List[Dict]]) -> bool:
+        if not place_records:
+            return False
         try:
-            results_json = self._redis_client.mget(geohashes)
-            responses = []
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key, records in place_records.items():
+                pipeline.set(key, msgpack.packb(records), ex=REDIS_STALE_EXPIRE_TIME)
 
-            for item in results_json:
-                if item:
-                    responses.append(json.loads(item.decode("utf-8")))
-                else:
-                    continue
+            is_cached = all(pipeline.execute())
+            self._invalidate_local_caches(
+                RedisKey.PLACES.value, keys=list(place_records)
+            )
+            # NOTE: 원본 응답만 담긴 주변 장소 L1 항목이 남아 있으면 DB에서 다시 변환하므로 함께 지움
+            self._invalidate_local_caches(
+                RedisKey.NEARBY_PLACES.value,
+                keys=list(
+                    {
+                        local_key
+                        for key in place_records
+                        for local_key in nearby_places_local_keys_for(key)
+                    }
+                ),
+            )
+            return is_cached
+        except redis.RedisError as error:
+            logger.error(f"Error caching places in Redis: {error}", exc_info=True)
+            raise RedisOperationError("장소를 Redis에 캐싱하는 요청을 실패했습니다.") from error
 
-            return responses
+    @with_circuit_breaker
+    def acquire_leases(self, keys: List[str], token: str, ttl: float) -> List[bool]:
+        """
+        키별로 lease를 SET NX PX로 잡고, 잡았는지 여부를 키 순서대로 반환합니다.
+        """
+        try:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.set(lease_key(key), token, nx=True, px=int(ttl * 1000))
+            return [bool(acquired) for acquired in pipeline.execute()]
         except redis.RedisError as error:
-            logger.error(
-                f"Error retrieving cached API responses for geohashes from Redis: {error}",
-                exc_info=True,
+            logger.error(f"Error acquiring leases in Redis: {error}", exc_info=True)
+            raise RedisOperationError("Redis에서 lease를 잡는 요청을 실패했습니다.") from error
+
+    @with_circuit_breaker
+    def release_leases(self, keys: List[str], token: str) -> None:
+        try:
+            self._release_leases_script(
+                keys=[lease_key(key) for key in keys], args=[token]
             )
-            raise RedisOperationError("Redis에서 캐시된 응답을 검색하는 요청을 실패했습니다.") from error
+        except redis.RedisError as error:
+            logger.error(f"Error releasing leases in Redis: {error}", exc_info=True)
+            raise RedisOperationError("Redis에서 lease를 해제하는 요청을 실패했습니다.") from error
+
+    @with_circuit_breaker
+    def get_held_leases(self, keys: List[str]) -> List[bool]:
+        try:
+            return [
+                lease is not None
+                for lease in self._redis_client.mget([lease_key(key) for key in keys])
+            ]
+        except redis.RedisError as error:
+            logger.error(f"Error retrieving leases from Redis: {error}", exc_info=True)
+            raise RedisOperationError("Redis에서 lease를 조회하는 요청을 실패했습니다.") from error
 
 
 class RedisServicesFactory:
     @staticmethod
     def create_redis_services(
         redis_client: Optional[redis.Redis] = None,
+        local_caches: Optional[LocalCacheRegistry] = local_cache_registry,
+        circuit_breaker: Optional[RedisCircuitBreaker] = None,
     ) -> RedisServices:
+        # NOTE: 공용 커넥션 풀을 쓸 때만 공용 circuit breaker로 상태를 공유함
         if redis_client is None:
             redis_client = RedisClientFactory.create_redis_client()
-        return RedisServices(redis_client=redis_client)
+            circuit_breaker = circuit_breaker or redis_circuit_breaker
+        return RedisServices(
+            redis_client=redis_client,
+            local_caches=local_caches,
+            circuit_breaker=circuit_breaker,
+        )
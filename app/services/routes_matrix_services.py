@@ -1,16 +1,29 @@
 import logging
+import math
 from collections import defaultdict, namedtuple
+from functools import cached_property
 from typing import List
 
+import numpy as np
+
 from app import crud
 from app.core.config import get_app_settings
 from app.crud.crud_place import CRUDPlaceFactory
 from app.models.place import Place
 from app.schemas.google_maps_api import DistanceInfo
-from app.schemas.place import PlaceUpdate
-from app.services.constants import AGGREGATED_ATTR
+from app.services.constants import (
+    AGGREGATED_ATTR,
+    AGGREGATION,
+    DISTANCE_MATRIX_MAX_DESTINATIONS,
+    DISTANCE_MATRIX_MAX_ELEMENTS,
+    DISTANCE_MATRIX_MAX_ORIGINS,
+)
 
 DestinationSummary = namedtuple("DestinationSummary", ("destination_id, total_value"))
+DistanceMatrixTile = namedtuple("DistanceMatrixTile", ("origins, destinations"))
+ColumnarRoutesMatrix = namedtuple(
+    "ColumnarRoutesMatrix", ("destination_ids, distance_value, duration_value, valid")
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,6 +31,66 @@ logger = logging.getLogger(__name__)
 app_settings = get_app_settings()
 
 
+def _split_evenly(length: int, max_size: int) -> List[slice]:
+    chunk_count = math.ceil(length / max_size)
+    chunk_size = math.ceil(length / chunk_count)
+    return [
+        slice(start, min(start + chunk_size, length))
+        for start in range(0, length, chunk_size)
+    ]
+
+
+def plan_distance_matrix_tiles(
+    origin_count: int,
+    destination_count: int,
+    max_origins: int = DISTANCE_MATRIX_MAX_ORIGINS,
+    max_destinations: int = DISTANCE_MATRIX_MAX_DESTINATIONS,
+    max_elements: int = DISTANCE_MATRIX_MAX_ELEMENTS,
+) -> List[DistanceMatrixTile]:
+    """
+    origins x destinations 격자를 API 요청당 제한을 넘지 않는 타일로 나눕니다.
+
+    :return: origins, destinations 범위를 slice로 가진 DistanceMatrixTile 리스트
+    """
+    if not origin_count or not destination_count:
+        return []
+
+    origins_per_tile = min(origin_count, max_origins, max_elements)
+    destinations_per_tile = min(
+        destination_count, max_destinations, max_elements // origins_per_tile
+    )
+
+    return [
+        DistanceMatrixTile(origins, destinations)
+        for origins in _split_evenly(origin_count, origins_per_tile)
+        for destinations in _split_evenly(destination_count, destinations_per_tile)
+    ]
+
+
+def merge_distance_matrix_tiles(
+    tiles: List[DistanceMatrixTile],
+    tile_results: List[List[DistanceInfo]],
+    origin_count: int,
+    destination_count: int,
+) -> List[DistanceInfo]:
+    """
+    타일별 결과를 원래 origins x destinations 순서의 한 리스트로 합칩니다.
+    """
+    elements = {}
+    for tile, distances in zip(tiles, tile_results):
+        tile_width = tile.destinations.stop - tile.destinations.start
+        for element_idx, distance_info in enumerate(distances):
+            origin_idx = tile.origins.start + element_idx // tile_width
+            destination_idx = tile.destinations.start + element_idx % tile_width
+            elements[(origin_idx, destination_idx)] = distance_info
+
+    return [
+        elements[(origin_idx, destination_idx)]
+        for origin_idx in range(origin_count)
+        for destination_idx in range(destination_count)
+    ]
+
+
 class RoutesMatrix:
     def __init__(self, distance_matrix: List[DistanceInfo]):
         self.distance_matrix = distance_matrix
@@ -38,31 +111,114 @@ class RoutesMatrix:
                 logger.info(
                     f"Updating address: {matrix.destination} != {candidate.address}"
                 )
-                updated_data = PlaceUpdate(
-                    place_id=candidate.place_id, address=matrix.destination
+                # NOTE: 캐시에서 읽은 후보는 세션에 없으므로 place_id로 직접 갱신
+                place_crud.update_address(
+                    db, place_id=candidate.place_id, address=matrix.destination
                 )
-                place_crud.update(db, db_obj=candidate, obj_in=updated_data)
+                candidate.address = matrix.destination
 
-    @property
+    @cached_property
     def group_by_destination(self) -> dict:
         destination_groups = defaultdict(list)
         for matrix in self.distance_matrix:
             destination_groups[matrix.destination_id].append(matrix)
         return destination_groups
 
+    @cached_property
+    def columnar(self) -> ColumnarRoutesMatrix:
+        """
+        distance_matrix를 (origin, destination) 인덱스의 int 배열로 변환합니다.
+        같은 목적지가 n번째로 등장한 원소를 n번째 출발지로 봅니다.
+        """
+        destination_index = {}
+        origin_index = defaultdict(int)
+        rows, cols, distances, durations = [], [], [], []
+        for matrix in self.distance_matrix:
+            col = destination_index.setdefault(
+                matrix.destination_id, len(destination_index)
+            )
+            rows.append(origin_index[col])
+            cols.append(col)
+            origin_index[col] += 1
+            distances.append(matrix.distance_value)
+            durations.append(matrix.duration_value)
+
+        shape = (max(origin_index.values(), default=0), len(destination_index))
+        distance_value = np.zeros(shape, dtype=np.int64)
+        duration_value = np.zeros(shape, dtype=np.int64)
+        # NOTE: 경로가 없는 원소(NOT_FOUND, ZERO_RESULTS)와 빈 칸은 valid가 False
+        valid = np.zeros(shape, dtype=bool)
+        for row, col, distance, duration in zip(rows, cols, distances, durations):
+            if distance is None or duration is None:
+                continue
+            distance_value[row, col] = distance
+            duration_value[row, col] = duration
+            valid[row, col] = True
+
+        return ColumnarRoutesMatrix(
+            list(destination_index), distance_value, duration_value, valid
+        )
+
+    def aggregate(
+        self, attribute: AGGREGATED_ATTR, aggregation: AGGREGATION = AGGREGATION.SUM
+    ) -> np.ndarray:
+        """
+        목적지별로 attribute를 집계합니다. 경로가 하나라도 없는 목적지는 inf입니다.
+        """
+        columnar = self.columnar
+        values = getattr(columnar, attribute.value)
+        if aggregation == AGGREGATION.MAX:
+            aggregated = values.max(axis=0, initial=0).astype(np.float64)
+        elif aggregation == AGGREGATION.VARIANCE:
+            aggregated = (
+                values.var(axis=0) if len(values) else np.zeros(values.shape[1])
+            )
+        else:
+            aggregated = values.sum(axis=0).astype(np.float64)
+
+        return np.where(columnar.valid.all(axis=0), aggregated, np.inf)
+
+    def top_k_destinations(
+        self,
+        attribute: AGGREGATED_ATTR,
+        count: int,
+        aggregation: AGGREGATION = AGGREGATION.SUM,
+    ) -> np.ndarray:
+        """
+        집계 값이 작은 순서로 count개 목적지의 열 인덱스를 반환합니다.
+        """
+        aggregated = self.aggregate(attribute, aggregation)
+        count = min(count, len(aggregated))
+        if count <= 0:
+            return np.array([], dtype=np.int64)
+
+        top_k = np.argpartition(aggregated, count - 1)[:count]
+        return top_k[np.argsort(aggregated[top_k], kind="stable")]
+
+    def top_k_destination_ids(
+        self,
+        attribute: AGGREGATED_ATTR,
+        count: int,
+        aggregation: AGGREGATION = AGGREGATION.SUM,
+    ) -> List[str]:
+        destination_ids = self.columnar.destination_ids
+        return [
+            destination_ids[idx]
+            for idx in self.top_k_destinations(attribute, count, aggregation)
+        ]
+
     def sort_destinations_by_aggregated_attr(
-        self, attribute: AGGREGATED_ATTR, count: int
+        self,
+        attribute: AGGREGATED_ATTR,
+        count: int,
+        aggregation: AGGREGATION = AGGREGATION.SUM,
     ) -> List[DestinationSummary]:
-        grouped_matrix = self.group_by_destination
-        results = sorted(
-            (
-                DestinationSummary(
-                    destination,
-                    sum(getattr(info, attribute.value) for info in info_list),
-                )
-                for destination, info_list in grouped_matrix.items()
-            ),
-            key=lambda x: x.total_value,
-        )[:count]
+        aggregated = self.aggregate(attribute, aggregation)
+        destination_ids = self.columnar.destination_ids
+        cast = float if aggregation == AGGREGATION.VARIANCE else int
 
-        return results
+        return [
+            DestinationSummary(destination_ids[idx], cast(aggregated[idx]))
+            for idx in self.top_k_destinations(attribute, count, aggregation)
+            if np.isfinite(aggregated[idx])
+        ]
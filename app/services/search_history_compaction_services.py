@@ -0,0 +1,83 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+import pytz
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import get_app_settings
+from app.db.session import SessionLocal
+from app.services.constants import SEARCH_HISTORY_PROFILE_SIZE
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SearchHistoryCompactor:
+    """
+    보관 기간이 지난 검색 기록과 사용자별로 추천에 반영하지 않는 오래된 검색 기록을
+    주기적으로 지우는 백그라운드 스레드입니다.
+    계정이 오래되어도 추천 점수 계산에서 읽는 검색 기록 수가 늘지 않도록
+    앱 시작 시 startup, 종료 시 shutdown이 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.SEARCH_HISTORY_COMPACTION_INTERVAL,
+        retention_days: int = settings.SEARCH_HISTORY_RETENTION_DAYS,
+        max_per_user: int = SEARCH_HISTORY_PROFILE_SIZE,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.interval = interval
+        self.retention_days = retention_days
+        self.max_per_user = max_per_user
+        self.session_factory = session_factory
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._thread is not None
+
+    def compact(self) -> int:
+        searched_after = datetime.now(pytz.utc) - timedelta(days=self.retention_days)
+        try:
+            with self.session_factory() as db:
+                removed_count = crud.user.compact_search_histories(
+                    db, searched_after=searched_after, max_per_user=self.max_per_user
+                )
+        except SQLAlchemyError:
+            # NOTE: 다음 주기에 다시 시도하면 되므로 스레드는 계속 돌게 둠
+            logger.warning("Failed to compact search histories.", exc_info=True)
+            return 0
+        if removed_count:
+            logger.info(f"Removed {removed_count} search histories.")
+        return removed_count
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.compact()
+
+    def startup(self) -> None:
+        if self.is_started:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="search-history-compactor", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        if not self.is_started:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+
+search_history_compactor = SearchHistoryCompactor()
@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from app.core.config import get_app_settings
+from app.services.redis_services import RedisOperationError, RedisServices
+
+settings = get_app_settings()
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 캐시 미스 중 하나만 API를 호출하고 나머지는 그 결과를 기다립니다.
+
+    워커 안에서는 키별 Future를 공유하고, 워커 사이에서는 Redis lease를 잡은 요청만 호출합니다.
+    lease를 못 잡은 요청은 lease가 풀리거나 캐시가 채워질 때까지 캐시를 다시 읽습니다.
+    Redis를 쓸 수 없으면 워커 안에서만 합칩니다.
+    """
+
+    def __init__(
+        self,
+        lease_ttl: float = settings.SINGLE_FLIGHT_LEASE_TTL,
+        wait_timeout: float = settings.SINGLE_FLIGHT_WAIT_TIMEOUT,
+        poll_interval: float = settings.SINGLE_FLIGHT_POLL_INTERVAL,
+    ):
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def run(
+        self,
+        redis_services: RedisServices,
+        key: str,
+        fetch: Callable[[], T],
+        read_cached: Callable[[], Optional[T]],
+    ) -> T:
+        return self.run_many(
+            redis_services,
+            [key],
+            lambda keys: [fetch()],
+            lambda keys: [read_cached()],
+        )[0]
+
+    def run_many(
+        self,
+        redis_services: RedisServices,
+        keys: List[str],
+        fetch_many: Callable[[List[str]], List[T]],
+        read_cached_many: Callable[[List[str]], List[Optional[T]]],
+    ) -> List[T]:
+        """
+        fetch_many는 결과를 캐시에 쓴 뒤 키 순서대로 결과를 반환해야 하고,
+        read_cached_many는 캐시에 없는 키에 대해 None을 반환해야 합니다.
+        """
+        leader_keys, followers = [], {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._futures:
+                    followers[key] = self._futures[key]
+                else:
+                    self._futures[key] = Future()
+                    leader_keys.append(key)
+
+        results = {}
+        try:
+            results.update(
+                self._run_as_leader(
+                    redis_services, leader_keys, fetch_many, read_cached_many
+                )
+            )
+        except Exception as error:
+            self._resolve(leader_keys, error=error)
+            raise
+        self._resolve(leader_keys, results=results)
+
+        for key, future in followers.items():
+            try:
+                results[key] = future.result(timeout=self.wait_timeout)
+            except FutureTimeoutError:
+                logger.warning(f"Timed out waiting for in-flight request: {key}")
+                results[key] = fetch_many([key])[0]
+
+        return [results[key] for key in keys]
+
+    def _resolve(
+        self,
+        keys: List[str],
+        results: Optional[Dict[str, T]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        with self._lock:
+            futures = [self._futures.pop(key) for key in keys]
+        for key, future in zip(keys, futures):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[key])
+
+    def _run_as_leader(
+        self,
+        redis_services: RedisServices,
+        keys: List[str],
+        fetch_many: Callable[[List[str]], List[T]],
+        read_cached_many: Callable[[List[str]], List[Optional[T]]],
+    ) -> Dict[str, T]:
+        if not keys:
+            return {}
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = redis_services.acquire_leases(keys, token, self.lease_ttl)
+        except RedisOperationError:
+            return dict(zip(keys, fetch_many(keys)))
+
+        fetch_keys = [key for key, is_acquired in zip(keys, acquired) if is_acquired]
+        waiting_keys = [
+            key for key, is_acquired in zip(keys, acquired) if not is_acquired
+        ]
+
+        results = {}
+        if fetch_keys:
+            try:
+                results.update(zip(fetch_keys, fetch_many(fetch_keys)))
+            finally:
+                try:
+                    redis_services.release_leases(fetch_keys, token)
+                except RedisOperationError:
+                    logger.warning(f"Leases expire without release: {fetch_keys}")
+
+        if waiting_keys:
+            results.update(
+                self._wait_for_other_workers(
+                    redis_services, waiting_keys, fetch_many, read_cached_many
+                )
+            )
+        return results
+
+    def _wait_for_other_workers(
+        self,
+        redis_services: RedisServices,
+        keys: List[str],
+        fetch_many: Callable[[List[str]], List[T]],
+        read_cached_many: Callable[[List[str]], List[Optional[T]]],
+    ) -> Dict[str, T]:
+        """
+        다른 워커가 캐시를 채우기를 기다리고, lease가 풀렸는데도 캐시가 없거나
+        시간이 지나면 남은 키는 직접 호출합니다.
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        pending = keys
+        released = set()
+        results = {}
+        try:
+            while pending:
+                for key, cached in zip(pending, read_cached_many(pending)):
+                    if cached is not None:
+                        results[key] = cached
+                pending = [
+                    key for key in pending if key not in results and key not in released
+                ]
+                if not pending or time.monotonic() >= deadline:
+                    break
+
+                # NOTE: 캐시를 쓴 뒤 lease를 풀기 때문에 풀린 키는 한 번 더 캐시를 읽고 결정
+                held = redis_services.get_held_leases(pending)
+                newly_released = {
+                    key for key, is_held in zip(pending, held) if not is_held
+                }
+                released.update(newly_released)
+                if len(newly_released) < len(pending):
+                    time.sleep(self.poll_interval)
+        except RedisOperationError:
+            logger.warning(f"Stopped waiting for other workers: {keys}")
+
+        missing_keys = [key for key in keys if key not in results]
+        if missing_keys:
+            results.update(zip(missing_keys, fetch_many(missing_keys)))
+        return results
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from app.models.user import User
+from app.schemas.place import Place
+from app.services.address_similarity_services import AddressSimilarityIndex
+from app.services.constants import SEARCH_HISTORY_PROFILE_SIZE
+
+
+def place_type_names(place_types) -> frozenset:
+    # NOTE: 캐시에서 읽은 후보는 ORM 객체가 아니라서 type_name으로 비교
+    return frozenset(
+        getattr(place_type, "type_name", place_type) for place_type in place_types
+    )
+
+
+class UserProfile:
+    """
+    추천 점수 계산에 쓰는 사용자 특징을 요청마다 한 번만 만들어 둡니다.
+
+    관심 장소 id, 선호 장소 유형, 주소별로 최근성 가중치를 곱한 검색 기록의 n-gram 색인을
+    미리 만들어 후보마다 관계를 다시 읽거나 검색 기록 전체를 다시 계산하지 않습니다.
+    검색 기록은 마지막 검색 시각 기준 최근 history_size개 주소만 반영합니다.
+    """
+
+    def __init__(
+        self,
+        user: User,
+        recentness_weight: Callable[[datetime], float],
+        history_size: int = SEARCH_HISTORY_PROFILE_SIZE,
+    ):
+        self.interested_place_ids = frozenset(
+            place.place_id for place in user.interested_places
+        )
+        self.preferred_type_names = place_type_names(user.preferred_types)
+
+        # NOTE: 검색 기록은 주소별로 모여 있으므로 마지막 검색 시각의 가중치를 검색 횟수만큼 반영
+        histories = sorted(
+            user.search_history_relations,
+            key=lambda history: history.last_searched_at,
+            reverse=True,
+        )[:history_size]
+        self.search_history_weights: Dict[str, float] = {
+            history.address: history.hit_count
+            * recentness_weight(history.last_searched_at)
+            for history in histories
+        }
+        self.search_history_index = AddressSimilarityIndex(self.search_history_weights)
+
+    def is_interested(self, place: Place) -> bool:
+        return place.place_id in self.interested_place_ids
+
+    def count_preferred_types(self, place: Place) -> int:
+        return len(place_type_names(place.place_types) & self.preferred_type_names)
+
+    def search_history_scores(self, addresses: List[str]) -> List[float]:
+        """
+        검색 기록 주소와 후보 주소의 유사도에 최근성 가중치를 곱해 더한 점수를 한 번에 계산합니다.
+        """
+        return self.search_history_index.score_many(addresses)
+
+    def search_history_score(self, address: str) -> float:
+        return self.search_history_scores([address])[0]
@@ -6,16 +6,22 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app import crud
+from app.api.deps import get_map_services
 from app.core.settings.app import AppSettings
+from app.crud.crud_place import CRUDPlaceFactory
 from app.services.constants import PLACETYPE
-from app.services.recommend_services import Recommender
+from app.services.recommend_services import CandidateFetcher, Recommender
 from app.tests.utils.places import (
     auto_completed_place_schema,
+    create_random_place,
     distance_info_list,
+    distance_infos_to,
     mock_place_obj,
     places_list,
     test_address,
 )
+from app.tests.utils.queries import assert_max_queries
+from main import app
 
 
 def test_recommend_places_based_on_requested_address(
@@ -93,6 +99,51 @@ def test_recommend_places_based_on_current_location_without_latest_location(
         mock_recommender.recommend_places_by_location.assert_called_once()
 
 
+def test_recommend_places_based_on_current_location_query_budget(
+    client: TestClient,
+    db: Session,
+    client_engine,
+    settings: AppSettings,
+    normal_user_token_headers,
+):
+    current_user = crud.user.get_by_email(db, email=settings.EMAIL_TEST_USER)
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    places = [create_random_place(db, crud_place=crud_place) for _ in range(5)]
+    crud.user.mark_interest(db, current_user, places[0])
+    candidates = crud_place.get_by_place_ids(db, [place.place_id for place in places])
+    map_services = MagicMock()
+    map_services.get_distance_matrix_for_places.return_value = distance_infos_to(
+        candidates, "37.0,127.0"
+    )
+
+    def recommend():
+        return client.post(
+            f"{settings.API_V1_STR}/places/recommendations/by-location",
+            json={"latitude": 37.0, "longitude": 127.0},
+            headers=normal_user_token_headers,
+            params={"place_type": PLACETYPE.CAFE.value, "max_results": 5},
+        )
+
+    app.dependency_overrides[get_map_services] = lambda: map_services
+    try:
+        with patch.object(
+            CandidateFetcher, "fetch_places_by_coordinates", return_value=candidates
+        ):
+            # NOTE: 첫 요청에서 위치 기록이 추가될 수 있으므로 두 번째 요청의 쿼리 수를 셈
+            recommend()
+            # NOTE: 인증 사용자, 마지막 위치, 사용자 프로필(사용자, 관심 장소, 장소 유형,
+            # 검색 기록) 조회. 후보의 place_types는 다시 읽지 않아야 함
+            with assert_max_queries(client_engine, 6), assert_max_queries(
+                db.get_bind(), 0
+            ):
+                response = recommend()
+    finally:
+        del app.dependency_overrides[get_map_services]
+
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+
+
 def test_read_place_by_id(
     client: TestClient,
     db: Session,
@@ -130,6 +181,48 @@ def test_read_places(
         mock_get_multi.assert_called_once()
 
 
+def test_read_place_by_id_query_budget(
+    client: TestClient,
+    db: Session,
+    client_engine,
+    settings: AppSettings,
+    normal_user_token_headers: Dict[str, str],
+):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    place = create_random_place(db, crud_place=crud_place)
+
+    # NOTE: 사용자 조회, 장소 조회, place_types 조회
+    with patch("app.crud.place", crud_place), assert_max_queries(client_engine, 3):
+        response = client.get(
+            f"{settings.API_V1_STR}/places/{place.place_id}",
+            headers=normal_user_token_headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json()["place_types"]
+
+
+def test_read_places_query_budget(
+    client: TestClient,
+    db: Session,
+    client_engine,
+    settings: AppSettings,
+    normal_user_token_headers: Dict[str, str],
+):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    for _ in range(3):
+        create_random_place(db, crud_place=crud_place)
+
+    # NOTE: 장소 수와 관계없이 사용자 조회, 장소 목록 조회, place_types 조회
+    with patch("app.crud.place", crud_place), assert_max_queries(client_engine, 3):
+        response = client.get(
+            f"{settings.API_V1_STR}/places", headers=normal_user_token_headers
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()) >= 3
+
+
 def test_read_auto_completed_places(
     client: TestClient, settings: AppSettings, normal_user_token_headers
 ):
@@ -144,7 +237,9 @@ def test_read_auto_completed_places(
 
         assert response.status_code == 200
         assert len(response.json()) == 1
-        mock_auto_complete.assert_called_once_with(ANY, ANY, test_address, None)
+        mock_auto_complete.assert_called_once_with(
+            ANY, ANY, test_address, None, session_token=None
+        )
 
 
 def test_get_distance_matrix(
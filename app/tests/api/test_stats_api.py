@@ -0,0 +1,47 @@
+from fastapi.testclient import TestClient
+
+from app.core.settings.app import AppSettings
+
+
+def test_read_map_client_stats(
+    client: TestClient, settings: AppSettings, superuser_token_headers
+):
+    response = client.get(
+        f"{settings.API_V1_STR}/stats/map-clients", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
+
+
+def test_read_map_client_stats_normal_user(
+    client: TestClient, settings: AppSettings, normal_user_token_headers
+):
+    response = client.get(
+        f"{settings.API_V1_STR}/stats/map-clients", headers=normal_user_token_headers
+    )
+
+    assert response.status_code == 400
+
+
+def test_read_cache_stats(
+    client: TestClient, settings: AppSettings, superuser_token_headers
+):
+    response = client.get(
+        f"{settings.API_V1_STR}/stats/caches", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    for cache_stat in response.json().values():
+        assert {"hits", "misses", "hit_ratio"} <= set(cache_stat)
+
+
+def test_read_cache_memory_stats(
+    client: TestClient, settings: AppSettings, superuser_token_headers
+):
+    response = client.get(
+        f"{settings.API_V1_STR}/stats/caches/memory", headers=superuser_token_headers
+    )
+
+    assert response.status_code == 200
+    assert {"entries", "bytes"} <= set(response.json()["l2:redis"])
@@ -32,6 +32,26 @@ def test_get_users_normal_user_me(
     assert current_user["email"] == settings.EMAIL_TEST_USER
 
 
+def test_get_users_normal_user_me_locations(
+    client: TestClient,
+    db: Session,
+    normal_user_token_headers: Dict[str, str],
+    settings: AppSettings,
+) -> None:
+    user = crud.user.get_by_email(db, email=settings.EMAIL_TEST_USER)
+    crud.user.add_location_history(db, user, 37.5, 127.0)
+
+    r = client.get(
+        f"{settings.API_V1_STR}/users/me/locations",
+        headers=normal_user_token_headers,
+        params={"limit": 1},
+    )
+    locations = r.json()
+    assert r.status_code == 200
+    assert len(locations) == 1
+    assert locations[0]["latitude"] == 37.5
+
+
 def test_create_user_new_email(
     client: TestClient,
     superuser_token_headers: dict,
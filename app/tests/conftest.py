@@ -64,6 +64,12 @@ def client() -> Generator:
         yield c
 
 
+@pytest.fixture(scope="session")
+def client_engine():
+    # NOTE: client 요청은 global_db를 쓰므로 쿼리 수를 셀 때 이 engine을 봐야 함
+    return engine
+
+
 @pytest.fixture(scope="session")
 def settings() -> Generator:
     yield get_app_settings()
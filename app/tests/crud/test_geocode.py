@@ -0,0 +1,46 @@
+from sqlalchemy.orm import Session
+
+from app.core.settings.app import AppSettings
+from app.crud.crud_geocode import CRUDGeocodeFactory
+from app.schemas.geocode import GeocodeCreate
+
+
+def test_upsert_and_get_by_addresses(db: Session, settings: AppSettings):
+    crud_geocode = CRUDGeocodeFactory.get_instance(settings.APP_ENV, False)
+
+    crud_geocode.upsert(
+        db, obj_in=GeocodeCreate(address="판교역", latitude=37.394776, longitude=127.11116)
+    )
+    geocodes = crud_geocode.get_by_addresses(db, addresses=[" 판교역  "])
+
+    assert len(geocodes) == 1
+    assert geocodes[0].latitude == 37.394776
+    assert geocodes[0].longitude == 127.11116
+    # NOTE: 조회만으로는 조회 횟수를 바꾸지 않음
+    assert geocodes[0].hit_count == 1
+
+
+def test_get_most_hit(db: Session, settings: AppSettings):
+    crud_geocode = CRUDGeocodeFactory.get_instance(settings.APP_ENV, False)
+    for address in ["판교역", "강남역"]:
+        crud_geocode.upsert(
+            db, obj_in=GeocodeCreate(address=address, latitude=37.0, longitude=127.0)
+        )
+    crud_geocode.add_hits(db, hits={"강남역": 2, "없는역": 1})
+
+    geocodes = crud_geocode.get_most_hit(db, limit=1)
+
+    assert [geocode.address for geocode in geocodes] == ["강남역"]
+
+
+def test_memory_get_most_hit(settings: AppSettings):
+    crud_geocode = CRUDGeocodeFactory.get_instance(settings.APP_ENV)
+    for address in ["판교역", "강남역"]:
+        crud_geocode.upsert(
+            None, obj_in=GeocodeCreate(address=address, latitude=37.0, longitude=127.0)
+        )
+    crud_geocode.add_hits(None, hits={"강남역": 1})
+
+    geocodes = crud_geocode.get_most_hit(None, limit=1)
+
+    assert [geocode.address for geocode in geocodes] == ["강남역"]
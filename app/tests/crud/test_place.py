@@ -5,6 +5,7 @@ from app.crud.crud_place import CRUDPlaceFactory
 from app.models.place import PlaceType
 from app.schemas.place import PlaceUpdate
 from app.tests.utils.places import create_random_place
+from app.tests.utils.queries import count_queries
 
 
 def test_create_place(db: Session, settings: AppSettings):
@@ -25,6 +26,21 @@ def test_get_by_place_id(db: Session, settings: AppSettings):
     assert stored_place.place_id == place.place_id
 
 
+def test_get_by_place_ids_loads_place_types(db: Session, settings: AppSettings):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    places = [create_random_place(db, crud_place=crud_place) for _ in range(3)]
+
+    with count_queries(db.get_bind()) as statements:
+        stored_places = crud_place.get_by_place_ids(
+            db, [place.place_id for place in places]
+        )
+        place_types = [place.place_types for place in stored_places]
+
+    # NOTE: 장소 수와 관계없이 장소 조회와 place_types 조회 두 번
+    assert len(statements) == 2
+    assert all(types[0].type_name == "cafe" for types in place_types)
+
+
 def test_update_place_name(db: Session, settings: AppSettings):
     crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
 
@@ -1,3 +1,6 @@
+from datetime import datetime, timedelta
+
+import pytz
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
@@ -8,7 +11,9 @@ from app.crud.crud_location import CRUDLocationFactory
 from app.crud.crud_place import CRUDPlaceFactory
 from app.schemas.user import UserCreate, UserUpdate
 from app.tests.utils.places import create_random_location, create_random_place
+from app.tests.utils.queries import count_queries
 from app.tests.utils.utils import random_email, random_lower_string
+from app.utils import normalize_address
 
 
 def test_create_user(db: Session) -> None:
@@ -147,13 +152,69 @@ def test_add_search_history(db: Session, normal_user, settings: AppSettings) ->
     place = create_random_place(db, crud_place)
     crud.user.add_search_history(db, normal_user, place.address)
     assert len(normal_user.search_history_relations) == 1
-    assert place.address == normal_user.search_history_relations[0].address
+    assert (
+        normalize_address(place.address)
+        == normal_user.search_history_relations[0].address
+    )
     db.delete(normal_user)
     db.commit()
     db.delete(place)
     db.commit()
 
 
+def test_add_search_history_aggregates_by_address(db: Session, normal_user) -> None:
+    crud.user.add_search_history(db, normal_user, ["판교역", " 판교역", "서현역"])
+    crud.user.add_search_history(db, normal_user, "판교역")
+
+    hit_counts = {
+        history.address: history.hit_count
+        for history in normal_user.search_history_relations
+    }
+    assert hit_counts == {"판교역": 3, "서현역": 1}
+    db.delete(normal_user)
+    db.commit()
+
+
+def test_load_profile(db: Session, normal_user, settings: AppSettings) -> None:
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    place = create_random_place(db, crud_place, types=["cafe", "bakery"])
+    crud.user.mark_interest(db, normal_user, place)
+    crud.user.add_search_history(db, normal_user, ["판교역", "서현역"])
+
+    user = crud.user.load_profile(db, normal_user)
+
+    with count_queries(db.get_bind()) as statements:
+        preferred_types = {place_type.type_name for place_type in user.preferred_types}
+        addresses = set(user.searched_addresses)
+        latest_location = user.latest_location
+    assert statements == []
+    assert preferred_types == {"cafe", "bakery"}
+    assert addresses == {"판교역", "서현역"}
+    assert latest_location is None
+    db.delete(normal_user)
+    db.commit()
+
+
+def test_compact_search_histories(db: Session, normal_user) -> None:
+    crud.user.add_search_history(db, normal_user, ["판교역", "서현역", "강남역"])
+    normal_user.search_history_relations[0].last_searched_at = datetime.now(
+        pytz.utc
+    ) - timedelta(days=400)
+    db.commit()
+
+    removed_count = crud.user.compact_search_histories(
+        db,
+        searched_after=datetime.now(pytz.utc) - timedelta(days=180),
+        max_per_user=1,
+    )
+
+    db.refresh(normal_user)
+    assert removed_count >= 2
+    assert len(normal_user.search_history_relations) == 1
+    db.delete(normal_user)
+    db.commit()
+
+
 def test_add_location_history(db: Session, normal_user, settings: AppSettings) -> None:
     crud_location = CRUDLocationFactory.get_instance(settings.APP_ENV, False)
 
@@ -172,3 +233,14 @@ def test_add_location_history(db: Session, normal_user, settings: AppSettings) -
     db.commit()
     db.delete(location)
     db.commit()
+
+
+def test_get_location_history(db: Session, normal_user) -> None:
+    for latitude in (37.1, 37.2, 37.3):
+        crud.user.add_location_history(db, normal_user, latitude, 127.0)
+
+    assert normal_user.latest_location.latitude == 37.3
+    locations = crud.user.get_location_history(db, normal_user, skip=1, limit=1)
+    assert [location.latitude for location in locations] == [37.2]
+    db.delete(normal_user)
+    db.commit()
@@ -0,0 +1,90 @@
+from difflib import SequenceMatcher
+
+import pytest
+
+from app.services.address_similarity_services import (
+    AddressSimilarityIndex,
+    address_ngrams,
+)
+
+HISTORY_ADDRESSES = [
+    "경기도 성남시 분당구 판교역로 160",
+    "서울특별시 강남구 강남대로 396",
+    "경기도 성남시 분당구 서현동 263",
+    "서울특별시 마포구 양화로 160",
+    "판교역",
+    "강남역",
+    "서울특별시 종로구 세종대로 175",
+]
+
+CANDIDATE_ADDRESSES = [
+    "경기도 성남시 분당구 판교역로 166",
+    "대한민국 경기도 성남시 분당구 백현동 판교역로 146번길 20",
+    "서울특별시 강남구 테헤란로 152",
+    "서울 강남구 강남대로 390",
+    "경기도 성남시 분당구 서현로 170",
+    "서울특별시 마포구 양화로 188",
+    "부산광역시 해운대구 해운대해변로 264",
+    "판교역 카페",
+    "서울특별시 종로구 세종대로 172",
+    "경기 성남시 분당구 황새울로 360번길 42",
+]
+
+
+def test_address_ngrams():
+    assert address_ngrams("판교역") == {
+        "판": 1,
+        "교": 1,
+        "역": 1,
+        " 판": 1,
+        "판교": 1,
+        "교역": 1,
+        "역 ": 1,
+    }
+    assert address_ngrams(" 판교역 ") == address_ngrams("판교역")
+
+
+def test_similarities_only_for_shared_ngrams():
+    index = AddressSimilarityIndex({"판교역": 1.0, "부산역": 1.0})
+
+    assert index.similarities("판교역") == {0: 1.0, 1: pytest.approx(0.29)}
+    assert index.similarities("서울") == {}
+
+
+def test_score_many():
+    index = AddressSimilarityIndex({"판교역": 1.5, "서현역": 1.0})
+    similarities = index.similarities("판교역 카페")
+
+    scores = index.score_many(["판교역 카페", "강남", "판교역 카페"])
+
+    expected_score = similarities[0] * 1.5 + similarities[1] * 1.0
+    assert scores == [pytest.approx(expected_score), 0.0, pytest.approx(expected_score)]
+
+
+def test_similarities_close_to_sequence_matcher():
+    """
+    SequenceMatcher.ratio와 비교해 유사도 오차와 가장 비슷한 검색 기록이 같은지 확인합니다.
+    """
+    index = AddressSimilarityIndex({address: 1.0 for address in HISTORY_ADDRESSES})
+
+    errors = []
+    for candidate_address in CANDIDATE_ADDRESSES:
+        similarities = index.similarities(candidate_address)
+        ngram_ratios = [
+            similarities.get(index, 0.0) for index in range(len(HISTORY_ADDRESSES))
+        ]
+        sequence_ratios = [
+            round(SequenceMatcher(None, address, candidate_address).ratio(), 2)
+            for address in HISTORY_ADDRESSES
+        ]
+
+        errors.extend(
+            abs(ngram_ratio - sequence_ratio)
+            for ngram_ratio, sequence_ratio in zip(ngram_ratios, sequence_ratios)
+        )
+        assert ngram_ratios.index(max(ngram_ratios)) == sequence_ratios.index(
+            max(sequence_ratios)
+        )
+
+    assert sum(errors) / len(errors) < 0.06
+    assert max(errors) < 0.15
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from app.schemas.location import LocationBase
+from app.services.autocomplete_cache_services import (
+    AutocompleteCache,
+    bucket_center,
+    location_bucket,
+)
+
+
+def create_autocomplete_cache(cached_predictions: dict) -> AutocompleteCache:
+    redis_services = MagicMock()
+    redis_services.get_cached_autocomplete_predictions.side_effect = lambda keys: [
+        cached_predictions.get(key) for key in keys
+    ]
+    return AutocompleteCache(redis_services)
+
+
+def test_autocomplete_cache_exact_hit():
+    predictions = [{"description": "대한민국 판교역"}]
+    autocomplete_cache = create_autocomplete_cache(
+        {"autocomplete:all:판교역": predictions}
+    )
+
+    assert autocomplete_cache.get(" 판교역") == predictions
+
+
+def test_autocomplete_cache_filters_shorter_prefix():
+    autocomplete_cache = create_autocomplete_cache(
+        {
+            "autocomplete:all:판교": [
+                {"description": "대한민국 판교역"},
+                {"description": "대한민국 판교테크노밸리"},
+            ]
+        }
+    )
+
+    assert autocomplete_cache.get("판교역") == [{"description": "대한민국 판교역"}]
+
+
+def test_autocomplete_cache_skips_truncated_prefix():
+    autocomplete_cache = create_autocomplete_cache(
+        {
+            "autocomplete:all:판": [
+                {"description": f"대한민국 판교역 {idx}번 출구"} for idx in range(5)
+            ]
+        }
+    )
+
+    assert autocomplete_cache.get("판교역") is None
+
+
+def test_location_bucket():
+    bucket = location_bucket(LocationBase(latitude=37.394776, longitude=127.11116))
+
+    assert bucket == location_bucket(
+        LocationBase(latitude=37.394901, longitude=127.111301)
+    )
+    assert abs(bucket_center(bucket).latitude - 37.394776) < 0.01
+    assert location_bucket(None) is None
+    assert AutocompleteCache(MagicMock()).build_key("판교역", bucket) == (
+        f"autocomplete:{bucket}:판교역"
+    )
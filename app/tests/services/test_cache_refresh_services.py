@@ -0,0 +1,34 @@
+import threading
+from unittest.mock import MagicMock
+
+from app.services.cache_refresh_services import CacheRefresher
+
+
+def test_cache_refresher_skips_scheduled_key():
+    session_factory = MagicMock()
+    cache_refresher = CacheRefresher(max_workers=1, session_factory=session_factory)
+    started, release = threading.Event(), threading.Event()
+    refresh = MagicMock(side_effect=lambda db: started.set() or release.wait())
+
+    assert cache_refresher.schedule("nearby_places:cafe:wydm9", refresh)
+    started.wait()
+    assert not cache_refresher.schedule("nearby_places:cafe:wydm9", refresh)
+    release.set()
+    cache_refresher.shutdown()
+
+    db = session_factory.return_value.__enter__.return_value
+    refresh.assert_called_once_with(db)
+    assert cache_refresher.schedule("nearby_places:cafe:wydm9", refresh)
+    cache_refresher.shutdown()
+
+
+def test_cache_refresher_swallows_refresh_error():
+    cache_refresher = CacheRefresher(max_workers=1, session_factory=MagicMock())
+
+    cache_refresher.schedule(
+        "nearby_places:cafe:wydm9", MagicMock(side_effect=ValueError)
+    )
+    cache_refresher.shutdown()
+
+    assert cache_refresher.schedule("nearby_places:cafe:wydm9", MagicMock())
+    cache_refresher.shutdown()
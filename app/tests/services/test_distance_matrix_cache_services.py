@@ -0,0 +1,105 @@
+from dataclasses import asdict
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytz
+
+from app.schemas.google_maps_api import DistanceInfo
+from app.services.constants import TravelMode
+from app.services.distance_matrix_cache_services import (
+    DistanceMatrixCache,
+    departure_time_bucket,
+    parse_lat_lng,
+)
+from app.services.map_services import MapServices
+
+
+def make_distance_info(origin: str, destination_id: str, value: int) -> DistanceInfo:
+    return DistanceInfo(
+        origin=origin,
+        destination=f"address of {destination_id}",
+        destination_id=destination_id,
+        distance_text=f"{value} m",
+        distance_value=value,
+        duration_text=f"{value} 초",
+        duration_value=value,
+    )
+
+
+def test_departure_time_bucket():
+    # 2023-10-09 08:10 UTC == 월요일 17:10 KST
+    departure_time = datetime(2023, 10, 9, 8, 10, tzinfo=pytz.utc)
+
+    assert departure_time_bucket(departure_time) == "0-34"
+
+
+def test_parse_lat_lng():
+    assert parse_lat_lng("37.5, 127.0") == (37.5, 127.0)
+    assert parse_lat_lng("판교역") is None
+
+
+def test_resolve_origin_cell():
+    redis_services = MagicMock()
+    redis_services.get_cached_address_coordinates.side_effect = lambda address: (
+        {"latitude": 37.394776, "longitude": 127.11116} if address == "판교역" else None
+    )
+    cache = DistanceMatrixCache(redis_services, TravelMode.TRANSIT)
+
+    assert cache.resolve_origin_cell("판교역") == cache.resolve_origin_cell(
+        "37.3948,127.1112"
+    )
+    assert cache.resolve_origin_cell("없는주소") is None
+
+
+def test_get_distance_matrix_only_requests_missing_elements(map_service: MapServices):
+    origins = ["37.0,127.0", "38.0,128.0"]
+    destinations = ["place_1", "place_2"]
+    cached_infos = {
+        "place_1": make_distance_info("origin_1", "place_1", 100),
+        "place_2": make_distance_info("origin_1", "place_2", 200),
+    }
+
+    redis_services = MagicMock()
+    # NOTE: 첫 번째 출발지(37.0,127.0)의 셀 wyd63zw만 캐시되어 있음
+    redis_services.get_cached_distance_infos.side_effect = lambda keys: [
+        asdict(cached_infos[key.split(":")[-1]]) if ":wyd63zw:" in key else None
+        for key in keys
+    ]
+    map_service.map_adapter.calculate_distance_matrix = MagicMock(
+        return_value=[
+            make_distance_info("origin_2", "place_1", 300),
+            make_distance_info("origin_2", "place_2", 400),
+        ]
+    )
+
+    with patch(
+        "app.services.map_services.RedisServicesFactory.create_redis_services",
+        return_value=redis_services,
+    ):
+        response = map_service.get_distance_matrix_for_places(
+            MagicMock(), MagicMock(), origins, destinations, "transit"
+        )
+
+    assert [info.distance_value for info in response] == [100, 200, 300, 400]
+    request = map_service.map_adapter.calculate_distance_matrix.call_args.kwargs
+    assert request["origins"] == ["38.0,128.0"]
+    assert request["destinations"] == destinations
+    assert len(redis_services.cache_distance_infos.call_args.args[0]) == 2
+
+
+def test_get_distance_matrix_all_cached(map_service: MapServices):
+    cached_info = make_distance_info("origin_1", "place_1", 100)
+    redis_services = MagicMock()
+    redis_services.get_cached_distance_infos.return_value = [asdict(cached_info)]
+    map_service.map_adapter.calculate_distance_matrix = MagicMock()
+
+    with patch(
+        "app.services.map_services.RedisServicesFactory.create_redis_services",
+        return_value=redis_services,
+    ):
+        response = map_service.get_distance_matrix_for_places(
+            MagicMock(), MagicMock(), ["37.0,127.0"], ["place_1"], "transit"
+        )
+
+    assert response == [cached_info]
+    map_service.map_adapter.calculate_distance_matrix.assert_not_called()
@@ -1,6 +1,7 @@
-from app.schemas.google_maps_api import UserPreferences
-from app.services.constants import AGGREGATED_ATTR, PLACETYPE
-from app.services.filters_services import DistanceInfoFilter
+from app.schemas.google_maps_api import GeocodeResponse, UserPreferences
+from app.schemas.place import Place
+from app.services.constants import AGGREGATED_ATTR, AGGREGATION, PLACETYPE
+from app.services.filters_services import DistanceInfoFilter, HaversinePreFilter
 from app.services.routes_matrix_services import RoutesMatrix
 from app.tests.utils.places import (
     distance_info_list,
@@ -21,3 +22,94 @@ def test_distance_info_filter_apply():
 
     assert len(filtered_candidates) == 1
     assert filtered_candidates[0].name == "판교역"
+
+
+def test_distance_info_filter_apply_by_variance():
+    routes_matrix = RoutesMatrix(distance_info_list)
+    user_preferences = UserPreferences(
+        place_type=PLACETYPE.CAFE,
+        filter_condition=AGGREGATED_ATTR.DURATION,
+        filter_aggregation=AGGREGATION.VARIANCE,
+        return_count=1,
+    )
+    filtered_candidates = DistanceInfoFilter(routes_matrix, user_preferences).apply(
+        places_list_related_to_distance_info
+    )
+
+    assert [candidate.name for candidate in filtered_candidates] == ["판교역"]
+
+
+def test_haversine_prefilter_apply():
+    participants = [
+        GeocodeResponse(latitude=37.0, longitude=127.0),
+        GeocodeResponse(latitude=37.2, longitude=127.2),
+    ]
+    candidate_coordinates = {
+        "ChIJN1t_tDeuEmsRUsoyG83frY1": GeocodeResponse(latitude=37.1, longitude=127.1),
+        "ChIJN1t_tDeuEmsRUsoyG83frY2": GeocodeResponse(latitude=38.0, longitude=128.0),
+    }
+    user_preferences = UserPreferences(
+        place_type=PLACETYPE.CAFE, return_count=1, prefilter_count=1
+    )
+
+    filtered_candidates = HaversinePreFilter(
+        participants, candidate_coordinates, user_preferences
+    ).apply(places_list_related_to_distance_info)
+
+    assert [candidate.name for candidate in filtered_candidates] == ["판교역"]
+
+
+def test_haversine_prefilter_apply_by_max_distance():
+    participants = [
+        GeocodeResponse(latitude=37.0, longitude=127.0),
+        GeocodeResponse(latitude=37.0, longitude=129.0),
+    ]
+    # NOTE: 합계는 같지만 두 번째 후보가 가장 먼 참가자와의 거리가 더 짧음
+    candidate_coordinates = {
+        "ChIJN1t_tDeuEmsRUsoyG83frY1": GeocodeResponse(latitude=37.0, longitude=127.2),
+        "ChIJN1t_tDeuEmsRUsoyG83frY2": GeocodeResponse(latitude=37.0, longitude=128.0),
+    }
+    user_preferences = UserPreferences(
+        place_type=PLACETYPE.CAFE,
+        return_count=1,
+        prefilter_count=1,
+        prefilter_condition=AGGREGATION.MAX,
+    )
+
+    filtered_candidates = HaversinePreFilter(
+        participants, candidate_coordinates, user_preferences
+    ).apply(places_list_related_to_distance_info)
+
+    assert [candidate.name for candidate in filtered_candidates] == ["서울역"]
+
+
+def test_haversine_prefilter_keeps_candidates_under_count():
+    user_preferences = UserPreferences(
+        place_type=PLACETYPE.CAFE, return_count=1, prefilter_count=5
+    )
+
+    filtered_candidates = HaversinePreFilter([], {}, user_preferences).apply(
+        places_list_related_to_distance_info
+    )
+
+    assert filtered_candidates == places_list_related_to_distance_info
+
+
+def test_haversine_prefilter_keeps_return_count_candidates():
+    participants = [GeocodeResponse(latitude=37.0, longitude=127.0)]
+    candidates = [
+        Place(place_id=f"place_{idx}", address=f"address {idx}", place_types=[])
+        for idx in range(25)
+    ]
+    candidate_coordinates = {
+        candidate.place_id: GeocodeResponse(latitude=37.0 + idx * 0.01, longitude=127.0)
+        for idx, candidate in enumerate(candidates)
+    }
+    # NOTE: 기본 prefilter_count(10)보다 많이 요청하면 요청한 개수만큼 남겨야 함
+    user_preferences = UserPreferences(place_type=PLACETYPE.CAFE, return_count=20)
+
+    filtered_candidates = HaversinePreFilter(
+        participants, candidate_coordinates, user_preferences
+    ).apply(candidates)
+
+    assert filtered_candidates == candidates[:20]
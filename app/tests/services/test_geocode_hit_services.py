@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import OperationalError
+
+from app import crud
+from app.services.geocode_hit_services import GeocodeHitRecorder
+
+
+def test_flush():
+    recorder = GeocodeHitRecorder(session_factory=MagicMock())
+    recorder.record(["판교역", " 판교역 "])
+    recorder.record(["강남역"])
+
+    with patch.object(crud.geocode, "add_hits") as mock_add_hits:
+        assert recorder.flush() == 2
+        assert recorder.flush() == 0
+
+    mock_add_hits.assert_called_once()
+    assert mock_add_hits.call_args.kwargs["hits"] == {"판교역": 2, "강남역": 1}
+
+
+def test_flush_keeps_hits_on_db_error():
+    recorder = GeocodeHitRecorder(session_factory=MagicMock())
+    recorder.record(["판교역"])
+
+    with patch.object(
+        crud.geocode,
+        "add_hits",
+        side_effect=OperationalError("UPDATE", {}, Exception("error")),
+    ):
+        assert recorder.flush() == 0
+
+    recorder.record(["판교역"])
+    with patch.object(crud.geocode, "add_hits") as mock_add_hits:
+        recorder.flush()
+
+    assert mock_add_hits.call_args.kwargs["hits"] == {"판교역": 2}
+
+
+def test_recorder_flushes_on_shutdown():
+    recorder = GeocodeHitRecorder(interval=60, session_factory=MagicMock())
+
+    with patch.object(crud.geocode, "add_hits") as mock_add_hits:
+        recorder.startup()
+        assert recorder.is_started
+        recorder.record(["판교역"])
+        recorder.shutdown()
+
+    assert not recorder.is_started
+    mock_add_hits.assert_called_once()
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+from app import crud
+from app.crud.crud_geocode import MemoryCRUDGeocode
+from app.schemas.geocode import GeocodeCreate
+from app.services.geocode_warmup_services import warm_up_geocode_cache
+from app.services.redis_services import RedisUnavailableError
+
+
+def create_crud_geocode(addresses):
+    crud_geocode = MemoryCRUDGeocode()
+    for address in addresses:
+        crud_geocode.upsert(
+            None, obj_in=GeocodeCreate(address=address, latitude=37.0, longitude=127.0)
+        )
+    return crud_geocode
+
+
+def test_warm_up_geocode_cache():
+    redis_services = MagicMock()
+    crud_geocode = create_crud_geocode(["판교역", "강남역", "서현역"])
+    crud_geocode.add_hits(None, hits={"강남역": 1})
+
+    with patch.object(crud, "geocode", crud_geocode):
+        count = warm_up_geocode_cache(MagicMock(), redis_services, count=1)
+
+    assert count == 1
+    redis_services.cache_addresses_coordinates.assert_called_once_with(
+        {"강남역": (37.0, 127.0)}
+    )
+
+
+def test_warm_up_geocode_cache_redis_unavailable():
+    redis_services = MagicMock()
+    redis_services.cache_addresses_coordinates.side_effect = RedisUnavailableError()
+
+    with patch.object(crud, "geocode", create_crud_geocode(["판교역"])):
+        count = warm_up_geocode_cache(MagicMock(), redis_services, count=10)
+
+    assert count == 0
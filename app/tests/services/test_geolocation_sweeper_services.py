@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+from app.services.geolocation_sweeper_services import GeolocationSweeper
+from app.services.redis_services import RedisOperationError
+
+
+def test_sweep():
+    redis_services = MagicMock()
+    redis_services.remove_expired_locations.return_value = 3
+    sweeper = GeolocationSweeper(redis_services=redis_services)
+
+    assert sweeper.sweep() == 3
+    redis_services.remove_expired_locations.assert_called_once_with()
+
+
+def test_sweep_continues_on_redis_error():
+    redis_services = MagicMock()
+    redis_services.remove_expired_locations.side_effect = RedisOperationError("error")
+    sweeper = GeolocationSweeper(redis_services=redis_services)
+
+    assert sweeper.sweep() == 0
+
+
+def test_sweeper_startup_and_shutdown():
+    redis_services = MagicMock()
+    redis_services.remove_expired_locations.return_value = 0
+    sweeper = GeolocationSweeper(interval=0.01, redis_services=redis_services)
+
+    sweeper.startup()
+    assert sweeper.is_started
+    sweeper.shutdown()
+
+    assert not sweeper.is_started
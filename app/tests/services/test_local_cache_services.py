@@ -0,0 +1,187 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import redis
+
+from app.services.constants import PLACETYPE, Radius, RedisKey
+from app.services.local_cache_services import MISSING, LocalCache, LocalCacheRegistry
+from app.services.redis_services import (
+    RedisServicesFactory,
+    nearby_places_geohash,
+    nearby_places_local_key,
+    places_key,
+)
+from app.utils import geohash_neighbors
+
+
+def test_local_cache_evicts_least_recently_used():
+    local_cache = LocalCache("test", max_entries=2, ttl=60)
+    local_cache.set("a", 1, size_bytes=10)
+    local_cache.set("b", 2, size_bytes=10)
+    local_cache.get("a")
+    local_cache.set("c", 3, size_bytes=10)
+
+    assert local_cache.get("b") is MISSING
+    assert local_cache.get("a") == 1
+    assert local_cache.memory_snapshot() == {"entries": 2, "bytes": 20}
+
+
+def test_local_cache_returns_copies():
+    local_cache = LocalCache("test", max_entries=2, ttl=60)
+    places = [{"place_id": "ChIJ1"}]
+    local_cache.set("a", places)
+    places.append({"place_id": "ChIJ2"})
+    local_cache.get("a")[0]["place_id"] = "ChIJ3"
+
+    assert local_cache.get("a") == [{"place_id": "ChIJ1"}]
+
+
+def test_local_cache_expires_entries():
+    local_cache = LocalCache("test", max_entries=2, ttl=0.01)
+    local_cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert local_cache.get("a") is MISSING
+    assert local_cache.memory_snapshot()["entries"] == 0
+
+
+def test_local_cache_invalidate_prefix():
+    local_cache = LocalCache("test", max_entries=10, ttl=60)
+    local_cache.set("cafe:1", 1)
+    local_cache.set("cafe:2", 2)
+    local_cache.set("restaurant:1", 3)
+
+    local_cache.invalidate_prefix("cafe:")
+
+    assert local_cache.get("cafe:1") is MISSING
+    assert local_cache.get("restaurant:1") == 3
+
+
+def test_local_cache_registry_disabled():
+    registry = LocalCacheRegistry(max_entries=0)
+
+    assert registry.get_cache("geocode") is None
+
+
+def test_local_cache_registry_publish_invalidation():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60, channel="invalidation")
+    registry.get_cache("geocode").set("판교역", {"latitude": 37.0})
+    redis_client = MagicMock()
+
+    registry.publish_invalidation(redis_client, "geocode", keys=["판교역"])
+
+    assert registry.get_cache("geocode").get("판교역") is MISSING
+    redis_client.publish.assert_called_once_with(
+        "invalidation",
+        json.dumps({"name": "geocode", "keys": ["판교역"], "prefix": None}),
+    )
+
+
+def test_local_cache_registry_handles_invalidation_message():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60)
+    registry.get_cache("geocode").set("판교역", {"latitude": 37.0})
+
+    registry._handle_message(
+        {"data": json.dumps({"name": "geocode", "keys": ["판교역"], "prefix": None})}
+    )
+
+    assert registry.get_cache("geocode").get("판교역") is MISSING
+
+
+def test_local_cache_registry_resubscribes_after_pubsub_error():
+    registry = LocalCacheRegistry(
+        max_entries=10, ttl=60, channel="invalidation", resubscribe_interval=0
+    )
+    registry.get_cache("geocode").set("판교역", {"latitude": 37.0})
+    pubsub = MagicMock()
+
+    registry._handle_pubsub_error(redis.ConnectionError(), pubsub, MagicMock())
+
+    pubsub.subscribe.assert_called_once_with(invalidation=registry._handle_message)
+    assert registry.get_cache("geocode").get("판교역") is MISSING
+
+
+def test_local_cache_registry_keeps_cache_when_resubscribe_fails():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60, resubscribe_interval=0)
+    registry.get_cache("geocode").set("판교역", {"latitude": 37.0})
+    pubsub = MagicMock()
+    pubsub.subscribe.side_effect = redis.ConnectionError()
+
+    registry._handle_pubsub_error(redis.ConnectionError(), pubsub, MagicMock())
+
+    assert registry.get_cache("geocode").get("판교역") == {"latitude": 37.0}
+
+
+def test_local_cache_registry_startup_handles_pubsub_errors():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60)
+    redis_client = MagicMock()
+
+    registry.startup(redis_client)
+
+    redis_client.pubsub.return_value.run_in_thread.assert_called_once_with(
+        sleep_time=1.0, daemon=True, exception_handler=registry._handle_pubsub_error
+    )
+
+
+def test_redis_services_reads_geocode_from_local_cache():
+    redis_client = MagicMock()
+    redis_client.get.return_value = b"[37.394776, 127.11116]"
+    redis_services = RedisServicesFactory.create_redis_services(
+        redis_client, LocalCacheRegistry(max_entries=10, ttl=60)
+    )
+
+    first = redis_services.get_cached_address_coordinates("판교역")
+    second = redis_services.get_cached_address_coordinates(" 판교역 ")
+
+    assert first == second == {"latitude": 37.394776, "longitude": 127.11116}
+    redis_client.get.assert_called_once_with("geocode:판교역")
+
+
+def test_cache_place_records_invalidates_nearby_places_local_cache():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60)
+    redis_services = RedisServicesFactory.create_redis_services(MagicMock(), registry)
+    nearby_places_cache = registry.get_cache(RedisKey.NEARBY_PLACES.value)
+    neighbor_key = nearby_places_local_key(geohash_neighbors("wydm9q")[0], "cafe")
+    other_key = nearby_places_local_key("wydm00", "cafe")
+    nearby_places_cache.set(neighbor_key, [("wydm9q", None, [{}], None)])
+    nearby_places_cache.set(other_key, [("wydm00", None, [{}], None)])
+
+    redis_services.cache_place_records({places_key("wydm9q", PLACETYPE.CAFE): []})
+
+    # NOTE: 인접한 셀 기준 항목도 같은 셀의 원본 응답을 담고 있으므로 지워져야 함
+    assert nearby_places_cache.get(neighbor_key) is MISSING
+    assert nearby_places_cache.get(other_key) != MISSING
+
+
+def test_cache_nearby_places_invalidates_only_touched_cells():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60)
+    redis_services = RedisServicesFactory.create_redis_services(MagicMock(), registry)
+    nearby_places_cache = registry.get_cache(RedisKey.NEARBY_PLACES.value)
+    geohash = nearby_places_geohash(37.0, 127.0, 500)
+    neighbor_key = nearby_places_local_key(geohash_neighbors(geohash)[0], "cafe")
+    other_key = nearby_places_local_key("wydm00", "cafe")
+    nearby_places_cache.set(neighbor_key, [])
+    nearby_places_cache.set(other_key, [])
+
+    redis_services.cache_nearby_places_with_location(
+        37.0, 127.0, [], PLACETYPE.CAFE, radius=500
+    )
+
+    assert nearby_places_cache.get(neighbor_key) is MISSING
+    assert nearby_places_cache.get(other_key) != MISSING
+
+
+def test_cache_nearby_places_without_place_type():
+    registry = LocalCacheRegistry(max_entries=10, ttl=60)
+    redis_client = MagicMock()
+    redis_services = RedisServicesFactory.create_redis_services(redis_client, registry)
+    nearby_places_cache = registry.get_cache(RedisKey.NEARBY_PLACES.value)
+    nearby_places_cache.set(nearby_places_local_key("wydm00", "cafe"), [])
+
+    geohash = redis_services.cache_nearby_places_with_location(37.0, 127.0, [])
+
+    assert geohash == nearby_places_geohash(37.0, 127.0, Radius.FIRST_RADIUS.value)
+    assert nearby_places_cache.get(nearby_places_local_key("wydm00", "cafe")) == []
+    redis_client.pipeline.return_value.execute.assert_called_once()
+    redis_client.publish.assert_not_called()
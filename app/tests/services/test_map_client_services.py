@@ -0,0 +1,81 @@
+import socket
+from unittest.mock import MagicMock, patch
+
+from app.services.map_client_services import (
+    ConnectionReuseStats,
+    MapClientRegistry,
+    StatsHTTPAdapter,
+)
+from app.services.map_services import MapServicesFactory
+
+
+def test_connection_reuse_stats():
+    stats = ConnectionReuseStats()
+    connection = MagicMock()
+
+    stats.record("https://maps.googleapis.com/maps/api/geocode/json?a=1", connection)
+    stats.record("https://maps.googleapis.com/maps/api/geocode/json?a=2", connection)
+    stats.record("https://maps.googleapis.com/maps/api/place/details/json", None)
+
+    assert stats.snapshot() == {
+        "/maps/api/geocode/json": {
+            "requests": 2,
+            "new_connections": 1,
+            "reused_connections": 1,
+        },
+        "/maps/api/place/details/json": {
+            "requests": 1,
+            "new_connections": 1,
+            "reused_connections": 0,
+        },
+    }
+
+
+def test_map_client_registry_reuses_clients():
+    registry = MapClientRegistry(pool_size=2, keepalive_expiry=5)
+    registry.startup()
+    try:
+        map_client = registry.map_client
+        registry.startup()
+
+        async def client_id(client):
+            return id(client)
+
+        assert registry.map_client is map_client
+        assert registry.run_with_async_client(
+            client_id
+        ) == registry.run_with_async_client(client_id)
+
+        map_services = MapServicesFactory.create_map_services(client_registry=registry)
+        assert map_services.map_adapter.client is map_client
+        # NOTE: OVER_QUERY_LIMIT 재시도는 stale 캐시로 응답할 수 있는 호출에서만 끔
+        assert map_client.retry_over_query_limit
+        assert not registry.no_retry_map_client.retry_over_query_limit
+        assert registry.no_retry_map_client.session is map_client.session
+    finally:
+        registry.shutdown()
+
+    assert not registry.is_started
+
+
+def test_stats_http_adapter_expires_idle_pool():
+    adapter = StatsHTTPAdapter(
+        ConnectionReuseStats(), keepalive_expiry=5, tcp_keepalive_idle=30
+    )
+
+    with patch(
+        "app.services.map_client_services.time.monotonic", side_effect=[0, 4, 10]
+    ), patch.object(adapter.poolmanager, "clear") as mock_clear:
+        adapter._expire_idle_pool()
+        adapter._expire_idle_pool()
+        mock_clear.assert_not_called()
+
+        adapter._expire_idle_pool()
+        mock_clear.assert_called_once()
+
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (
+            socket.IPPROTO_TCP,
+            socket.TCP_KEEPIDLE,
+            30,
+        ) in adapter.poolmanager.connection_pool_kw["socket_options"]
@@ -1,14 +1,38 @@
-from unittest.mock import MagicMock
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
 
+import googlemaps
+import httpx
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
 from app import crud
 from app.core.settings.app import AppSettings
+from app.crud.crud_geocode import MemoryCRUDGeocode
 from app.crud.crud_location import CRUDLocationFactory
 from app.crud.crud_place import CRUDPlaceFactory
+from app.schemas.geocode import GeocodeCreate
 from app.schemas.google_maps_api import DistanceInfo
+from app.services import map_services
 from app.services.constants import TravelMode
-from app.services.map_services import MapServices, ZeroResultException
+from app.services.map_client_services import (
+    MapClientRegistry,
+    create_map_client,
+    create_no_retry_map_client,
+)
+from app.services.map_services import (
+    AsyncMapAdapter,
+    AsyncMapClientFactory,
+    MapAdapter,
+    MapServices,
+    ZeroResultException,
+    is_over_query_limit,
+)
+from app.services.negative_cache_services import NegativeCache
+from app.services.redis_services import RedisServicesFactory, RedisUnavailableError
 from app.tests.utils.places import (
     create_random_location,
     create_random_place,
@@ -79,6 +103,32 @@ def test_create_or_get_locations_not_existing(
     assert len(crud_location.locations) == 6
 
 
+def test_create_or_get_locations_dedupes_same_coordinates(map_service: MapServices, db):
+    map_service._create_new_locations_from_result = MagicMock(return_value=[])
+    crud.location.get_by_latlng_list = MagicMock(return_value=[])
+    results_with_geometry = [
+        {"place_id": str(i), "geometry": {"location": {"lat": 1, "lng": 1}}}
+        for i in range(3)
+    ]
+
+    map_service.create_or_get_locations(db, results_with_geometry)
+
+    map_service._create_new_locations_from_result.assert_called_once_with(
+        [results_with_geometry[-1]]
+    )
+
+
+def test_merge_nearby_places_results():
+    responses = [
+        [{"place_id": "1", "name": "a"}, {"place_id": "2", "name": "b"}],
+        [{"place_id": "2", "name": "b"}, {"place_id": "3", "name": "c"}],
+    ]
+
+    merged = MapServices.merge_nearby_places_results(responses)
+
+    assert [result["place_id"] for result in merged] == ["1", "2", "3"]
+
+
 def test_create_or_get_places_all_existing(
     map_service: MapServices,
     db,
@@ -145,6 +195,85 @@ def test_get_lat_lng_from_address(map_service: MapServices, db, normal_user):
     assert response.longitude == 789.101
 
 
+def test_get_lat_lng_from_address_redis_unavailable(map_service: MapServices):
+    redis_services = MagicMock()
+    redis_services.get_cached_address_coordinates.side_effect = RedisUnavailableError()
+    redis_services.cache_address_coordinates.side_effect = RedisUnavailableError()
+    redis_services.acquire_leases.side_effect = RedisUnavailableError()
+    map_service.map_adapter.geocode_address = MagicMock(
+        return_value=mock_geocode_response
+    )
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(crud, "geocode", MemoryCRUDGeocode()):
+        response = map_service.get_lat_lng_from_address(MagicMock(), MagicMock(), "판교역")
+
+    assert response.latitude == 123.456
+
+
+def test_get_lat_lng_from_address_from_db(map_service: MapServices):
+    redis_services = MagicMock()
+    redis_services.get_cached_address_coordinates.return_value = None
+    crud_geocode = MemoryCRUDGeocode()
+    crud_geocode.upsert(
+        None, obj_in=GeocodeCreate(address="판교역", latitude=37.39, longitude=127.11)
+    )
+    map_service.map_adapter.geocode_address = MagicMock()
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(crud, "geocode", crud_geocode), patch.object(
+        map_services, "geocode_hit_recorder"
+    ) as mock_hit_recorder:
+        response = map_service.get_lat_lng_from_address(
+            MagicMock(), MagicMock(), " 판교역"
+        )
+
+    assert (response.latitude, response.longitude) == (37.39, 127.11)
+    mock_hit_recorder.record.assert_called_once_with(["판교역"])
+    map_service.map_adapter.geocode_address.assert_not_called()
+    redis_services.cache_addresses_coordinates.assert_called_once_with(
+        {"판교역": (37.39, 127.11)}
+    )
+
+
+def test_get_address_from_lat_lng_cached(map_service: MapServices):
+    redis_services = MagicMock()
+    redis_services.get_cached_reverse_geocode.return_value = "경기도 성남시 판교역"
+    map_service.map_adapter.reverse_geocode = MagicMock()
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        response = map_service.get_address_from_lat_lng(
+            MagicMock(), MagicMock(), 37.394776, 127.11116
+        )
+
+    assert response.address == "경기도 성남시 판교역"
+    map_service.map_adapter.reverse_geocode.assert_not_called()
+
+
+def test_get_address_from_lat_lng_caches_result(map_service: MapServices):
+    redis_services = MagicMock()
+    redis_services.get_cached_reverse_geocode.side_effect = RedisUnavailableError()
+    map_service.map_adapter.reverse_geocode = MagicMock(
+        return_value=[{"formatted_address": "경기도 성남시 판교역"}]
+    )
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        response = map_service.get_address_from_lat_lng(
+            MagicMock(), MagicMock(), 37.394776, 127.11116
+        )
+
+    assert response.address == "경기도 성남시 판교역"
+    redis_services.cache_reverse_geocode.assert_called_once_with(
+        37.394776, 127.11116, "경기도 성남시 판교역"
+    )
+
+
 def test_get_lat_lng_from_address_no_result(map_service: MapServices, db, normal_user):
     map_service.map_adapter.client.geocode = MagicMock(return_value=[])
 
@@ -243,3 +372,352 @@ def test_calculate_distance_matrix(db, normal_user, map_service):
     )
 
     assert response == distance_info_list_no_id
+
+
+def mock_google_maps_transport(requested_urls: list):
+    def handler(request: httpx.Request):
+        requested_urls.append(request.url)
+        if request.url.path.endswith("geocode/json"):
+            address = request.url.params["address"]
+            return httpx.Response(
+                200,
+                json={
+                    "status": "OK",
+                    "results": [
+                        {"geometry": {"location": {"lat": len(address), "lng": 127.0}}}
+                    ],
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "status": "OK",
+                "predictions": [{"description": f"대한민국 {request.url.params['input']}"}],
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_async_map_adapter_geocode_address():
+    requested_urls = []
+
+    async def geocode():
+        async with AsyncMapClientFactory.create_async_map_client(
+            transport=mock_google_maps_transport(requested_urls)
+        ) as client:
+            return await AsyncMapAdapter(client).geocode_address(
+                MagicMock(), MagicMock(), "판교역"
+            )
+
+    results = asyncio.run(geocode())
+
+    assert results[0]["geometry"]["location"] == {"lat": 3, "lng": 127.0}
+    assert len(requested_urls) == 1
+    assert requested_urls[0].params["key"]
+
+
+def test_async_map_adapter_zero_results():
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, json={"status": "ZERO_RESULTS", "results": []}
+        )
+    )
+
+    async def geocode():
+        async with AsyncMapClientFactory.create_async_map_client(
+            transport=transport
+        ) as client:
+            return await AsyncMapAdapter(client).geocode_address(
+                MagicMock(), MagicMock(), "없는주소"
+            )
+
+    with patch("app.crud.google_maps_api_log.create") as mock_log_create:
+        with pytest.raises(ZeroResultException):
+            asyncio.run(geocode())
+
+        # NOTE: 이벤트 루프에서는 실패 로그를 저장하지 않음
+        mock_log_create.assert_not_called()
+
+
+def test_gather_api_calls_logs_errors_on_calling_thread():
+    def handler(request: httpx.Request):
+        if request.url.params["address"] == "없는주소":
+            return httpx.Response(200, json={"status": "ZERO_RESULTS", "results": []})
+        return httpx.Response(
+            200,
+            json={
+                "status": "OK",
+                "results": [{"geometry": {"location": {"lat": 37.0, "lng": 127.0}}}],
+            },
+        )
+
+    async def create_async_map_client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    logged_threads = []
+    registry = MapClientRegistry(pool_size=2, keepalive_expiry=5)
+    with patch.object(
+        MapClientRegistry, "_create_async_map_client", create_async_map_client
+    ), patch(
+        "app.crud.google_maps_api_log.create",
+        side_effect=lambda *args, **kwargs: logged_threads.append(
+            threading.current_thread()
+        ),
+    ):
+        map_services = MapServices(MagicMock(), client_registry=registry)
+        try:
+            with pytest.raises(ZeroResultException):
+                map_services._gather_api_calls(
+                    "geocode_address",
+                    MagicMock(),
+                    MagicMock(),
+                    [("판교역",), ("없는주소",)],
+                )
+        finally:
+            registry.shutdown()
+
+    assert logged_threads == [threading.current_thread()]
+
+
+def test_map_adapter_caches_zero_results():
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_result.return_value = None
+    map_adapter = MapAdapter(MagicMock())
+    map_adapter.client.geocode.return_value = []
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(map_services, "negative_cache", NegativeCache(ttl=60)), patch(
+        "app.crud.google_maps_api_log.create"
+    ) as mock_log_create:
+        with pytest.raises(ZeroResultException):
+            map_adapter.geocode_address(MagicMock(), MagicMock(), "없는주소")
+
+    mock_log_create.assert_called_once()
+    _, result, ttl = redis_services.cache_negative_result.call_args.args
+    assert result["exception"] == "ZeroResultException"
+    assert ttl == 60
+
+
+def test_map_adapter_skips_negative_cached_request():
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_result.return_value = {
+        "exception": "ApiError",
+        "detail": {"status": "NOT_FOUND", "message": None},
+    }
+    map_adapter = MapAdapter(MagicMock())
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(map_services, "negative_cache", NegativeCache(ttl=60)), patch(
+        "app.crud.google_maps_api_log.create"
+    ) as mock_log_create:
+        with pytest.raises(googlemaps.exceptions.ApiError) as error:
+            map_adapter.get_place_detail(MagicMock(), MagicMock(), "ChIJ1")
+
+    assert error.value.status == "NOT_FOUND"
+    map_adapter.client.place.assert_not_called()
+    mock_log_create.assert_not_called()
+
+
+class OverQueryLimitAdapter(HTTPAdapter):
+    def __init__(self):
+        super().__init__()
+        self.request_count = 0
+
+    def send(self, request, *args, **kwargs):
+        self.request_count += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(
+            {"status": "OVER_QUERY_LIMIT", "error_message": "quota exceeded"}
+        ).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def test_map_adapter_over_query_limit_is_not_retried():
+    adapter = OverQueryLimitAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    map_adapter = MapAdapter(create_no_retry_map_client(requests_session=session))
+
+    with patch("app.crud.google_maps_api_log.create"):
+        with pytest.raises(googlemaps.exceptions.ApiError) as error:
+            map_adapter.geocode_address(MagicMock(), MagicMock(), "판교역")
+
+    # NOTE: 재시도하면 retry_timeout 동안 멈췄다가 Timeout이 나므로 한 번만 요청해야 함
+    assert is_over_query_limit(error.value)
+    assert adapter.request_count == 1
+
+
+def test_map_adapter_over_query_limit_is_retried_by_default():
+    adapter = OverQueryLimitAdapter()
+    session = requests.Session()
+    session.mount("https://", adapter)
+    map_adapter = MapAdapter(
+        create_map_client(requests_session=session, retry_timeout=0.5)
+    )
+
+    with patch("app.crud.google_maps_api_log.create"):
+        with pytest.raises(googlemaps.exceptions.Timeout):
+            map_adapter.geocode_address(MagicMock(), MagicMock(), "판교역")
+
+    assert adapter.request_count > 1
+
+
+def test_get_nearby_places_without_retry_uses_no_retry_client():
+    map_client = MagicMock()
+    no_retry_map_client = MagicMock()
+    map_service = MapServices(map_client, no_retry_map_client=no_retry_map_client)
+    no_retry_map_client.places_nearby.side_effect = googlemaps.exceptions.ApiError(
+        "OVER_QUERY_LIMIT"
+    )
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=MagicMock()
+    ), patch.object(
+        map_services.single_flight,
+        "run",
+        side_effect=lambda redis_services, key, fetch, read_cached: fetch(),
+    ), patch(
+        "app.crud.google_maps_api_log.create"
+    ):
+        with pytest.raises(googlemaps.exceptions.ApiError):
+            map_service.get_nearby_places(
+                MagicMock(), MagicMock(), 37.0, 127.0, retry_over_query_limit=False
+            )
+
+    map_client.places_nearby.assert_not_called()
+
+
+def test_gather_api_calls_skips_negative_cached_requests(map_service: MapServices):
+    requested_urls = []
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_results.return_value = [
+        None,
+        {"exception": "ZeroResultException", "detail": {"status": 204}},
+    ]
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(
+        map_services, "negative_cache", NegativeCache(ttl=60)
+    ), patch.object(
+        AsyncMapClientFactory,
+        "create_async_map_client",
+        side_effect=lambda: httpx.AsyncClient(
+            transport=mock_google_maps_transport(requested_urls)
+        ),
+    ):
+        with pytest.raises(ZeroResultException):
+            map_service._gather_api_calls(
+                "geocode_address", MagicMock(), MagicMock(), [("판교역",), ("없는주소",)]
+            )
+
+    assert requested_urls == []
+    redis_services.get_cached_negative_results.assert_called_once()
+    redis_services.get_cached_negative_result.assert_not_called()
+
+
+def test_get_geocoded_addresses_only_requests_missing(map_service: MapServices):
+    requested_urls = []
+    redis_services = MagicMock()
+    redis_services.get_cached_address_coordinates.side_effect = lambda address: (
+        {"latitude": 37.0, "longitude": 127.0} if address == "판교역" else None
+    )
+    redis_services.acquire_leases.side_effect = lambda keys, token, ttl: [True] * len(
+        keys
+    )
+    transport = mock_google_maps_transport(requested_urls)
+
+    with patch(
+        "app.services.map_services.RedisServicesFactory.create_redis_services",
+        return_value=redis_services,
+    ), patch.object(
+        AsyncMapClientFactory,
+        "create_async_map_client",
+        side_effect=lambda: httpx.AsyncClient(transport=transport),
+    ), patch.object(
+        crud, "geocode", MemoryCRUDGeocode()
+    ):
+        response = map_service.get_geocoded_addresses(
+            MagicMock(),
+            MagicMock(),
+            ["판교역", "서현역앞", "양재역입구앞", " 서현역앞 "],
+        )
+
+    assert [geocoded.latitude for geocoded in response] == [37.0, 4, 6, 4]
+    assert len(requested_urls) == 2
+    assert redis_services.cache_address_coordinates.call_count == 2
+
+
+def test_get_complete_addresses(map_service: MapServices):
+    requested_urls = []
+    transport = mock_google_maps_transport(requested_urls)
+    redis_services = MagicMock()
+    redis_services.get_cached_autocomplete_predictions.side_effect = lambda keys: (
+        [[{"description": "대한민국 강남역"}]] + [None] * (len(keys) - 1)
+        if keys[0] == "autocomplete:all:강남역"
+        else [None] * len(keys)
+    )
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ), patch.object(
+        AsyncMapClientFactory,
+        "create_async_map_client",
+        side_effect=lambda: httpx.AsyncClient(transport=transport),
+    ):
+        response = map_service.get_complete_addresses(
+            MagicMock(), MagicMock(), ["판교역", "강남역", "서현역"]
+        )
+
+    assert response == ["대한민국 판교역", "대한민국 강남역", "대한민국 서현역"]
+    assert len(requested_urls) == 2
+    redis_services.cache_autocomplete_predictions.assert_called_once_with(
+        {
+            "autocomplete:all:판교역": [{"description": "대한민국 판교역"}],
+            "autocomplete:all:서현역": [{"description": "대한민국 서현역"}],
+        }
+    )
+
+
+def test_get_distance_matrix_for_places_splits_into_tiles(map_service: MapServices):
+    origins = [f"origin_{idx}" for idx in range(5)]
+    destinations = [f"place_{idx}" for idx in range(30)]
+
+    def calculate_tiles(api_call_name, db, user, arguments):
+        return [
+            [
+                DistanceInfo(
+                    origin=origin,
+                    destination=destination,
+                    destination_id=destination,
+                    distance_text=None,
+                    distance_value=1,
+                    duration_text=None,
+                    duration_value=1,
+                )
+                for origin in tile["origins"]
+                for destination in tile["destinations"]
+            ]
+            for tile in arguments
+        ]
+
+    map_service._gather_api_calls = MagicMock(side_effect=calculate_tiles)
+    map_service.map_adapter.calculate_distance_matrix = MagicMock()
+
+    response = map_service.get_distance_matrix_for_places(
+        MagicMock(), MagicMock(), origins, destinations, "transit", is_place_id=False
+    )
+
+    tiles = map_service._gather_api_calls.call_args.args[3]
+    assert len(tiles) > 1
+    assert all(len(t["origins"]) * len(t["destinations"]) <= 100 for t in tiles)
+    assert [(info.origin, info.destination) for info in response] == [
+        (origin, destination) for origin in origins for destination in destinations
+    ]
+    map_service.map_adapter.calculate_distance_matrix.assert_not_called()
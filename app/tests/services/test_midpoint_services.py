@@ -4,6 +4,7 @@ from app.services.midpoint_services import (
     calculate_midpoint_from_addresses,
     calculate_midpoint_harvarsine,
     harversine_distance,
+    harversine_distance_matrix,
 )
 
 
@@ -52,3 +53,22 @@ def test_harversine_distance():
     distance = harversine_distance(loc1, loc2)
 
     assert int(distance) == 141936
+
+
+def test_harversine_distance_matrix():
+    origins = [
+        GeocodeResponse(latitude=37.0, longitude=127.0),
+        GeocodeResponse(latitude=38.0, longitude=128.0),
+    ]
+    destinations = [
+        GeocodeResponse(latitude=38.0, longitude=128.0),
+        GeocodeResponse(latitude=37.0, longitude=127.0),
+        GeocodeResponse(latitude=37.5, longitude=127.5),
+    ]
+
+    distances = harversine_distance_matrix(origins, destinations)
+
+    assert distances.shape == (2, 3)
+    assert int(distances[0][0]) == int(harversine_distance(origins[0], destinations[0]))
+    assert int(distances[1][1]) == 141936
+    assert distances[0][1] == 0
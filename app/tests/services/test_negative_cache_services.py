@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock, patch
+
+from app.services.negative_cache_services import NegativeCache
+from app.services.redis_services import RedisServicesFactory, RedisUnavailableError
+
+
+def test_negative_cache_key_ignores_session_token():
+    negative_cache = NegativeCache(ttl=60)
+
+    assert negative_cache.build_key(
+        "auto_complete_place", ("강남",), {"session_token": "a"}
+    ) == negative_cache.build_key(
+        "auto_complete_place", ("강남",), {"session_token": "b"}
+    )
+    assert negative_cache.build_key(
+        "auto_complete_place", ("강남",), {}
+    ) != negative_cache.build_key("geocode_address", ("강남",), {})
+
+
+def test_negative_cache_get_and_set():
+    negative_cache = NegativeCache(ttl=60)
+    result = {"exception": "ZeroResultException", "detail": {"status": 204}}
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_result.return_value = result
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        negative_cache.set("geocode_address", ("없는주소",), {}, result)
+        cached_result = negative_cache.get("geocode_address", ("없는주소",), {})
+
+    key = negative_cache.build_key("geocode_address", ("없는주소",), {})
+    assert cached_result == result
+    redis_services.cache_negative_result.assert_called_once_with(key, result, 60)
+    redis_services.get_cached_negative_result.assert_called_once_with(key)
+
+
+def test_negative_cache_disabled():
+    negative_cache = NegativeCache(ttl=0)
+    redis_services = MagicMock()
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        negative_cache.set("geocode_address", ("없는주소",), {}, {})
+        assert negative_cache.get("geocode_address", ("없는주소",), {}) is None
+
+    redis_services.cache_negative_result.assert_not_called()
+    redis_services.get_cached_negative_result.assert_not_called()
+
+
+def test_negative_cache_redis_unavailable():
+    negative_cache = NegativeCache(ttl=60)
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_result.side_effect = RedisUnavailableError()
+    redis_services.cache_negative_result.side_effect = RedisUnavailableError()
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        negative_cache.set("geocode_address", ("없는주소",), {}, {})
+        assert negative_cache.get("geocode_address", ("없는주소",), {}) is None
+
+
+def test_negative_cache_get_many():
+    negative_cache = NegativeCache(ttl=60)
+    result = {"exception": "ZeroResultException", "detail": {"status": 204}}
+    redis_services = MagicMock()
+    redis_services.get_cached_negative_results.return_value = [None, result]
+    requests = [(("판교역",), {}), (("없는주소",), {})]
+
+    with patch.object(
+        RedisServicesFactory, "create_redis_services", return_value=redis_services
+    ):
+        cached_results = negative_cache.get_many("geocode_address", requests)
+
+    assert cached_results == [None, result]
+    redis_services.get_cached_negative_results.assert_called_once_with(
+        [negative_cache.build_key("geocode_address", *request) for request in requests]
+    )
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock
+
+import msgpack
+
+from app.schemas.place import Place, PlaceCreate, PlaceType
+from app.services.constants import PLACETYPE
+from app.services.place_cache_services import (
+    PlaceCache,
+    deserialize_place,
+    serialize_place,
+)
+
+
+def make_place(place_id: str) -> PlaceCreate:
+    return PlaceCreate(
+        place_id=place_id,
+        name="판교역",
+        address="경기도 성남시 분당구 판교역로 160",
+        user_ratings_total=10,
+        rating=4.5,
+        place_types=["cafe", "food"],
+        location_id=1,
+    )
+
+
+def test_serialize_place_round_trip():
+    record = serialize_place(make_place("1"))
+
+    place = deserialize_place(msgpack.unpackb(msgpack.packb(record)))
+
+    assert isinstance(place, Place)
+    assert place.place_id == "1"
+    assert place.rating == 4.5
+    assert place.place_types == [
+        PlaceType(type_name="cafe"),
+        PlaceType(type_name="food"),
+    ]
+
+
+def test_place_cache_get_and_set():
+    redis_services = MagicMock()
+    redis_services.get_cached_place_records.return_value = [
+        [serialize_place(make_place("1"))],
+        None,
+    ]
+    place_cache = PlaceCache(redis_services, PLACETYPE.CAFE)
+
+    cached = place_cache.get([b"wydm9", "wydm8"])
+
+    redis_services.get_cached_place_records.assert_called_once_with(
+        ["places:cafe:wydm9", "places:cafe:wydm8"]
+    )
+    assert list(cached) == ["wydm9"]
+    assert cached["wydm9"][0].place_id == "1"
+
+    place_cache.set({"wydm8": [make_place("2")]})
+
+    redis_services.cache_place_records.assert_called_once_with(
+        {"places:cafe:wydm8": [serialize_place(make_place("2"))]}
+    )
+
+
+def test_place_cache_load():
+    place_cache = PlaceCache(MagicMock(), PLACETYPE.CAFE)
+
+    cached = place_cache.load(
+        {"wydm9": [serialize_place(make_place("1"))], "wydm8": None}
+    )
+
+    assert list(cached) == ["wydm9"]
+    assert cached["wydm9"][0].place_id == "1"
@@ -1,17 +1,31 @@
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import googlemaps
 import pytz
 from sqlalchemy.orm import Session
 
+from app import crud
 from app.core.settings.app import AppSettings
 from app.crud.crud_place import CRUDPlaceFactory
 from app.models.place import Place
-from app.schemas.google_maps_api import GeocodeResponse
-from app.services.constants import PLACETYPE, REDIS_SEARCH_RADIUS
-from app.services.recommend_services import CandidateFetcher, Recommender
-from app.services.redis_services import RedisServicesFactory
-from app.tests.utils.places import create_random_place, user_preferences
+from app.schemas.google_maps_api import GeocodeResponse, UserPreferences
+from app.schemas.place import PlaceCreate
+from app.services.cache_refresh_services import cache_refresher
+from app.services.constants import PLACETYPE, Radius
+from app.services.place_cache_services import PlaceCache
+from app.services.recommend_services import CandidateFetcher, Recommender, settings
+from app.services.redis_services import (
+    RedisServicesFactory,
+    RedisUnavailableError,
+    nearby_places_geohash,
+)
+from app.tests.utils.places import (
+    create_random_place,
+    distance_infos_to,
+    user_preferences,
+)
+from app.tests.utils.queries import assert_max_queries
 
 
 def test_candidate_fetcher_fetch_by_address(
@@ -33,15 +47,84 @@ def test_candidate_fetcher_fetch_by_address(
 
 
 def test_get_cached_places(db: Session, map_service, normal_user, redis_services):
-    redis_services.add_location_to_redis(37.0, 127.0)
-    redis_services.cache_nearby_places_response(37.0, 127.0, ["test"])
+    redis_services.cache_nearby_places_with_location(
+        37.0, 127.0, [{"place_id": "test"}], PLACETYPE.CAFE
+    )
+    # NOTE: 인접한 셀에 캐싱된 응답도 함께 조회되어야 함
+    redis_services.cache_nearby_places_with_location(
+        37.004,
+        127.004,
+        [{"place_id": "test"}, {"place_id": "test2"}],
+        PLACETYPE.CAFE,
+    )
 
-    map_service.process_nearby_places_results = MagicMock(return_value=["test"])
+    place = PlaceCreate(
+        place_id="test", address="판교역", place_types=["cafe"], location_id=1
+    )
+    map_service.process_nearby_places_results = MagicMock(return_value=[place])
     candidate_fetcher = CandidateFetcher(db, normal_user, map_service, redis_services)
 
-    places = candidate_fetcher._get_cached_places(37.0, 127.0, REDIS_SEARCH_RADIUS)
+    places, _ = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
 
-    assert places == ["test"]
+    assert places == [place]
+    map_service.process_nearby_places_results.assert_called_once()
+    merged_results = map_service.process_nearby_places_results.call_args.args[2]
+    assert sorted(result["place_id"] for result in merged_results) == [
+        "test",
+        "test2",
+    ]
+
+
+def test_get_cached_places_from_resolved_cache(
+    db: Session, map_service, normal_user, redis_services
+):
+    geohash = nearby_places_geohash(37.0, 127.0, Radius.FIRST_RADIUS.value)
+    place = PlaceCreate(
+        place_id="test", address="판교역", place_types=["cafe"], location_id=1
+    )
+    PlaceCache(redis_services, PLACETYPE.CAFE).set({geohash: [place]})
+
+    map_service.process_nearby_places_results = MagicMock()
+    candidate_fetcher = CandidateFetcher(db, normal_user, map_service, redis_services)
+
+    places, _ = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
+
+    assert [cached_place.place_id for cached_place in places] == ["test"]
+    map_service.process_nearby_places_results.assert_not_called()
+
+
+def test_get_cached_places_other_place_type(
+    db: Session, map_service, normal_user, redis_services
+):
+    redis_services.cache_nearby_places_with_location(
+        37.0, 127.0, [{"place_id": "test"}], PLACETYPE.RESTAURANT
+    )
+
+    map_service.process_nearby_places_results = MagicMock()
+    candidate_fetcher = CandidateFetcher(db, normal_user, map_service, redis_services)
+
+    places, _ = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
+
+    assert places == []
+    map_service.process_nearby_places_results.assert_not_called()
+
+
+def test_get_cached_places_redis_unavailable(db: Session, map_service):
+    redis_services = MagicMock()
+    redis_services.find_cached_places_in_radius.side_effect = RedisUnavailableError()
+    candidate_fetcher = CandidateFetcher(db, MagicMock(), map_service, redis_services)
+
+    places, _ = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
+
+    assert places == []
 
 
 def test_get_cached_places_no_cache(db: Session, map_service, normal_user):
@@ -49,7 +132,9 @@ def test_get_cached_places_no_cache(db: Session, map_service, normal_user):
 
     candidate_fetcher = CandidateFetcher(db, normal_user, map_service, redis_services)
 
-    places = candidate_fetcher._get_cached_places(37.0, 127.0, REDIS_SEARCH_RADIUS)
+    places, _ = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
 
     assert places == []
 
@@ -57,17 +142,73 @@ def test_get_cached_places_no_cache(db: Session, map_service, normal_user):
 def test_fetch_places_by_coordinates_with_cached(
     db: Session, map_service, normal_user, redis_services
 ):
-    redis_services.add_location_to_redis(37.0, 127.0)
-    redis_services.cache_nearby_places_response(37.0, 127.0, ["test"])
-
     candidate_fetcher = CandidateFetcher(db, normal_user, map_service, redis_services)
-    candidate_fetcher._get_cached_places = MagicMock(return_value=["test"])
+    candidate_fetcher._get_cached_places = MagicMock(return_value=(["test"], False))
 
     places = candidate_fetcher.fetch_places_by_coordinates(37.0, 127.0, PLACETYPE.CAFE)
 
     assert places == ["test"]
 
 
+def test_get_cached_places_stale():
+    redis_services = MagicMock()
+    redis_services.find_cached_places_in_radius.return_value = [
+        (
+            "wydm9",
+            [{"place_id": "1", "address": "판교역", "place_types": []}],
+            None,
+            0.0,
+        )
+    ]
+    candidate_fetcher = CandidateFetcher(
+        MagicMock(), MagicMock(), MagicMock(), redis_services
+    )
+
+    places, is_stale = candidate_fetcher._get_cached_places(
+        37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+    )
+
+    assert [place.place_id for place in places] == ["1"]
+    assert is_stale
+
+
+def test_fetch_places_by_coordinates_serves_stale_and_refreshes():
+    map_service = MagicMock()
+    candidate_fetcher = CandidateFetcher(
+        MagicMock(), MagicMock(), map_service, MagicMock()
+    )
+    candidate_fetcher._get_cached_places = MagicMock(return_value=(["stale"], True))
+
+    with patch.object(cache_refresher, "schedule") as mock_schedule:
+        places = candidate_fetcher.fetch_places_by_coordinates(
+            37.0, 127.0, PLACETYPE.CAFE
+        )
+
+    assert places == ["stale"]
+    map_service.get_nearby_places.assert_not_called()
+    mock_schedule.assert_called_once()
+
+
+def test_fetch_places_by_coordinates_over_query_limit(monkeypatch):
+    monkeypatch.setattr(settings, "STALE_WHILE_REVALIDATE", False)
+    map_service = MagicMock()
+    map_service.get_nearby_places.side_effect = googlemaps.exceptions.ApiError(
+        "OVER_QUERY_LIMIT"
+    )
+    candidate_fetcher = CandidateFetcher(
+        MagicMock(), MagicMock(), map_service, MagicMock()
+    )
+    candidate_fetcher._get_cached_places = MagicMock(return_value=(["stale"], True))
+
+    places = candidate_fetcher.fetch_places_by_coordinates(37.0, 127.0, PLACETYPE.CAFE)
+
+    assert places == ["stale"]
+    assert (
+        map_service.get_nearby_places.call_args.kwargs["retry_over_query_limit"]
+        is False
+    )
+
+
 def test_candidate_fetcher_fetch_by_midpoint(db: Session, map_service, normal_user):
     map_service = MagicMock()
     map_service.get_geocoded_addresses.return_value = [
@@ -198,7 +339,8 @@ def test_compute_reccomendation_score_with_preferred_types_rating(
     candidates[0].place_types = ["cafe", "restaurant"]
     candidates[0].rating = 4.0
 
-    score = recommender.compute_recommendation_score(candidates[0])
+    with patch.object(crud.user, "load_profile", return_value=mock_user):
+        score = recommender.compute_recommendation_score(candidates[0])
     assert score == 6.0
 
 
@@ -208,8 +350,16 @@ def test_compute_reccomendation_score_with_search_history_relations(
     mock_user = MagicMock()
     mock_user.interested_places = []
     mock_user.search_history_relations = [
-        MagicMock(address="판교역", created_at=datetime.now(pytz.utc) - timedelta(days=6)),
-        MagicMock(address="서현역", created_at=datetime.now(pytz.utc) - timedelta(days=6)),
+        MagicMock(
+            address="판교역",
+            hit_count=1,
+            last_searched_at=datetime.now(pytz.utc) - timedelta(days=6),
+        ),
+        MagicMock(
+            address="서현역",
+            hit_count=1,
+            last_searched_at=datetime.now(pytz.utc) - timedelta(days=6),
+        ),
     ]
     recommender = Recommender(db, mock_user, map_service, user_preferences)
     crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV)
@@ -217,7 +367,8 @@ def test_compute_reccomendation_score_with_search_history_relations(
 
     candidates[0].rating = 4.0
 
-    score = recommender.compute_recommendation_score(candidates[0])
+    with patch.object(crud.user, "load_profile", return_value=mock_user):
+        score = recommender.compute_recommendation_score(candidates[0])
     assert score <= 6.0
 
 
@@ -255,3 +406,99 @@ def test_rank_candidates(db, settings: AppSettings, map_service, normal_user):
     )
 
     assert results == [candidates[1], candidates[0]]
+
+
+def test_rank_candidates_query_budget(db: Session, settings: AppSettings, normal_user):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV, False)
+    places = [
+        create_random_place(db, crud_place, types=["cafe", "bakery"]) for _ in range(5)
+    ]
+    for place in places[:2]:
+        crud.user.mark_interest(db, normal_user, place)
+    crud.user.add_search_history(db, normal_user, [place.address for place in places])
+    candidates = crud_place.get_by_place_ids(db, [place.place_id for place in places])
+    map_service = MagicMock()
+    map_service.get_distance_matrix_for_places.return_value = distance_infos_to(
+        candidates, "37.0,127.0"
+    )
+    recommender = Recommender(
+        db,
+        normal_user,
+        map_service,
+        UserPreferences(place_type=PLACETYPE.CAFE, return_count=5),
+    )
+
+    # NOTE: 후보 수와 관계없이 사용자, 관심 장소, 관심 장소 유형, 검색 기록 조회
+    with assert_max_queries(db.get_bind(), 4):
+        results = recommender.rank_candidates(candidates, addresses=["37.0,127.0"])
+
+    assert len(results) == 5
+    db.delete(normal_user)
+    db.commit()
+
+
+def test_prefilter_candidates(db, settings: AppSettings, map_service, normal_user):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV)
+    candidates = [create_random_place(db, crud_place) for _ in range(3)]
+    recommender = Recommender(
+        db,
+        normal_user,
+        map_service,
+        UserPreferences(place_type=PLACETYPE.CAFE, return_count=1, prefilter_count=2),
+    )
+    recommender._get_participant_coordinates = MagicMock(
+        return_value=[GeocodeResponse(latitude=37.0, longitude=127.0)]
+    )
+    recommender._get_candidate_coordinates = MagicMock(
+        return_value={
+            candidates[0].place_id: GeocodeResponse(latitude=38.0, longitude=128.0),
+            candidates[1].place_id: GeocodeResponse(latitude=37.1, longitude=127.1),
+            candidates[2].place_id: GeocodeResponse(latitude=37.0, longitude=127.0),
+        }
+    )
+
+    results = recommender._prefilter_candidates(["37.0,127.0"], candidates)
+
+    assert results == [candidates[1], candidates[2]]
+
+
+def test_prefilter_candidates_keeps_max_results(db, settings: AppSettings):
+    crud_place = CRUDPlaceFactory.get_instance(settings.APP_ENV)
+    candidates = [create_random_place(db, crud_place) for _ in range(25)]
+    recommender = Recommender(
+        db,
+        MagicMock(),
+        MagicMock(),
+        UserPreferences(place_type=PLACETYPE.CAFE, return_count=20),
+    )
+    recommender._get_participant_coordinates = MagicMock(
+        return_value=[GeocodeResponse(latitude=37.0, longitude=127.0)]
+    )
+    recommender._get_candidate_coordinates = MagicMock(
+        return_value={
+            candidate.place_id: GeocodeResponse(
+                latitude=37.0 + idx * 0.01, longitude=127.0
+            )
+            for idx, candidate in enumerate(candidates)
+        }
+    )
+
+    results = recommender._prefilter_candidates(["37.0,127.0"], candidates)
+
+    assert results == candidates[:20]
+
+
+def test_get_participant_coordinates(db, map_service, normal_user):
+    map_service = MagicMock()
+    map_service.get_geocoded_addresses.return_value = [
+        GeocodeResponse(latitude=37.394776, longitude=127.11116)
+    ]
+    recommender = Recommender(db, normal_user, map_service, user_preferences)
+
+    coordinates = recommender._get_participant_coordinates(["37.0,127.0", "판교역"])
+
+    assert coordinates == [
+        GeocodeResponse(latitude=37.0, longitude=127.0),
+        GeocodeResponse(latitude=37.394776, longitude=127.11116),
+    ]
+    map_service.get_geocoded_addresses.assert_called_once_with(db, normal_user, ["판교역"])
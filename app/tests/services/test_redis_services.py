@@ -1,8 +1,23 @@
+import time
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import ANY, Mock
 
-from app.services.constants import RedisKey
-from app.services.redis_services import RedisOperationError, RedisServicesFactory
+import redis
+
+from app.services.constants import PLACETYPE, Radius
+from app.services.redis_services import (
+    RedisCircuitBreaker,
+    RedisOperationError,
+    RedisServicesFactory,
+    RedisUnavailableError,
+    geocode_key,
+    geolocations_expiry_key,
+    nearby_places_cells,
+    nearby_places_key,
+    nearby_places_precision,
+    places_key,
+    reverse_geocode_key,
+)
 
 
 class RedisServicesTest(TestCase):
@@ -15,65 +30,76 @@ class RedisServicesTest(TestCase):
         )
         self.redis_client.flushdb()
 
-    def test_add_location_to_redis(self):
-        assert len(self.redis_client.keys("*")) == 0
-        result = self.redis_service.add_location_to_redis(37.0, 127.0)
-        self.assertIsNotNone(result)
-        assert len(self.redis_client.keys("*")) == 1
-        assert (
-            self.redis_client.keys("*")[0].decode("utf-8")
-            == RedisKey.GEOLOCATIONS_KEY.value
+    def test_remove_expired_locations(self):
+        geohash = self.redis_service.cache_nearby_places_with_location(
+            37.0, 127.0, [{"a": "cafe"}], PLACETYPE.CAFE
+        )
+        self.redis_service.cache_nearby_places_with_location(
+            37.0, 127.0, [{"a": "restaurant"}], PLACETYPE.RESTAURANT
         )
 
-    def test_add_location_to_redis_failure(self):
-        self.mock_redis_client.geoadd.side_effect = RedisOperationError("Some error")
-
-        with self.assertRaises(RedisOperationError):
-            self.redis_service.add_location_to_redis(123.0, 456.0)
-
-    def test_find_geohashes_in_radius(self):
-        self.redis_service.add_location_to_redis(37.0, 127.0)
-        assert len(self.redis_client.keys("*")) == 1
-        result = self.redis_service.find_geohashes_in_radius(37.0, 127.0, 100)
-        self.assertIsNotNone(result)
-        self.assertTrue(len(result) == 1)
-
-    def test_find_geohashes_in_radius_failure(self):
-        self.mock_redis_client.geosearch.side_effect = RedisOperationError("Some error")
+        self.assertEqual(self.redis_service.remove_expired_locations(), 0)
+        self.assertEqual(
+            self.redis_service.remove_expired_locations(now=time.time() + 86400 * 2), 2
+        )
+        self.assertIsNone(
+            self.redis_client.zscore(geolocations_expiry_key(PLACETYPE.CAFE), geohash)
+        )
 
-        with self.assertRaises(RedisOperationError):
-            self.mock_redis_service.find_geohashes_in_radius(123.0, 456.0, 100)
+    def test_cache_nearby_places_with_location(self):
+        geohash = self.redis_service.cache_nearby_places_with_location(
+            37.0, 127.0, [{"a": "cafe"}], PLACETYPE.CAFE
+        )
 
-    def test_cache_nearby_places_response(self):
-        self.redis_service.add_location_to_redis(37.0, 127.0)
-        assert len(self.redis_client.keys("*")) == 1
-        result = self.redis_service.cache_nearby_places_response(37.0, 127.0, [])
-        assert len(self.redis_client.keys("*")) == 2
-        self.assertTrue(result)
+        self.assertIsNotNone(
+            self.redis_client.zscore(geolocations_expiry_key(PLACETYPE.CAFE), geohash)
+        )
+        assert sorted(key.decode("utf-8") for key in self.redis_client.keys("*")) == [
+            geolocations_expiry_key(PLACETYPE.CAFE),
+            nearby_places_key(geohash, PLACETYPE.CAFE),
+        ]
 
-    def test_cache_nearby_places_response_failure(self):
-        self.mock_redis_client.set.side_effect = RedisOperationError("Some error")
+    def test_cache_nearby_places_with_location_failure(self):
+        self.mock_redis_client.pipeline.side_effect = redis.RedisError("Some error")
 
         with self.assertRaises(RedisOperationError):
-            self.mock_redis_service.cache_nearby_places_response(123.0, 456.0, [])
+            self.mock_redis_service.cache_nearby_places_with_location(
+                37.0, 127.0, [], PLACETYPE.CAFE
+            )
 
-    def test_get_cached_nearby_places_responses(self):
-        self.redis_service.add_location_to_redis(37.0, 127.0)
-        assert len(self.redis_client.keys("*")) == 1
+    def test_find_cached_places_in_radius(self):
+        cafe_geohash = self.redis_service.cache_nearby_places_with_location(
+            37.0, 127.0, [{"a": "cafe"}], PLACETYPE.CAFE
+        )
+        other_geohash = self.redis_service.cache_nearby_places_with_location(
+            37.004, 127.004, [{"a": "other"}], PLACETYPE.CAFE
+        )
+        self.redis_service.cache_nearby_places_with_location(
+            37.03, 127.03, [{"a": "far"}], PLACETYPE.CAFE
+        )
+        self.redis_service.cache_place_records(
+            {places_key(cafe_geohash, PLACETYPE.CAFE): [{"place_id": "1"}]}
+        )
 
-        self.redis_service.cache_nearby_places_response(37.0, 127.0, [{"a": "b"}])
-        assert len(self.redis_client.keys("*")) == 2
-        geohashes = self.redis_service.find_geohashes_in_radius(37.0, 127.0, 100)
+        results = self.redis_service.find_cached_places_in_radius(
+            37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+        )
 
-        result = self.redis_service.get_cached_nearby_places_responses(geohashes)
-        self.assertIsNotNone(result)
-        self.assertTrue(len(result) > 0)
+        self.assertCountEqual(
+            results,
+            [
+                (cafe_geohash, [{"place_id": "1"}], None, ANY),
+                (other_geohash, None, [{"a": "other"}], ANY),
+            ],
+        )
 
-    def test_get_cached_nearby_places_responses_failure(self):
-        self.mock_redis_client.mget.side_effect = RedisOperationError("Some error")
+    def test_find_cached_places_in_radius_failure(self):
+        self.mock_redis_client.pipeline.side_effect = redis.RedisError("Some error")
 
         with self.assertRaises(RedisOperationError):
-            self.mock_redis_service.get_cached_nearby_places_responses(["123"])
+            self.mock_redis_service.find_cached_places_in_radius(
+                37.0, 127.0, Radius.FIRST_RADIUS.value, PLACETYPE.CAFE
+            )
 
     def test_cache_address_coordinates(self):
         assert len(self.redis_client.keys("*")) == 0
@@ -82,10 +108,10 @@ class RedisServicesTest(TestCase):
         )
         self.assertTrue(result)
         assert len(self.redis_client.keys("*")) == 1
-        assert self.redis_client.keys("*")[0].decode("utf-8") == "판교역"
+        assert self.redis_client.keys("*")[0].decode("utf-8") == "geocode:판교역"
 
     def test_cache_address_coordinates_failure(self):
-        self.mock_redis_client.set.side_effect = RedisOperationError("Some error")
+        self.mock_redis_client.pipeline.side_effect = RedisOperationError("Some error")
 
         with self.assertRaises(RedisOperationError):
             self.mock_redis_service.cache_address_coordinates("판교역", 37.0, 127.0)
@@ -100,11 +126,152 @@ class RedisServicesTest(TestCase):
         self.assertTrue(result1["latitude"] == 37.394776)
         self.assertTrue(result1["longitude"] == 127.11116)
 
+    def test_get_cached_address_coordinates_normalized(self):
+        self.redis_service.cache_address_coordinates("판교역", 37.39477612, 127.1111634)
+
+        result = self.redis_service.get_cached_address_coordinates("  판교역 ")
+
+        self.assertEqual(result, {"latitude": 37.39477612, "longitude": 127.1111634})
+
     def test_get_cached_address_coordinates_failure(self):
         self.mock_redis_client.get.side_effect = RedisOperationError("Some error")
 
         with self.assertRaises(RedisOperationError):
             self.mock_redis_service.get_cached_address_coordinates("판교역")
 
+    def test_cache_distance_infos(self):
+        result = self.redis_service.cache_distance_infos(
+            {"distance_matrix:transit:0-1:wyd63zw:place_1": {"distance_value": 100}}
+        )
+        self.assertTrue(result)
+
+        cached = self.redis_service.get_cached_distance_infos(
+            [
+                "distance_matrix:transit:0-1:wyd63zw:place_1",
+                "distance_matrix:transit:0-1:wyd63zw:place_2",
+            ]
+        )
+        self.assertEqual(cached, [{"distance_value": 100}, None])
+
+    def test_get_cached_distance_infos_failure(self):
+        self.mock_redis_client.mget.side_effect = RedisOperationError("Some error")
+
+        with self.assertRaises(RedisOperationError):
+            self.mock_redis_service.get_cached_distance_infos(["123"])
+
+    def test_cache_place_records(self):
+        result = self.redis_service.cache_place_records(
+            {"places:cafe:wydm9": [{"place_id": "1", "place_types": ["cafe"]}]}
+        )
+        self.assertTrue(result)
+
+        cached = self.redis_service.get_cached_place_records(
+            ["places:cafe:wydm9", "places:cafe:wydm8"]
+        )
+        self.assertEqual(cached, [[{"place_id": "1", "place_types": ["cafe"]}], None])
+
+    def test_get_cached_place_records_failure(self):
+        self.mock_redis_client.mget.side_effect = RedisOperationError("Some error")
+
+        with self.assertRaises(RedisOperationError):
+            self.mock_redis_service.get_cached_place_records(["123"])
+
     def tearDown(self):
         self.redis_client.flushdb()
+
+
+def test_place_type_keys():
+    assert geolocations_expiry_key(PLACETYPE.CAFE) == "geolocations:cafe:expiry"
+    assert nearby_places_key(b"wydm9") == "wydm9"
+    assert nearby_places_key("wydm9", PLACETYPE.CAFE) == "nearby_places:cafe:wydm9"
+
+
+def test_reverse_geocode_key_quantizes_coordinates():
+    assert reverse_geocode_key(37.3947761, 127.1111601) == reverse_geocode_key(
+        37.3947768, 127.1111609
+    )
+    assert reverse_geocode_key(37.394776, 127.11116) != reverse_geocode_key(
+        37.395776, 127.11116
+    )
+
+
+def test_geocode_key_normalizes_address():
+    assert geocode_key(" 판교역  1번 출구 ") == "geocode:판교역 1번 출구"
+    assert geocode_key("ＡＢＣ역") == geocode_key("abc역")
+
+
+def test_circuit_breaker_opens_after_connection_failures():
+    redis_client = Mock()
+    redis_client.get.side_effect = redis.ConnectionError("connection refused")
+    circuit_breaker = RedisCircuitBreaker(
+        failure_threshold=2,
+        recovery_interval=60,
+        redis_client_factory=Mock,
+    )
+    redis_services = RedisServicesFactory.create_redis_services(
+        redis_client, local_caches=None, circuit_breaker=circuit_breaker
+    )
+
+    for _ in range(2):
+        try:
+            redis_services.get_cached_address_coordinates("판교역")
+        except RedisOperationError:
+            pass
+
+    assert circuit_breaker.is_open
+    try:
+        redis_services.get_cached_address_coordinates("판교역")
+        assert False
+    except RedisUnavailableError:
+        pass
+    assert redis_client.get.call_count == 2
+
+
+def test_circuit_breaker_ignores_command_errors():
+    redis_client = Mock()
+    redis_client.get.side_effect = redis.ResponseError("wrong type")
+    circuit_breaker = RedisCircuitBreaker(failure_threshold=1)
+    redis_services = RedisServicesFactory.create_redis_services(
+        redis_client, local_caches=None, circuit_breaker=circuit_breaker
+    )
+
+    try:
+        redis_services.get_cached_address_coordinates("판교역")
+    except RedisOperationError:
+        pass
+
+    assert not circuit_breaker.is_open
+
+
+def test_circuit_breaker_closes_after_probe():
+    probe_client = Mock()
+    circuit_breaker = RedisCircuitBreaker(
+        failure_threshold=1,
+        recovery_interval=0.01,
+        redis_client_factory=lambda: probe_client,
+    )
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open
+    for _ in range(100):
+        if not circuit_breaker.is_open:
+            break
+        time.sleep(0.01)
+
+    assert not circuit_breaker.is_open
+    probe_client.ping.assert_called()
+
+
+def test_nearby_places_precision():
+    assert nearby_places_precision(Radius.AUTO_COMPLETE_RADIUS.value) == 7
+    assert nearby_places_precision(Radius.FIRST_RADIUS.value) == 6
+    assert nearby_places_precision(Radius.THIRD_RADIUS.value) == 5
+
+
+def test_nearby_places_cells():
+    cells = nearby_places_cells(37.0, 127.0, Radius.FIRST_RADIUS.value)
+
+    assert len(cells) == 9
+    assert cells[0] == "wyd63z"
+    assert all(len(cell) == 6 for cell in cells)
+    assert "wyd6d0" in cells
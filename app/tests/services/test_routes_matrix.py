@@ -1,3 +1,4 @@
+from dataclasses import replace
 from unittest.mock import patch
 
 import pytest
@@ -5,8 +6,14 @@ import pytest
 from app.core.settings.app import AppSettings
 from app.crud.crud_place import CRUDPlaceFactory
 from app.schemas.google_maps_api import DistanceInfo
-from app.services.constants import AGGREGATED_ATTR
-from app.services.routes_matrix_services import DestinationSummary, RoutesMatrix
+from app.services.constants import AGGREGATED_ATTR, AGGREGATION
+from app.services.routes_matrix_services import (
+    DestinationSummary,
+    DistanceMatrixTile,
+    RoutesMatrix,
+    merge_distance_matrix_tiles,
+    plan_distance_matrix_tiles,
+)
 from app.tests.utils.places import create_random_place, distance_info_list
 
 
@@ -85,3 +92,89 @@ def test_sort_destinations_by_aggregated_attr():
             + distance_info_list[3].duration_value,
         ),
     ]
+
+
+def test_columnar_routes_matrix():
+    columnar = RoutesMatrix(distance_info_list).columnar
+
+    assert columnar.destination_ids == [
+        "ChIJN1t_tDeuEmsRUsoyG83frY1",
+        "ChIJN1t_tDeuEmsRUsoyG83frY2",
+    ]
+    assert columnar.distance_value.tolist() == [[100, 1000], [500, 300]]
+    assert columnar.valid.all()
+
+
+def test_sort_destinations_by_max_and_variance():
+    routes_matrix = RoutesMatrix(distance_info_list)
+
+    assert routes_matrix.sort_destinations_by_aggregated_attr(
+        AGGREGATED_ATTR.DISTANCE, 2, AGGREGATION.MAX
+    ) == [
+        DestinationSummary("ChIJN1t_tDeuEmsRUsoyG83frY1", 500),
+        DestinationSummary("ChIJN1t_tDeuEmsRUsoyG83frY2", 1000),
+    ]
+    assert routes_matrix.sort_destinations_by_aggregated_attr(
+        AGGREGATED_ATTR.DISTANCE, 1, AGGREGATION.VARIANCE
+    ) == [DestinationSummary("ChIJN1t_tDeuEmsRUsoyG83frY1", 40000.0)]
+
+
+def test_top_k_destinations_skips_missing_routes():
+    distance_infos = [
+        replace(distance_info_list[0], distance_value=None),
+        *distance_info_list[1:],
+    ]
+    routes_matrix = RoutesMatrix(distance_infos)
+
+    assert routes_matrix.top_k_destination_ids(AGGREGATED_ATTR.DISTANCE, 2) == [
+        "ChIJN1t_tDeuEmsRUsoyG83frY2",
+        "ChIJN1t_tDeuEmsRUsoyG83frY1",
+    ]
+    assert routes_matrix.sort_destinations_by_aggregated_attr(
+        AGGREGATED_ATTR.DISTANCE, 2
+    ) == [DestinationSummary("ChIJN1t_tDeuEmsRUsoyG83frY2", 1300)]
+
+
+def test_plan_distance_matrix_tiles_single_request():
+    tiles = plan_distance_matrix_tiles(3, 20)
+
+    assert tiles == [DistanceMatrixTile(slice(0, 3), slice(0, 20))]
+
+
+def test_plan_distance_matrix_tiles_respects_limits():
+    tiles = plan_distance_matrix_tiles(30, 60)
+
+    covered = set()
+    for tile in tiles:
+        origin_count = tile.origins.stop - tile.origins.start
+        destination_count = tile.destinations.stop - tile.destinations.start
+        assert origin_count <= 25
+        assert destination_count <= 25
+        assert origin_count * destination_count <= 100
+        covered.update(
+            (origin_idx, destination_idx)
+            for origin_idx in range(tile.origins.start, tile.origins.stop)
+            for destination_idx in range(
+                tile.destinations.start, tile.destinations.stop
+            )
+        )
+    assert len(covered) == 30 * 60
+
+
+def test_merge_distance_matrix_tiles():
+    tiles = plan_distance_matrix_tiles(2, 3, max_elements=2)
+    tile_results = [
+        [
+            (origin_idx, destination_idx)
+            for origin_idx in range(tile.origins.start, tile.origins.stop)
+            for destination_idx in range(
+                tile.destinations.start, tile.destinations.stop
+            )
+        ]
+        for tile in tiles
+    ]
+
+    merged = merge_distance_matrix_tiles(tiles, tile_results, 2, 3)
+
+    assert len(tiles) > 1
+    assert merged == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
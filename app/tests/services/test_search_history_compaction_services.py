@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytz
+from sqlalchemy.exc import OperationalError
+
+from app import crud
+from app.services.search_history_compaction_services import SearchHistoryCompactor
+
+
+def test_compact():
+    compactor = SearchHistoryCompactor(
+        retention_days=30, max_per_user=10, session_factory=MagicMock()
+    )
+
+    with patch.object(
+        crud.user, "compact_search_histories", return_value=3
+    ) as mock_compact:
+        assert compactor.compact() == 3
+
+    searched_after = mock_compact.call_args.kwargs["searched_after"]
+    assert mock_compact.call_args.kwargs["max_per_user"] == 10
+    assert abs(
+        searched_after - (datetime.now(pytz.utc) - timedelta(days=30))
+    ) < timedelta(minutes=1)
+
+
+def test_compact_continues_on_db_error():
+    compactor = SearchHistoryCompactor(session_factory=MagicMock())
+
+    with patch.object(
+        crud.user,
+        "compact_search_histories",
+        side_effect=OperationalError("DELETE", {}, Exception("error")),
+    ):
+        assert compactor.compact() == 0
+
+
+def test_compactor_startup_and_shutdown():
+    compactor = SearchHistoryCompactor(interval=0.01, session_factory=MagicMock())
+
+    with patch.object(crud.user, "compact_search_histories", return_value=0):
+        compactor.startup()
+        assert compactor.is_started
+        compactor.shutdown()
+
+    assert not compactor.is_started
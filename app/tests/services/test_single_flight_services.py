@@ -0,0 +1,116 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.redis_services import RedisUnavailableError
+from app.services.single_flight_services import SingleFlight
+
+
+def create_redis_services(acquired: bool = True, held: bool = True) -> MagicMock:
+    redis_services = MagicMock()
+    redis_services.acquire_leases.side_effect = lambda keys, token, ttl: [
+        acquired
+    ] * len(keys)
+    redis_services.get_held_leases.side_effect = lambda keys: [held] * len(keys)
+    return redis_services
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight(wait_timeout=5)
+    redis_services = create_redis_services()
+    started, release = threading.Event(), threading.Event()
+    fetch = MagicMock(side_effect=lambda: started.set() or release.wait() and "판교역")
+    results = []
+
+    def run():
+        results.append(
+            single_flight.run(redis_services, "geocode:판교역", fetch, lambda: None)
+        )
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait()
+
+    follower_waiting = threading.Event()
+    future = single_flight._futures["geocode:판교역"]
+    wait_result = future.result
+    future.result = lambda timeout: follower_waiting.set() or wait_result(timeout)
+    follower = threading.Thread(target=run)
+    follower.start()
+    follower_waiting.wait()
+    release.set()
+    leader.join()
+    follower.join()
+
+    assert results == ["판교역", "판교역"]
+    fetch.assert_called_once()
+    redis_services.acquire_leases.assert_called_once()
+    redis_services.release_leases.assert_called_once()
+
+
+def test_single_flight_waits_for_other_worker():
+    single_flight = SingleFlight(poll_interval=0)
+    redis_services = create_redis_services(acquired=False)
+    read_cached = MagicMock(side_effect=[None, None, "판교역"])
+    fetch = MagicMock()
+
+    result = single_flight.run(redis_services, "geocode:판교역", fetch, read_cached)
+
+    assert result == "판교역"
+    fetch.assert_not_called()
+
+
+def test_single_flight_fetches_when_other_worker_failed():
+    single_flight = SingleFlight(poll_interval=0)
+    redis_services = create_redis_services(acquired=False, held=False)
+    read_cached = MagicMock(return_value=None)
+    fetch = MagicMock(return_value="판교역")
+
+    result = single_flight.run(redis_services, "geocode:판교역", fetch, read_cached)
+
+    assert result == "판교역"
+    assert read_cached.call_count == 2
+    fetch.assert_called_once()
+
+
+def test_single_flight_run_many_splits_leased_keys():
+    single_flight = SingleFlight(poll_interval=0)
+    redis_services = MagicMock()
+    redis_services.acquire_leases.return_value = [True, False]
+    fetch_many = MagicMock(side_effect=lambda keys: [key.upper() for key in keys])
+
+    results = single_flight.run_many(
+        redis_services,
+        ["a", "b"],
+        fetch_many,
+        lambda keys: ["cached"] * len(keys),
+    )
+
+    assert results == ["A", "cached"]
+    fetch_many.assert_called_once_with(["a"])
+
+
+def test_single_flight_without_redis():
+    single_flight = SingleFlight()
+    redis_services = MagicMock()
+    redis_services.acquire_leases.side_effect = RedisUnavailableError()
+
+    result = single_flight.run(
+        redis_services, "geocode:판교역", lambda: "판교역", lambda: None
+    )
+
+    assert result == "판교역"
+
+
+def test_single_flight_propagates_leader_error():
+    single_flight = SingleFlight()
+    redis_services = create_redis_services()
+
+    def fetch():
+        raise ValueError("zero results")
+
+    with pytest.raises(ValueError):
+        single_flight.run(redis_services, "geocode:판교역", fetch, lambda: None)
+    redis_services.release_leases.assert_called_once()
+    assert not single_flight._futures
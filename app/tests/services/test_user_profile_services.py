@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import pytz
+
+from app.schemas.place import Place, PlaceType
+from app.services.address_similarity_services import AddressSimilarityIndex
+from app.services.user_profile_services import UserProfile
+
+
+def create_user(search_histories=(), interested_places=(), preferred_types=()):
+    user = MagicMock()
+    user.interested_places = list(interested_places)
+    user.preferred_types = list(preferred_types)
+    user.search_history_relations = [
+        MagicMock(
+            address=address,
+            hit_count=hit_count,
+            last_searched_at=datetime.now(pytz.utc) - timedelta(days=days),
+        )
+        for address, hit_count, days in search_histories
+    ]
+    return user
+
+
+def create_place(place_id="1", address="판교역", place_types=()):
+    return Place(
+        place_id=place_id,
+        address=address,
+        place_types=[PlaceType(type_name=type_name) for type_name in place_types],
+    )
+
+
+def recentness_weight(searched_date: datetime) -> float:
+    return 1.5 if (datetime.now(pytz.utc) - searched_date).days <= 7 else 1.0
+
+
+def test_user_profile_interest_and_preferred_types():
+    user = create_user(
+        interested_places=[MagicMock(place_id="1")],
+        preferred_types=[PlaceType(type_name="cafe"), "restaurant"],
+    )
+    profile = UserProfile(user, recentness_weight)
+
+    assert profile.is_interested(create_place(place_id="1"))
+    assert not profile.is_interested(create_place(place_id="2"))
+    assert profile.count_preferred_types(create_place(place_types=["cafe", "bar"])) == 1
+
+
+def test_user_profile_weights_search_history_by_hit_count():
+    user = create_user(search_histories=[("판교역", 2, 1), ("서현역", 1, 10)])
+    profile = UserProfile(user, recentness_weight)
+
+    assert profile.search_history_weights == {"판교역": 3.0, "서현역": 1.0}
+    similarities = AddressSimilarityIndex({"판교역": 1.0, "서현역": 1.0}).similarities(
+        "판교역 카페"
+    )
+    assert profile.search_history_scores(["판교역 카페", "강남"]) == [
+        pytest.approx(similarities[0] * 3.0 + similarities[1] * 1.0),
+        0.0,
+    ]
+
+
+def test_user_profile_keeps_recent_search_history():
+    user = create_user(search_histories=[("강남역", 1, 3), ("판교역", 1, 1), ("서현역", 1, 2)])
+    profile = UserProfile(user, recentness_weight, history_size=2)
+
+    assert profile.search_history_weights == {"판교역": 1.5, "서현역": 1.5}
@@ -124,6 +124,21 @@ def create_random_place(
     return crud_place.create(db, obj_in=place_in)
 
 
+def distance_infos_to(candidates: List[Place], origin: str) -> List[DistanceInfo]:
+    return [
+        DistanceInfo(
+            origin=origin,
+            destination_id=candidate.place_id,
+            destination=candidate.address,
+            distance_text=f"{idx + 1} km",
+            distance_value=(idx + 1) * 1000,
+            duration_text=f"{idx + 1}분",
+            duration_value=(idx + 1) * 60,
+        )
+        for idx, candidate in enumerate(candidates)
+    ]
+
+
 distance_info_list = [
     DistanceInfo(
         origin="대한민국 경기도 성남시 분당구 성남대로 지하 601 서현",
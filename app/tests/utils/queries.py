@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from typing import Generator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Generator[List[str], None, None]:
+    """
+    블록 안에서 engine으로 실행한 SQL 문을 모아 돌려줍니다.
+    """
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, budget: int) -> Generator[None, None, None]:
+    """
+    블록 안에서 실행한 SQL 문이 budget개를 넘으면 실행한 문을 보여주며 실패합니다.
+    """
+    with count_queries(engine) as statements:
+        yield
+    assert len(statements) <= budget, (
+        f"Expected at most {budget} queries, but {len(statements)} were executed:\n"
+        + "\n".join(statements)
+    )
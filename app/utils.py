@@ -1,10 +1,11 @@
 import logging
 import smtplib
+import unicodedata
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import geohash2
 from fastapi import Depends
@@ -136,3 +137,34 @@ def geohash_encode(latitude: float, longitude: float, precision=5) -> str:
 
 def geohash_decode(geohash: str):
     return geohash2.decode(geohash)
+
+
+def geohash_neighbors(geohash: str) -> List[str]:
+    """
+    같은 정밀도의 인접한 8개 셀을 반환합니다. 극지방에서 위도를 벗어나는 셀은 제외합니다.
+    """
+    latitude, longitude, latitude_error, longitude_error = geohash2.decode_exactly(
+        geohash
+    )
+    neighbors = []
+    for latitude_step in (-1, 0, 1):
+        for longitude_step in (-1, 0, 1):
+            if latitude_step == longitude_step == 0:
+                continue
+            neighbor_latitude = latitude + latitude_step * latitude_error * 2
+            if not -90 <= neighbor_latitude <= 90:
+                continue
+            neighbor_longitude = (
+                longitude + longitude_step * longitude_error * 2 + 180
+            ) % 360 - 180
+            neighbors.append(
+                geohash_encode(neighbor_latitude, neighbor_longitude, len(geohash))
+            )
+    return list(dict.fromkeys(neighbors))
+
+
+def normalize_address(address: str) -> str:
+    """
+    캐시 키로 쓰기 위해 유니코드 정규화 후 앞뒤 공백을 없애고 연속된 공백을 하나로 합칩니다.
+    """
+    return " ".join(unicodedata.normalize("NFKC", address).split()).lower()
@@ -1,13 +1,45 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.routers import api_router
 from app.core.config import get_app_settings
+from app.db.session import SessionLocal
+from app.services.cache_refresh_services import cache_refresher
+from app.services.geocode_hit_services import geocode_hit_recorder
+from app.services.geocode_warmup_services import warm_up_geocode_cache
+from app.services.geolocation_sweeper_services import geolocation_sweeper
+from app.services.local_cache_services import local_cache_registry
+from app.services.map_client_services import map_client_registry
+from app.services.redis_services import RedisClientFactory, RedisServicesFactory
+from app.services.search_history_compaction_services import search_history_compactor
 
 settings = get_app_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    map_client_registry.startup()
+    geolocation_sweeper.startup()
+    search_history_compactor.startup()
+    geocode_hit_recorder.startup()
+    local_cache_registry.startup(RedisClientFactory.create_redis_client())
+    with SessionLocal() as db:
+        warm_up_geocode_cache(db, RedisServicesFactory.create_redis_services())
+    yield
+    cache_refresher.shutdown()
+    local_cache_registry.shutdown()
+    geocode_hit_recorder.shutdown()
+    search_history_compactor.shutdown()
+    geolocation_sweeper.shutdown()
+    map_client_registry.shutdown()
+
+
 app = FastAPI(
-    title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    title=settings.PROJECT_NAME,
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set all CORS enabled origins